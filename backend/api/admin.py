@@ -8,6 +8,15 @@ from api.models.institution_models import (
 from api.models.application_models import Application
 from api.models.document_models import Document
 from api.models.event_models import Event
+from api.models.dataset_models import DatasetVersion
+from api.models.popularity_models import InstitutionPopularity
+from api.models.analytics_models import DirectorySearch, PopularDirectoryQuery
+from api.models.watchlist_models import InstitutionWatch, InstitutionSnapshot, InstitutionChange
+from api.models.program_models import Program
+from api.models.link_models import LinkCheck
+from api.models.status_history_models import ApplicationStatusChange, ApplicationStageStats
+from api.models.sync_models import SyncTombstone
+from api.models.outcome_models import ApplicationOutcomeStats, ApplicationOutcomeValue
 
 # Register user models
 admin.site.register(Userinfo)
@@ -34,4 +43,36 @@ admin.site.register(Application)
 admin.site.register(Document)
 
 # Register event model
-admin.site.register(Event)
\ No newline at end of file
+admin.site.register(Event)
+
+# Register dataset version
+admin.site.register(DatasetVersion)
+
+# Register popularity counters
+admin.site.register(InstitutionPopularity)
+
+# Register directory search analytics
+admin.site.register(DirectorySearch)
+admin.site.register(PopularDirectoryQuery)
+
+# Register watchlist models
+admin.site.register(InstitutionWatch)
+admin.site.register(InstitutionSnapshot)
+admin.site.register(InstitutionChange)
+
+# Register program catalogue
+admin.site.register(Program)
+
+# Register link health checks
+admin.site.register(LinkCheck)
+
+# Register application status history
+admin.site.register(ApplicationStatusChange)
+admin.site.register(ApplicationStageStats)
+
+# Register sync tombstones
+admin.site.register(SyncTombstone)
+
+# Register application outcome rollups
+admin.site.register(ApplicationOutcomeStats)
+admin.site.register(ApplicationOutcomeValue)
@@ -0,0 +1,30 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.utils.integrity import check_institution_data
+
+
+class Command(BaseCommand):
+    help = "Check the institution dataset for missing rows, orphans and unparseable ranks or scores"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=None,
+                            help="Write the JSON report to this file instead of stdout")
+        parser.add_argument('--fail-on-issues', action='store_true',
+                            help="Exit with an error if any issue is found")
+
+    def handle(self, *args, **options):
+        report = check_institution_data()
+        output = json.dumps(report, indent=2)
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output)
+            self.stderr.write(f"Report written to {options['output']}")
+        else:
+            self.stdout.write(output)
+
+        total = sum(report['summary'].values())
+        if total and options['fail_on_issues']:
+            raise CommandError(f"Found {total} institution data issues: {report['summary']}")
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from api.utils.link_checker import run_link_check
+
+
+class Command(BaseCommand):
+    help = "Check institution and application URLs and record which ones are dead"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-age', type=int, default=24,
+                            help="Re-check URLs whose last result is older than this many hours (default: 24)")
+        parser.add_argument('--limit', type=int, default=None,
+                            help="Check at most this many URLs")
+        parser.add_argument('--concurrency', type=int, default=50,
+                            help="Requests in flight at once (default: 50)")
+        parser.add_argument('--per-host', type=int, default=2,
+                            help="Requests in flight per host (default: 2)")
+        parser.add_argument('--min-interval', type=float, default=0.5,
+                            help="Seconds between requests to the same host (default: 0.5)")
+        parser.add_argument('--timeout', type=float, default=10,
+                            help="Per-request timeout in seconds (default: 10)")
+
+    def handle(self, *args, **options):
+        checked, dead = run_link_check(
+            max_age_hours=options['max_age'],
+            limit=options['limit'],
+            concurrency=options['concurrency'],
+            per_host=options['per_host'],
+            min_interval=options['min_interval'],
+            timeout=options['timeout'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Checked {checked} links, {dead} failing"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from api.utils.change_detection import detect_institution_changes
+from api.utils.dataset_version import get_dataset_version
+
+
+class Command(BaseCommand):
+    help = "Compare institutions with their last snapshot and record changes for watchers"
+
+    def handle(self, *args, **options):
+        changed, records = detect_institution_changes(get_dataset_version())
+        self.stdout.write(self.style.SUCCESS(
+            f"{changed} institutions new or changed, {records} watcher change records written"
+        ))
@@ -0,0 +1,43 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models.user_models import Userinfo
+from api.utils.application_import import IMPORT_CHUNK_SIZE, ApplicationImportError, import_applications
+
+
+class Command(BaseCommand):
+    help = "Import applications for a user from a CSV or XLSX file"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="The .csv or .xlsx file to import")
+        parser.add_argument('--user', required=True, help="Email of the user the applications belong to")
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Validate the file and report errors without creating anything")
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE,
+                            help=f"Rows validated and inserted at a time (default: {IMPORT_CHUNK_SIZE})")
+
+    def handle(self, *args, **options):
+        try:
+            user = Userinfo.objects.get(email=options['user'].lower())
+        except Userinfo.DoesNotExist:
+            raise CommandError(f"No user with email {options['user']}")
+
+        try:
+            with open(options['path'], 'rb') as file:
+                report = import_applications(file, os.path.basename(options['path']), user,
+                                             dry_run=options['dry_run'], chunk_size=max(options['chunk_size'], 1))
+        except (OSError, ApplicationImportError) as exc:
+            raise CommandError(str(exc))
+
+        for match in report['fuzzy_matches']:
+            self.stdout.write(f"Matched '{match['value']}' to {match['institution']['name']} "
+                              f"({match['institution']['id']}, similarity {match['similarity']})")
+        for error in report['errors']:
+            self.stdout.write(self.style.WARNING(f"Row {error['row']}: {error['errors']}"))
+        if report['stopped']:
+            self.stdout.write(self.style.WARNING(report['stopped']))
+        verb = "Would create" if report['dry_run'] else "Created"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {report['created']} applications from {report['rows']} rows, {report['failed']} rows failed"
+        ))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from api.utils.dataset_version import bump_dataset_version
+
+
+class Command(BaseCommand):
+    help = "Bump the institution dataset version after new ranking data has been loaded"
+
+    def handle(self, *args, **options):
+        version = bump_dataset_version()
+        self.stdout.write(self.style.SUCCESS(f"Institution dataset is now at version {version}"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from api.utils.country_stats import refresh_country_stats
+
+
+class Command(BaseCommand):
+    help = "Refresh the per-country institution statistics rollup"
+
+    def handle(self, *args, **options):
+        refresh_country_stats()
+        self.stdout.write(self.style.SUCCESS("Country statistics refreshed"))
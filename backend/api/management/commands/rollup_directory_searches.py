@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from api.utils.search_analytics import rollup_searches
+
+
+class Command(BaseCommand):
+    help = "Fold captured directory searches into per-query hit counts"
+
+    def handle(self, *args, **options):
+        updated = rollup_searches()
+        self.stdout.write(self.style.SUCCESS(f"Updated hit counts for {updated} directory queries"))
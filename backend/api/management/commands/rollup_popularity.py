@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from api.utils.popularity import rollup_popularity
+
+
+class Command(BaseCommand):
+    help = "Roll hourly institution popularity counters up into daily buckets and prune expired ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hourly-retention', type=int, default=48,
+                            help="Hours of hourly buckets to keep before rolling them up (default: 48)")
+        parser.add_argument('--retention-days', type=int, default=90,
+                            help="Days of counters to keep at all (default: 90)")
+
+    def handle(self, *args, **options):
+        rolled_up, pruned = rollup_popularity(options['hourly_retention'], options['retention_days'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Rolled up into {rolled_up} daily buckets, pruned {pruned} expired buckets"
+        ))
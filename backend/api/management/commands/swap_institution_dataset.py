@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.utils.dataset_swap import (
+    DatasetSwapError, prepare_shadow_tables, rollback_dataset, swap_in_shadow_tables
+)
+
+
+class Command(BaseCommand):
+    help = "Load the institution dataset into shadow tables and swap them in atomically"
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['prepare', 'swap', 'rollback'],
+                            help="prepare: create (and optionally load) the <table>_next shadow tables; "
+                                 "swap: index them and swap them in; "
+                                 "rollback: swap the previous dataset back in")
+        parser.add_argument('--csv-dir',
+                            help="With prepare, load <table>.csv files from this directory")
+        parser.add_argument('--copy-live', action='store_true',
+                            help="With prepare, seed the shadow tables from the live dataset")
+
+    def handle(self, *args, **options):
+        try:
+            if options['action'] == 'prepare':
+                loaded = prepare_shadow_tables(options['csv_dir'], options['copy_live'])
+                for table, rows in loaded.items():
+                    self.stdout.write(f"{table}: {rows} rows")
+                self.stdout.write(self.style.SUCCESS("Shadow tables ready"))
+            elif options['action'] == 'swap':
+                version = swap_in_shadow_tables()
+                self.stdout.write(self.style.SUCCESS(f"Swapped in the new dataset (version {version})"))
+            else:
+                version = rollback_dataset()
+                self.stdout.write(self.style.SUCCESS(f"Rolled back to the previous dataset (version {version})"))
+        except DatasetSwapError as exc:
+            raise CommandError(str(exc))
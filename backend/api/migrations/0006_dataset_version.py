@@ -0,0 +1,30 @@
+# Generated by Django 5.2 on 2026-10-19 09:05
+
+from django.db import migrations, models
+
+
+def create_initial_version(apps, schema_editor):
+    DatasetVersion = apps.get_model('api', 'DatasetVersion')
+    DatasetVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'dataset_version',
+            },
+        ),
+        migrations.RunPython(create_initial_version, migrations.RunPython.noop),
+    ]
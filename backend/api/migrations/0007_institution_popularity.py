@@ -0,0 +1,30 @@
+# Generated by Django 5.2 on 2026-10-19 09:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_dataset_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstitutionPopularity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateTimeField()),
+                ('shard', models.PositiveSmallIntegerField(default=0)),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('applications', models.PositiveIntegerField(default=0)),
+                ('institution', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='popularity', to='api.institution')),
+            ],
+            options={
+                'db_table': 'institution_popularity',
+                'indexes': [models.Index(fields=['bucket', 'institution'], name='inst_popularity_bucket_idx')],
+                'constraints': [models.UniqueConstraint(fields=('institution', 'bucket', 'shard'), name='institution_popularity_unique_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,139 @@
+# Generated by Django 5.2 on 2026-10-19 09:06
+
+from django.db import migrations, models
+
+METRIC_TABLES = [
+    'academic_reputation', 'employer_reputation', 'faculty_student',
+    'citations_per_faculty', 'international_faculty', 'international_students',
+    'international_research_network', 'employment_outcomes', 'sustainability',
+]
+
+CREATE_PARSE_FUNCTIONS = r"""
+CREATE OR REPLACE FUNCTION institution_rank_number(rank text) RETURNS integer
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN trim(rank) ~ '^[0-9]+(\+|-[0-9]+)?$' THEN substring(trim(rank) from '^[0-9]+')::integer
+    END
+$$;
+
+CREATE OR REPLACE FUNCTION institution_score_number(score text) RETURNS double precision
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN trim(score) ~ '^[0-9]+(\.[0-9]+)?$' THEN trim(score)::double precision
+    END
+$$;
+"""
+
+DROP_PARSE_FUNCTIONS = """
+DROP FUNCTION IF EXISTS institution_rank_number(text);
+DROP FUNCTION IF EXISTS institution_score_number(text);
+"""
+
+BREAKDOWN_SQL = """
+    {column}_counts AS (
+        SELECT country, jsonb_object_agg({column}, n) AS counts
+        FROM (
+            SELECT country, COALESCE({column}, 'Unknown') AS {column}, count(*) AS n
+            FROM inst GROUP BY 1, 2
+        ) t
+        GROUP BY country
+    )"""
+
+CREATE_VIEW = """
+CREATE MATERIALIZED VIEW country_stats AS
+WITH inst AS (
+    SELECT
+        i.id,
+        i.country,
+        institution_rank_number(i.rank) AS numeric_rank,
+        institution_score_number(i.overall_score) AS overall_score,
+        c.research,
+        c.size,
+        c.focus,
+        {metric_columns}
+    FROM institutions i
+    LEFT JOIN classification c ON c.institution_id = i.id
+    {metric_joins}
+),
+{breakdowns}
+SELECT
+    inst.country,
+    count(*)::integer AS institution_count,
+    (count(*) FILTER (WHERE numeric_rank <= 100))::integer AS rank_top_100,
+    (count(*) FILTER (WHERE numeric_rank BETWEEN 101 AND 200))::integer AS rank_101_200,
+    (count(*) FILTER (WHERE numeric_rank BETWEEN 201 AND 500))::integer AS rank_201_500,
+    (count(*) FILTER (WHERE numeric_rank BETWEEN 501 AND 1000))::integer AS rank_501_1000,
+    (count(*) FILTER (WHERE numeric_rank > 1000))::integer AS rank_1001_plus,
+    (count(*) FILTER (WHERE numeric_rank IS NULL))::integer AS unranked,
+    min(numeric_rank) AS best_rank,
+    round(avg(overall_score)::numeric, 2)::double precision AS avg_overall_score,
+    {metric_averages},
+    COALESCE(research_counts.counts, '{{}}'::jsonb) AS research,
+    COALESCE(size_counts.counts, '{{}}'::jsonb) AS size,
+    COALESCE(focus_counts.counts, '{{}}'::jsonb) AS focus
+FROM inst
+LEFT JOIN research_counts ON research_counts.country = inst.country
+LEFT JOIN size_counts ON size_counts.country = inst.country
+LEFT JOIN focus_counts ON focus_counts.country = inst.country
+GROUP BY inst.country, research_counts.counts, size_counts.counts, focus_counts.counts;
+
+CREATE UNIQUE INDEX country_stats_country_idx ON country_stats (country);
+""".format(
+    metric_columns=',\n        '.join(
+        f"institution_score_number({t}.score) AS {t}" for t in METRIC_TABLES
+    ),
+    metric_joins='\n    '.join(
+        f"LEFT JOIN {t} ON {t}.institution_id = i.id" for t in METRIC_TABLES
+    ),
+    breakdowns=','.join(
+        BREAKDOWN_SQL.format(column=column) for column in ('research', 'size', 'focus')
+    ),
+    metric_averages=',\n    '.join(
+        f"round(avg({t})::numeric, 2)::double precision AS avg_{t}" for t in METRIC_TABLES
+    ),
+)
+
+DROP_VIEW = "DROP MATERIALIZED VIEW IF EXISTS country_stats;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_institution_popularity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CountryStats',
+            fields=[
+                ('country', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('institution_count', models.IntegerField()),
+                ('rank_top_100', models.IntegerField()),
+                ('rank_101_200', models.IntegerField()),
+                ('rank_201_500', models.IntegerField()),
+                ('rank_501_1000', models.IntegerField()),
+                ('rank_1001_plus', models.IntegerField()),
+                ('unranked', models.IntegerField()),
+                ('best_rank', models.IntegerField(null=True)),
+                ('avg_overall_score', models.FloatField(null=True)),
+                ('avg_academic_reputation', models.FloatField(null=True)),
+                ('avg_employer_reputation', models.FloatField(null=True)),
+                ('avg_faculty_student', models.FloatField(null=True)),
+                ('avg_citations_per_faculty', models.FloatField(null=True)),
+                ('avg_international_faculty', models.FloatField(null=True)),
+                ('avg_international_students', models.FloatField(null=True)),
+                ('avg_international_research_network', models.FloatField(null=True)),
+                ('avg_employment_outcomes', models.FloatField(null=True)),
+                ('avg_sustainability', models.FloatField(null=True)),
+                ('research', models.JSONField(default=dict)),
+                ('size', models.JSONField(default=dict)),
+                ('focus', models.JSONField(default=dict)),
+            ],
+            options={
+                'db_table': 'country_stats',
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(CREATE_PARSE_FUNCTIONS, DROP_PARSE_FUNCTIONS),
+        migrations.RunSQL(CREATE_VIEW, DROP_VIEW),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-19 09:08
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_country_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirectorySearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query_key', models.CharField(max_length=40)),
+                ('params', models.JSONField(default=dict)),
+                ('searched_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'directory_searches',
+                'indexes': [models.Index(fields=['searched_at'], name='directory_search_time_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PopularDirectoryQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query_key', models.CharField(max_length=40, unique=True)),
+                ('params', models.JSONField(default=dict)),
+                ('hits', models.PositiveBigIntegerField(default=0)),
+                ('last_searched_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'popular_directory_queries',
+                'ordering': ['-hits'],
+                'indexes': [models.Index(fields=['-hits'], name='popular_query_hits_idx')],
+            },
+        ),
+    ]
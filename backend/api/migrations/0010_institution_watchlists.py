@@ -0,0 +1,63 @@
+# Generated by Django 5.2 on 2026-10-19 09:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_directory_search_analytics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstitutionSnapshot',
+            fields=[
+                ('institution_id', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('content_hash', models.CharField(max_length=32)),
+                ('data', models.JSONField()),
+                ('dataset_version', models.PositiveIntegerField()),
+            ],
+            options={
+                'db_table': 'institution_snapshots',
+            },
+        ),
+        migrations.CreateModel(
+            name='InstitutionChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dataset_version', models.PositiveIntegerField()),
+                ('previous_rank', models.CharField(blank=True, max_length=50, null=True)),
+                ('current_rank', models.CharField(blank=True, max_length=50, null=True)),
+                ('previous_score', models.CharField(blank=True, max_length=50, null=True)),
+                ('current_score', models.CharField(blank=True, max_length=50, null=True)),
+                ('changed_fields', models.JSONField(default=list)),
+                ('detected_at', models.DateTimeField(auto_now_add=True)),
+                ('seen', models.BooleanField(default=False)),
+                ('institution', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='api.institution')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='institution_changes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'institution_changes',
+                'ordering': ['-detected_at'],
+                'indexes': [models.Index(fields=['user', 'seen', '-detected_at'], name='institution_change_user_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='InstitutionWatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('institution', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='watches', to='api.institution')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='institution_watches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'institution_watches',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['institution', 'user'], name='institution_watch_inst_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'institution'), name='institution_watch_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2 on 2026-10-19 09:10
+
+import re
+from collections import Counter
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+def normalize_program_name(name):
+    return ' '.join(re.findall(r'\w+', (name or '').lower()))
+
+
+def build_catalogue(apps, schema_editor):
+    Application = apps.get_model('api', 'Application')
+    Program = apps.get_model('api', 'Program')
+
+    counts = Counter()
+    names = {}
+    departments = {}
+    rows = Application.objects.values_list('institution_id', 'program_name', 'department')
+    for institution_id, program_name, department in rows.iterator():
+        key = (institution_id, normalize_program_name(program_name))
+        if not key[1]:
+            continue
+        counts[key] += 1
+        names.setdefault(key, program_name.strip())
+        if department:
+            departments[key] = department
+
+    Program.objects.bulk_create([
+        Program(
+            institution_id=institution_id,
+            name=names[(institution_id, normalized_name)],
+            normalized_name=normalized_name,
+            department=departments.get((institution_id, normalized_name)),
+            usage_count=count,
+        )
+        for (institution_id, normalized_name), count in counts.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_institution_watchlists'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='Program',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150)),
+                ('normalized_name', models.CharField(max_length=150)),
+                ('department', models.CharField(blank=True, max_length=100, null=True)),
+                ('usage_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('institution', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='programs', to='api.institution')),
+            ],
+            options={
+                'db_table': 'programs',
+                'ordering': ['-usage_count', 'name'],
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['normalized_name'], name='program_name_trgm_idx', opclasses=['gin_trgm_ops'])],
+                'constraints': [models.UniqueConstraint(fields=('institution', 'normalized_name'), name='program_unique_name')],
+            },
+        ),
+        migrations.RunPython(build_catalogue, migrations.RunPython.noop),
+    ]
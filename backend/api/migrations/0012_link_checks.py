@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_program_catalogue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LinkCheck',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.TextField(unique=True)),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('ok', models.BooleanField(default=True)),
+                ('error', models.CharField(blank=True, max_length=255, null=True)),
+                ('etag', models.CharField(blank=True, max_length=255, null=True)),
+                ('last_modified', models.CharField(blank=True, max_length=64, null=True)),
+                ('consecutive_failures', models.PositiveIntegerField(default=0)),
+                ('checked_at', models.DateTimeField()),
+                ('last_ok_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'link_checks',
+                'indexes': [models.Index(fields=['checked_at'], name='link_check_checked_idx')],
+            },
+        ),
+    ]
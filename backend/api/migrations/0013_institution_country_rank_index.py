@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 09:15
+
+import api.models.institution_models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_link_checks'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='institution',
+            index=models.Index(models.F('country'), api.models.institution_models.RankNumber('rank'), name='institution_country_rank_idx'),
+        ),
+    ]
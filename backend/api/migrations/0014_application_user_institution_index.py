@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-19 09:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_institution_country_rank_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'institution'], name='application_user_inst_idx'),
+        ),
+    ]
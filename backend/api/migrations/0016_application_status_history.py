@@ -0,0 +1,54 @@
+# Generated by Django 5.2 on 2026-10-19 09:24
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+# Existing applications start their history in their current status, as of
+# their last update, so time in stage is measured from there
+BACKFILL_HISTORY = """
+INSERT INTO application_status_changes (user_id, application_id, from_status, to_status, changed_at)
+SELECT user_id, id, NULL, status, updated_at FROM applications;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_application_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStageStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('Draft', 'Draft'), ('In Progress', 'In Progress'), ('Pending', 'Pending'), ('Accepted', 'Accepted'), ('Rejected', 'Rejected'), ('Deferred', 'Deferred'), ('Withdrawn', 'Withdrawn')], max_length=20)),
+                ('total_seconds', models.FloatField(default=0)),
+                ('stays', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'application_stage_stats',
+                'constraints': [models.UniqueConstraint(fields=('user', 'status'), name='stage_stats_unique_status')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicationStatusChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, choices=[('Draft', 'Draft'), ('In Progress', 'In Progress'), ('Pending', 'Pending'), ('Accepted', 'Accepted'), ('Rejected', 'Rejected'), ('Deferred', 'Deferred'), ('Withdrawn', 'Withdrawn')], max_length=20, null=True)),
+                ('to_status', models.CharField(choices=[('Draft', 'Draft'), ('In Progress', 'In Progress'), ('Pending', 'Pending'), ('Accepted', 'Accepted'), ('Rejected', 'Rejected'), ('Deferred', 'Deferred'), ('Withdrawn', 'Withdrawn')], max_length=20)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_changes', to='api.application')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_changes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'application_status_changes',
+                'ordering': ['changed_at', 'id'],
+                'indexes': [models.Index(fields=['user', 'application', 'changed_at'], name='status_change_user_app_idx')],
+            },
+        ),
+        migrations.RunSQL(BACKFILL_HISTORY, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 5.2 on 2026-10-19 09:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+SYNCED_TABLES = {
+    'applications': 'applications',
+    'api_event': 'events',
+    'documents': 'documents',
+}
+
+# Rows are stamped with the id of the transaction that wrote them. Transaction
+# ids only grow, and every transaction below a snapshot's xmin has finished,
+# which lets the feed hand out tokens that never skip a late commit.
+CREATE_TRIGGERS = """
+CREATE OR REPLACE FUNCTION sync_stamp_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.change_seq := pg_current_xact_id()::text::bigint;
+    RETURN NEW;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION sync_record_deletion() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO sync_tombstones (user_id, kind, object_id, change_seq, deleted_at)
+    VALUES (OLD.user_id, TG_ARGV[0], OLD.id, pg_current_xact_id()::text::bigint, now());
+    RETURN OLD;
+END
+$$;
+""" + "".join(f"""
+CREATE TRIGGER {table}_sync_stamp BEFORE INSERT OR UPDATE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION sync_stamp_change();
+CREATE TRIGGER {table}_sync_tombstone AFTER DELETE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION sync_record_deletion('{kind}');
+UPDATE {table} SET change_seq = pg_current_xact_id()::text::bigint;
+""" for table, kind in SYNCED_TABLES.items())
+
+DROP_TRIGGERS = "".join(f"""
+DROP TRIGGER IF EXISTS {table}_sync_stamp ON {table};
+DROP TRIGGER IF EXISTS {table}_sync_tombstone ON {table};
+""" for table in SYNCED_TABLES) + """
+DROP FUNCTION IF EXISTS sync_stamp_change();
+DROP FUNCTION IF EXISTS sync_record_deletion();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_application_status_history'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('applications', 'Application'), ('events', 'Event'), ('documents', 'Document')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('change_seq', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'sync_tombstones',
+            },
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='change_seq',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='change_seq',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='change_seq',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'change_seq'], name='application_user_seq_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['user', 'change_seq'], name='document_user_seq_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['user', 'change_seq'], name='event_user_seq_idx'),
+        ),
+        migrations.AddField(
+            model_name='synctombstone',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='synctombstone',
+            index=models.Index(fields=['user', 'change_seq'], name='sync_tombstone_user_seq_idx'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
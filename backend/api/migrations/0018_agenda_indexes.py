@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-19 09:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_sync_change_feed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'start_date', 'id'], name='application_user_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'submitted_date', 'id'], name='application_user_submit_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'decision_date', 'id'], name='application_user_decision_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['user', 'event_date', 'id'], name='event_user_date_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 09:30
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_agenda_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='institution',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='institution_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2 on 2026-10-19 09:36
+
+import re
+from collections import Counter
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def normalize_program_name(name):
+    return ' '.join(re.findall(r'\w+', (name or '').lower()))
+
+
+def build_outcome_rollups(apps, schema_editor):
+    Application = apps.get_model('api', 'Application')
+    ApplicationOutcomeStats = apps.get_model('api', 'ApplicationOutcomeStats')
+    ApplicationOutcomeValue = apps.get_model('api', 'ApplicationOutcomeValue')
+
+    counters = {}
+    values = Counter()
+    rows = Application.objects.values_list(
+        'institution_id', 'program_name', 'degree_type', 'status',
+        'tuition_fee', 'submitted_date', 'decision_date'
+    )
+    for institution_id, program_name, degree_type, status, tuition_fee, submitted, decided in rows.iterator():
+        group = (institution_id, normalize_program_name(program_name)[:150], degree_type)
+        totals = counters.setdefault(group, [0, 0, 0])
+        totals[0] += 1
+        totals[1] += status == 'Accepted'
+        totals[2] += status == 'Rejected'
+        if tuition_fee is not None:
+            values[(*group, 'tuition', tuition_fee)] += 1
+        if status in ('Accepted', 'Rejected') and submitted and decided and decided >= submitted:
+            values[(*group, 'decision_days', Decimal((decided - submitted).days))] += 1
+
+    ApplicationOutcomeStats.objects.bulk_create([
+        ApplicationOutcomeStats(
+            institution_id=institution_id, normalized_program=program, degree_type=degree_type,
+            applications=applications, accepted=accepted, rejected=rejected,
+        )
+        for (institution_id, program, degree_type), (applications, accepted, rejected) in counters.items()
+    ], batch_size=1000)
+    ApplicationOutcomeValue.objects.bulk_create([
+        ApplicationOutcomeValue(
+            institution_id=institution_id, normalized_program=program, degree_type=degree_type,
+            kind=kind, value=value, count=count,
+        )
+        for (institution_id, program, degree_type, kind, value), count in values.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_institution_name_trgm_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationOutcomeStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('normalized_program', models.CharField(max_length=150)),
+                ('degree_type', models.CharField(max_length=50)),
+                ('applications', models.IntegerField(default=0)),
+                ('accepted', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+                ('institution', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outcome_stats', to='api.institution')),
+            ],
+            options={
+                'db_table': 'application_outcome_stats',
+                'constraints': [models.UniqueConstraint(fields=('institution', 'normalized_program', 'degree_type'), name='outcome_stats_unique_group')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicationOutcomeValue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('normalized_program', models.CharField(max_length=150)),
+                ('degree_type', models.CharField(max_length=50)),
+                ('kind', models.CharField(choices=[('tuition', 'Tuition fee'), ('decision_days', 'Days from submission to decision')], max_length=20)),
+                ('value', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('count', models.IntegerField(default=0)),
+                ('institution', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outcome_values', to='api.institution')),
+            ],
+            options={
+                'db_table': 'application_outcome_values',
+                'constraints': [models.UniqueConstraint(fields=('institution', 'normalized_program', 'degree_type', 'kind', 'value'), name='outcome_value_unique')],
+            },
+        ),
+        migrations.RunPython(build_outcome_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,109 @@
+# Generated by Django 5.2 on 2026-10-19 09:38
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import BtreeGinExtension
+from django.db import migrations
+
+# Weighted document of each row: names and titles rank above departments,
+# which rank above notes. The vectors are recomputed only when one of their
+# source columns changes (or something else wrote the column), so status
+# changes and other edits don't re-parse long notes.
+CREATE_TRIGGERS = """
+CREATE OR REPLACE FUNCTION application_search_vector(program_name text, department text, notes text, institution_name text)
+RETURNS tsvector LANGUAGE sql IMMUTABLE AS $$
+    SELECT setweight(to_tsvector('english', coalesce(program_name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(institution_name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(department, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(notes, '')), 'C')
+$$;
+
+CREATE OR REPLACE FUNCTION event_search_vector(title text, notes text)
+RETURNS tsvector LANGUAGE sql IMMUTABLE AS $$
+    SELECT setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(notes, '')), 'C')
+$$;
+
+CREATE OR REPLACE FUNCTION applications_search_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT'
+        OR NEW.search_vector IS DISTINCT FROM OLD.search_vector
+        OR (NEW.program_name, NEW.department, NEW.notes, NEW.institution_id)
+            IS DISTINCT FROM (OLD.program_name, OLD.department, OLD.notes, OLD.institution_id)
+    THEN
+        NEW.search_vector := application_search_vector(
+            NEW.program_name, NEW.department, NEW.notes,
+            (SELECT name FROM institutions WHERE id = NEW.institution_id)
+        );
+    END IF;
+    RETURN NEW;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION events_search_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT'
+        OR NEW.search_vector IS DISTINCT FROM OLD.search_vector
+        OR (NEW.event_title, NEW.notes) IS DISTINCT FROM (OLD.event_title, OLD.notes)
+    THEN
+        NEW.search_vector := event_search_vector(NEW.event_title, NEW.notes);
+    END IF;
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER applications_search_update BEFORE INSERT OR UPDATE ON applications
+    FOR EACH ROW EXECUTE FUNCTION applications_search_update();
+CREATE TRIGGER api_event_search_update BEFORE INSERT OR UPDATE ON api_event
+    FOR EACH ROW EXECUTE FUNCTION events_search_update();
+
+-- Fill existing rows without restamping them for the sync feed
+ALTER TABLE applications DISABLE TRIGGER applications_sync_stamp;
+UPDATE applications a SET search_vector = application_search_vector(a.program_name, a.department, a.notes, i.name)
+    FROM institutions i WHERE i.id = a.institution_id;
+ALTER TABLE applications ENABLE TRIGGER applications_sync_stamp;
+ALTER TABLE api_event DISABLE TRIGGER api_event_sync_stamp;
+UPDATE api_event SET search_vector = event_search_vector(event_title, notes);
+ALTER TABLE api_event ENABLE TRIGGER api_event_sync_stamp;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS applications_search_update ON applications;
+DROP TRIGGER IF EXISTS api_event_search_update ON api_event;
+DROP FUNCTION IF EXISTS applications_search_update();
+DROP FUNCTION IF EXISTS events_search_update();
+DROP FUNCTION IF EXISTS application_search_vector(text, text, text, text);
+DROP FUNCTION IF EXISTS event_search_vector(text, text);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_application_outcomes'),
+    ]
+
+    operations = [
+        BtreeGinExtension(),
+        migrations.AddField(
+            model_name='application',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['user', 'search_vector'], name='application_user_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['user', 'search_vector'], name='event_user_search_idx'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
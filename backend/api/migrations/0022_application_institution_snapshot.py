@@ -0,0 +1,104 @@
+# Generated by Django 5.2 on 2026-10-19 09:40
+
+from django.db import migrations, models
+
+# The institution columns are filled from institutions whenever a row is
+# written with a different institution (or with columns that don't match
+# what is stored, as a fresh model instance does). Dataset imports refresh
+# them with one set-based update; see api.utils.institution_snapshot.
+CREATE_TRIGGERS = """
+CREATE OR REPLACE FUNCTION applications_institution_snapshot() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT'
+        OR NEW.institution_id IS DISTINCT FROM OLD.institution_id
+        OR (NEW.institution_name, NEW.institution_country, NEW.institution_rank)
+            IS DISTINCT FROM (OLD.institution_name, OLD.institution_country, OLD.institution_rank)
+    THEN
+        SELECT i.name, i.country, institution_rank_number(i.rank)
+        INTO NEW.institution_name, NEW.institution_country, NEW.institution_rank
+        FROM institutions i WHERE i.id = NEW.institution_id;
+        NEW.institution_name := coalesce(NEW.institution_name, '');
+        NEW.institution_country := coalesce(NEW.institution_country, '');
+    END IF;
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER applications_institution_snapshot BEFORE INSERT OR UPDATE ON applications
+    FOR EACH ROW EXECUTE FUNCTION applications_institution_snapshot();
+
+-- The search vector now reads the copied name (this trigger fires after the one above)
+CREATE OR REPLACE FUNCTION applications_search_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT'
+        OR NEW.search_vector IS DISTINCT FROM OLD.search_vector
+        OR (NEW.program_name, NEW.department, NEW.notes, NEW.institution_name)
+            IS DISTINCT FROM (OLD.program_name, OLD.department, OLD.notes, OLD.institution_name)
+    THEN
+        NEW.search_vector := application_search_vector(
+            NEW.program_name, NEW.department, NEW.notes, NEW.institution_name
+        );
+    END IF;
+    RETURN NEW;
+END
+$$;
+
+-- Fill existing rows; their search vectors and sync stamps already reflect the names
+ALTER TABLE applications DISABLE TRIGGER applications_sync_stamp;
+ALTER TABLE applications DISABLE TRIGGER applications_search_update;
+UPDATE applications a
+SET institution_name = i.name, institution_country = i.country, institution_rank = institution_rank_number(i.rank)
+FROM institutions i WHERE i.id = a.institution_id;
+ALTER TABLE applications ENABLE TRIGGER applications_search_update;
+ALTER TABLE applications ENABLE TRIGGER applications_sync_stamp;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS applications_institution_snapshot ON applications;
+DROP FUNCTION IF EXISTS applications_institution_snapshot();
+
+CREATE OR REPLACE FUNCTION applications_search_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT'
+        OR NEW.search_vector IS DISTINCT FROM OLD.search_vector
+        OR (NEW.program_name, NEW.department, NEW.notes, NEW.institution_id)
+            IS DISTINCT FROM (OLD.program_name, OLD.department, OLD.notes, OLD.institution_id)
+    THEN
+        NEW.search_vector := application_search_vector(
+            NEW.program_name, NEW.department, NEW.notes,
+            (SELECT name FROM institutions WHERE id = NEW.institution_id)
+        );
+    END IF;
+    RETURN NEW;
+END
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_full_text_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='institution_country',
+            field=models.CharField(blank=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='institution_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='institution_rank',
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
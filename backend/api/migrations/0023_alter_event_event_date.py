@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_application_institution_snapshot'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='event',
+            name='event_date',
+            field=models.DateField(),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-19 16:55
+
+from django.db import migrations
+
+# Documents embed their application's programme and institution name
+# (application_info). When either changes, touch the documents so their sync
+# stamp moves and the change feed sends them again.
+CREATE_TRIGGER = """
+CREATE OR REPLACE FUNCTION applications_restamp_documents() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE documents SET change_seq = change_seq WHERE application_id = NEW.id;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER applications_restamp_documents AFTER UPDATE ON applications
+    FOR EACH ROW
+    WHEN ((OLD.program_name, OLD.institution_name) IS DISTINCT FROM (NEW.program_name, NEW.institution_name))
+    EXECUTE FUNCTION applications_restamp_documents();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS applications_restamp_documents ON applications;
+DROP FUNCTION IF EXISTS applications_restamp_documents();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_alter_event_event_date'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
@@ -5,7 +5,8 @@ from .user_models import Userinfo, UserProfile, UserSettings
 from .institution_models import (
     Institution, Classification, AcademicReputation, EmployerReputation,
     FacultyStudent, CitationsPerFaculty, InternationalFaculty, InternationalStudents,
-    InternationalResearchNetwork, EmploymentOutcomes, Sustainability
+    InternationalResearchNetwork, EmploymentOutcomes, Sustainability,
+    METRIC_MODELS, CountryStats
 )
 # Import the new Application model
 from .application_models import Application
@@ -13,4 +14,31 @@ from .application_models import Application
 from .document_models import Document
 
 # Import the new Event model
-from .event_models import Event
\ No newline at end of file
+from .event_models import Event
+
+# Institution dataset versioning
+from .dataset_models import DatasetVersion
+
+# Institution popularity counters
+from .popularity_models import InstitutionPopularity
+
+# Directory search analytics
+from .analytics_models import DirectorySearch, PopularDirectoryQuery
+
+# Institution watchlists
+from .watchlist_models import InstitutionWatch, InstitutionSnapshot, InstitutionChange
+
+# Program catalogue
+from .program_models import Program
+
+# Link health checks
+from .link_models import LinkCheck
+
+# Application status history
+from .status_history_models import ApplicationStatusChange, ApplicationStageStats
+
+# Delta sync
+from .sync_models import SyncTombstone
+
+# Cross-user application outcomes
+from .outcome_models import ApplicationOutcomeStats, ApplicationOutcomeValue
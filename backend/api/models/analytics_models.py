@@ -0,0 +1,38 @@
+from django.db import models
+from django.utils import timezone
+
+class DirectorySearch(models.Model):
+    """A single directory search, captured for analytics
+
+    Rows are written in batches by each worker and folded into
+    PopularDirectoryQuery by the rollup job, so this table stays small.
+    """
+    query_key = models.CharField(max_length=40)
+    params = models.JSONField(default=dict)
+    searched_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.params} @ {self.searched_at:%Y-%m-%d %H:%M}"
+
+    class Meta:
+        db_table = 'directory_searches'
+        indexes = [
+            models.Index(fields=['searched_at'], name='directory_search_time_idx'),
+        ]
+
+class PopularDirectoryQuery(models.Model):
+    """Rolled-up hit count for each distinct directory query"""
+    query_key = models.CharField(max_length=40, unique=True)
+    params = models.JSONField(default=dict)
+    hits = models.PositiveBigIntegerField(default=0)
+    last_searched_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.params} ({self.hits} hits)"
+
+    class Meta:
+        db_table = 'popular_directory_queries'
+        ordering = ['-hits']
+        indexes = [
+            models.Index(fields=['-hits'], name='popular_query_hits_idx'),
+        ]
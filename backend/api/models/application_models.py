@@ -1,4 +1,6 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from api.models.user_models import Userinfo
 from api.models.institution_models import Institution
 
@@ -25,8 +27,21 @@ class Application(models.Model):
         ('Other', 'Other'),
     ]
     
+    # Columns the database copies from the institution on write
+    INSTITUTION_SNAPSHOT_FIELDS = ('institution_name', 'institution_country', 'institution_rank')
+    
+    # Fields the cross-user outcome statistics are built from
+    OUTCOME_FIELDS = ('institution_id', 'program_name', 'degree_type', 'status',
+                      'tuition_fee', 'submitted_date', 'decision_date')
+    
     user = models.ForeignKey(Userinfo, on_delete=models.CASCADE, related_name='applications')
     institution = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name='applications')
+    # Copied from the institution by a database trigger and refreshed after
+    # dataset imports, so application reads don't join institutions; see
+    # api.utils.institution_snapshot
+    institution_name = models.CharField(max_length=255, blank=True, default='', editable=False)
+    institution_country = models.CharField(max_length=100, blank=True, default='', editable=False)
+    institution_rank = models.IntegerField(null=True, blank=True, editable=False)
     program_name = models.CharField(max_length=150)
     degree_type = models.CharField(max_length=50, choices=DEGREE_TYPE_CHOICES)
     department = models.CharField(max_length=100, blank=True, null=True)
@@ -42,10 +57,54 @@ class Application(models.Model):
     notes = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Stamped by a database trigger on every write; see api.utils.sync
+    change_seq = models.BigIntegerField(null=True, editable=False)
+    # Maintained by a database trigger from the programme, department, notes
+    # and institution_name; see api.utils.full_text_search
+    search_vector = SearchVectorField(null=True, editable=False)
     
     class Meta:
         db_table = 'applications'
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['user', 'institution'], name='application_user_inst_idx'),
+            models.Index(fields=['user', '-updated_at'], name='application_user_updated_idx'),
+            models.Index(fields=['user', 'status'], name='application_user_status_idx'),
+            models.Index(fields=['user', 'degree_type'], name='application_user_degree_idx'),
+            models.Index(fields=['user', 'change_seq'], name='application_user_seq_idx'),
+            models.Index(fields=['user', 'start_date', 'id'], name='application_user_start_idx'),
+            models.Index(fields=['user', 'submitted_date', 'id'], name='application_user_submit_idx'),
+            models.Index(fields=['user', 'decision_date', 'id'], name='application_user_decision_idx'),
+            GinIndex(fields=['user', 'search_vector'], name='application_user_search_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.user.email} - {self.institution.name} - {self.program_name} ({self.status})"
+        return f"{self.user.email} - {self.institution_name} - {self.program_name} ({self.status})"
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored programme so edits can be reflected in the catalogue
+        instance._loaded_program = (
+            instance.__dict__.get('institution_id'), instance.__dict__.get('program_name')
+        )
+        # and the stored status, so changes can be appended to the status history
+        instance._loaded_status = instance.__dict__.get('status')
+        # and the fields behind the cross-user outcome statistics
+        instance._loaded_outcome = tuple(instance.__dict__.get(field) for field in cls.OUTCOME_FIELDS)
+        # and the institution the copied institution columns belong to
+        instance._loaded_institution = instance.__dict__.get('institution_id')
+        return instance
+    
+    def save(self, *args, **kwargs):
+        institution_changed = (
+            self._state.adding or self.institution_id != getattr(self, '_loaded_institution', None)
+        )
+        # post_save receivers (status history, catalogue) commit or roll back with the row
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if institution_changed:
+                # The trigger filled in the institution columns; read them back
+                # so this instance doesn't show stale ones until reloaded
+                self.refresh_from_db(fields=self.INSTITUTION_SNAPSHOT_FIELDS)
+        self._loaded_institution = self.institution_id
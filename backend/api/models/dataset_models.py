@@ -0,0 +1,17 @@
+from django.db import models
+
+class DatasetVersion(models.Model):
+    """Version counter for the institution ranking dataset.
+
+    A single row (id=1) is bumped every time new ranking data is loaded, so
+    per-process caches built from the institution tables can tell when they
+    are stale.
+    """
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Institution dataset v{self.version}"
+
+    class Meta:
+        db_table = 'dataset_version'
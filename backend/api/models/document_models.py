@@ -25,10 +25,15 @@ class Document(models.Model):
     file_name = models.CharField(max_length=255)
     file_url = models.CharField(max_length=255)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    # Stamped by a database trigger on every write; see api.utils.sync
+    change_seq = models.BigIntegerField(null=True, editable=False)
     
     class Meta:
         db_table = 'documents'
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['user', 'change_seq'], name='document_user_seq_idx'),
+        ]
     
     def __str__(self):
         return f"{self.file_name} ({self.document_type})"
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from api.models.user_models import Userinfo
 from api.models.application_models import Application
@@ -18,6 +20,17 @@ class Event(models.Model):
     notes = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Stamped by a database trigger on every write; see api.utils.sync
+    change_seq = models.BigIntegerField(null=True, editable=False)
+    # Maintained by a database trigger from the title and notes
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'change_seq'], name='event_user_seq_idx'),
+            models.Index(fields=['user', 'event_date', 'id'], name='event_user_date_idx'),
+            GinIndex(fields=['user', 'search_vector'], name='event_user_search_idx'),
+        ]
 
     def __str__(self):
         return self.event_title
@@ -1,5 +1,16 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
+class RankNumber(models.Func):
+    """Parsed leading number of a rank string ("621-630" -> 621), NULL if unparseable"""
+    function = 'institution_rank_number'
+    output_field = models.IntegerField()
+
+class ScoreNumber(models.Func):
+    """Parsed numeric score, NULL if missing or unparseable"""
+    function = 'institution_score_number'
+    output_field = models.FloatField()
+
 class Institution(models.Model):
     """Educational institution details"""
     id = models.CharField(primary_key=True, max_length=100)
@@ -15,6 +26,10 @@ class Institution(models.Model):
     class Meta:
         db_table = 'institutions'
         ordering = ['rank']
+        indexes = [
+            models.Index(models.F('country'), RankNumber('rank'), name='institution_country_rank_idx'),
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='institution_name_trgm_idx'),
+        ]
 
 class Classification(models.Model):
     """Institution classification details"""
@@ -167,3 +182,47 @@ class Sustainability(models.Model):
     
     class Meta:
         db_table = 'sustainability'
+
+# The nine per-institution ranking metrics; each table shares its name with the
+# reverse accessor on Institution and has the same score/rank columns.
+METRIC_MODELS = [
+    AcademicReputation, EmployerReputation, FacultyStudent, CitationsPerFaculty,
+    InternationalFaculty, InternationalStudents, InternationalResearchNetwork,
+    EmploymentOutcomes, Sustainability,
+]
+
+class CountryStats(models.Model):
+    """Per-country rollup of the institution dataset
+
+    Backed by the ``country_stats`` materialized view, which is refreshed after
+    every dataset import rather than aggregated on each request.
+    """
+    country = models.CharField(primary_key=True, max_length=100)
+    institution_count = models.IntegerField()
+    rank_top_100 = models.IntegerField()
+    rank_101_200 = models.IntegerField()
+    rank_201_500 = models.IntegerField()
+    rank_501_1000 = models.IntegerField()
+    rank_1001_plus = models.IntegerField()
+    unranked = models.IntegerField()
+    best_rank = models.IntegerField(null=True)
+    avg_overall_score = models.FloatField(null=True)
+    avg_academic_reputation = models.FloatField(null=True)
+    avg_employer_reputation = models.FloatField(null=True)
+    avg_faculty_student = models.FloatField(null=True)
+    avg_citations_per_faculty = models.FloatField(null=True)
+    avg_international_faculty = models.FloatField(null=True)
+    avg_international_students = models.FloatField(null=True)
+    avg_international_research_network = models.FloatField(null=True)
+    avg_employment_outcomes = models.FloatField(null=True)
+    avg_sustainability = models.FloatField(null=True)
+    research = models.JSONField(default=dict)
+    size = models.JSONField(default=dict)
+    focus = models.JSONField(default=dict)
+    
+    def __str__(self):
+        return f"Statistics for {self.country}"
+    
+    class Meta:
+        managed = False
+        db_table = 'country_stats'
@@ -0,0 +1,26 @@
+from django.db import models
+
+class LinkCheck(models.Model):
+    """Latest health check result for an external URL
+
+    Shared by every institution and application that links to the same URL.
+    ``etag`` and ``last_modified`` are kept for conditional re-checks.
+    """
+    url = models.TextField(unique=True)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    ok = models.BooleanField(default=True)
+    error = models.CharField(max_length=255, blank=True, null=True)
+    etag = models.CharField(max_length=255, blank=True, null=True)
+    last_modified = models.CharField(max_length=64, blank=True, null=True)
+    consecutive_failures = models.PositiveIntegerField(default=0)
+    checked_at = models.DateTimeField()
+    last_ok_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.url} ({self.status_code or self.error})"
+
+    class Meta:
+        db_table = 'link_checks'
+        indexes = [
+            models.Index(fields=['checked_at'], name='link_check_checked_idx'),
+        ]
@@ -0,0 +1,49 @@
+from django.db import models
+from api.models.institution_models import Institution
+
+class ApplicationOutcomeStats(models.Model):
+    """Running application counts per institution, programme and degree type
+
+    Kept up to date from application writes by api.utils.outcome_stats, so
+    cross-user outcome statistics never scan the applications table.
+    """
+    institution = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name='outcome_stats')
+    normalized_program = models.CharField(max_length=150)
+    degree_type = models.CharField(max_length=50)
+    applications = models.IntegerField(default=0)
+    accepted = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.institution_id} - {self.normalized_program} ({self.degree_type}): {self.applications}"
+
+    class Meta:
+        db_table = 'application_outcome_stats'
+        constraints = [
+            models.UniqueConstraint(fields=['institution', 'normalized_program', 'degree_type'],
+                                    name='outcome_stats_unique_group'),
+        ]
+
+class ApplicationOutcomeValue(models.Model):
+    """Number of applications in a group sharing one tuition fee or decision time"""
+    KIND_CHOICES = [
+        ('tuition', 'Tuition fee'),
+        ('decision_days', 'Days from submission to decision'),
+    ]
+
+    institution = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name='outcome_values')
+    normalized_program = models.CharField(max_length=150)
+    degree_type = models.CharField(max_length=50)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    value = models.DecimalField(max_digits=12, decimal_places=2)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.institution_id} - {self.normalized_program} {self.kind}={self.value}: {self.count}"
+
+    class Meta:
+        db_table = 'application_outcome_values'
+        constraints = [
+            models.UniqueConstraint(fields=['institution', 'normalized_program', 'degree_type', 'kind', 'value'],
+                                    name='outcome_value_unique'),
+        ]
@@ -0,0 +1,27 @@
+from django.db import models
+from api.models.institution_models import Institution
+
+class InstitutionPopularity(models.Model):
+    """Sharded, time-bucketed view and application counters for an institution
+
+    Each worker process writes to its own shard, so popular institutions never
+    become a single hot row. Recent buckets are hourly; older ones are rolled
+    up into daily buckets on shard 0.
+    """
+    institution = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name='popularity')
+    bucket = models.DateTimeField()
+    shard = models.PositiveSmallIntegerField(default=0)
+    views = models.PositiveIntegerField(default=0)
+    applications = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.institution_id} @ {self.bucket:%Y-%m-%d %H:00} (shard {self.shard})"
+
+    class Meta:
+        db_table = 'institution_popularity'
+        constraints = [
+            models.UniqueConstraint(fields=['institution', 'bucket', 'shard'], name='institution_popularity_unique_bucket'),
+        ]
+        indexes = [
+            models.Index(fields=['bucket', 'institution'], name='inst_popularity_bucket_idx'),
+        ]
@@ -0,0 +1,29 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+from api.models.institution_models import Institution
+
+class Program(models.Model):
+    """Canonical programme offered by an institution, built from applications
+
+    Users type programme names freely; each distinct normalised name becomes
+    one catalogue entry whose usage count tracks how many applications use it.
+    """
+    institution = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name='programs')
+    name = models.CharField(max_length=150)
+    normalized_name = models.CharField(max_length=150)
+    department = models.CharField(max_length=100, blank=True, null=True)
+    usage_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.institution_id})"
+
+    class Meta:
+        db_table = 'programs'
+        ordering = ['-usage_count', 'name']
+        constraints = [
+            models.UniqueConstraint(fields=['institution', 'normalized_name'], name='program_unique_name'),
+        ]
+        indexes = [
+            GinIndex(fields=['normalized_name'], opclasses=['gin_trgm_ops'], name='program_name_trgm_idx'),
+        ]
@@ -0,0 +1,47 @@
+from django.db import models
+from django.utils import timezone
+from api.models.user_models import Userinfo
+from api.models.application_models import Application
+
+class ApplicationStatusChange(models.Model):
+    """Append-only log of application status transitions
+
+    ``from_status`` is empty for the entry recorded when an application is
+    created (or was first seen by the history backfill).
+    """
+    user = models.ForeignKey(Userinfo, on_delete=models.CASCADE, related_name='status_changes')
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='status_changes')
+    from_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES, blank=True, null=True)
+    to_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_status} -> {self.to_status}"
+
+    class Meta:
+        db_table = 'application_status_changes'
+        ordering = ['changed_at', 'id']
+        indexes = [
+            models.Index(fields=['user', 'application', 'changed_at'], name='status_change_user_app_idx'),
+        ]
+
+class ApplicationStageStats(models.Model):
+    """Running totals of time a user's applications spent in each status
+
+    Updated as transitions are appended, so averages never rescan the log.
+    Only completed stays are counted; the current status of each application
+    is still running.
+    """
+    user = models.ForeignKey(Userinfo, on_delete=models.CASCADE, related_name='stage_stats')
+    status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    total_seconds = models.FloatField(default=0)
+    stays = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id} {self.status}: {self.stays} stays"
+
+    class Meta:
+        db_table = 'application_stage_stats'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'status'], name='stage_stats_unique_status'),
+        ]
@@ -0,0 +1,30 @@
+from django.db import models
+from api.models.user_models import Userinfo
+
+class SyncTombstone(models.Model):
+    """Marker left behind when a synced row is deleted
+
+    Written by a database trigger, so cascaded deletes are covered too. The
+    user reference has no database constraint because the tombstones of a
+    deleted account are written while the account itself is being deleted.
+    """
+    KIND_CHOICES = [
+        ('applications', 'Application'),
+        ('events', 'Event'),
+        ('documents', 'Document'),
+    ]
+
+    user = models.ForeignKey(Userinfo, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    change_seq = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} deleted"
+
+    class Meta:
+        db_table = 'sync_tombstones'
+        indexes = [
+            models.Index(fields=['user', 'change_seq'], name='sync_tombstone_user_seq_idx'),
+        ]
@@ -0,0 +1,63 @@
+from django.db import models
+from api.models.user_models import Userinfo
+from api.models.institution_models import Institution
+
+class InstitutionWatch(models.Model):
+    """An institution a user follows for rank and metric changes"""
+    user = models.ForeignKey(Userinfo, on_delete=models.CASCADE, related_name='institution_watches')
+    institution = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name='watches')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.user.email} watches {self.institution_id}"
+
+    class Meta:
+        db_table = 'institution_watches'
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'institution'], name='institution_watch_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['institution', 'user'], name='institution_watch_inst_idx'),
+        ]
+
+class InstitutionSnapshot(models.Model):
+    """Last imported content of an institution across all of its tables
+
+    ``content_hash`` is the md5 of ``data``; comparing hashes is how the
+    change-detection pass finds institutions that changed in an import.
+    Not a foreign key, so snapshots survive the dataset being reloaded.
+    """
+    institution_id = models.CharField(primary_key=True, max_length=100)
+    content_hash = models.CharField(max_length=32)
+    data = models.JSONField()
+    dataset_version = models.PositiveIntegerField()
+
+    def __str__(self):
+        return f"Snapshot of {self.institution_id} (v{self.dataset_version})"
+
+    class Meta:
+        db_table = 'institution_snapshots'
+
+class InstitutionChange(models.Model):
+    """A change to a watched institution, recorded once per watcher"""
+    user = models.ForeignKey(Userinfo, on_delete=models.CASCADE, related_name='institution_changes')
+    institution = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name='changes')
+    dataset_version = models.PositiveIntegerField()
+    previous_rank = models.CharField(max_length=50, null=True, blank=True)
+    current_rank = models.CharField(max_length=50, null=True, blank=True)
+    previous_score = models.CharField(max_length=50, null=True, blank=True)
+    current_score = models.CharField(max_length=50, null=True, blank=True)
+    changed_fields = models.JSONField(default=list)
+    detected_at = models.DateTimeField(auto_now_add=True)
+    seen = models.BooleanField(default=False)
+
+    def __str__(self):
+        return f"{self.institution_id} changed in v{self.dataset_version} for {self.user.email}"
+
+    class Meta:
+        db_table = 'institution_changes'
+        ordering = ['-detected_at']
+        indexes = [
+            models.Index(fields=['user', 'seen', '-detected_at'], name='institution_change_user_idx'),
+        ]
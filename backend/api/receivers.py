@@ -0,0 +1,87 @@
+import logging
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.models.application_models import Application
+from api.models.institution_models import Institution
+from api.signals import dataset_imported
+from api.utils.change_detection import detect_institution_changes
+from api.utils.country_stats import refresh_country_stats
+from api.utils.institution_snapshot import refresh_application_institutions
+from api.utils.integrity import check_institution_data
+from api.utils.outcome_stats import outcome_snapshot, update_outcome_stats
+from api.utils.program_catalogue import update_program_usage
+from api.utils.status_history import record_status_changes
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(dataset_imported)
+def refresh_country_stats_after_import(sender, version, **kwargs):
+    refresh_country_stats()
+
+
+@receiver(dataset_imported)
+def detect_changes_after_import(sender, version, **kwargs):
+    detect_institution_changes(version)
+
+
+@receiver(dataset_imported)
+def refresh_application_institutions_after_import(sender, version, **kwargs):
+    refresh_application_institutions()
+
+
+@receiver(dataset_imported)
+def check_data_after_import(sender, version, **kwargs):
+    summary = check_institution_data()['summary']
+    if any(summary.values()):
+        logger.warning("Institution dataset v%s has integrity issues: %s", version, summary)
+
+
+@receiver(post_save, sender=Institution)
+def refresh_application_institutions_on_save(sender, instance, created, **kwargs):
+    if not created:
+        refresh_application_institutions([instance.pk])
+
+
+@receiver(post_save, sender=Application)
+def update_program_catalogue_on_save(sender, instance, created, **kwargs):
+    current = (instance.institution_id, instance.program_name)
+    loaded = getattr(instance, '_loaded_program', None)
+    if created:
+        update_program_usage(added=[(*current, instance.department)])
+    elif loaded is not None and loaded != current:
+        update_program_usage(added=[(*current, instance.department)], removed=[(*loaded, None)])
+    instance._loaded_program = current
+
+
+@receiver(post_delete, sender=Application)
+def update_program_catalogue_on_delete(sender, instance, **kwargs):
+    update_program_usage(removed=[(instance.institution_id, instance.program_name, None)])
+
+
+@receiver(post_save, sender=Application)
+def record_status_history_on_save(sender, instance, created, **kwargs):
+    loaded = getattr(instance, '_loaded_status', None)
+    if created:
+        record_status_changes([(instance, None)])
+    elif loaded is not None and loaded != instance.status:
+        record_status_changes([(instance, loaded)])
+    instance._loaded_status = instance.status
+
+
+@receiver(post_save, sender=Application)
+def update_outcome_stats_on_save(sender, instance, created, **kwargs):
+    current = outcome_snapshot(instance)
+    loaded = getattr(instance, '_loaded_outcome', None)
+    if created:
+        update_outcome_stats(added=[current])
+    elif loaded is not None and loaded != current:
+        update_outcome_stats(added=[current], removed=[loaded])
+    instance._loaded_outcome = current
+
+
+@receiver(post_delete, sender=Application)
+def update_outcome_stats_on_delete(sender, instance, **kwargs):
+    update_outcome_stats(removed=[outcome_snapshot(instance)])
@@ -3,11 +3,12 @@
 from .auth_serializers import RegisterSerializer, LoginSerializer
 from .user_serializers import UserInfoSerializer, UserProfileSerializer, UserSettingsSerializer
 from .institution_serializers import (
-    InstitutionListSerializer, InstitutionDetailSerializer,
+    InstitutionListSerializer, InstitutionDetailSerializer, InstitutionWithMyApplicationSerializer,
+    InstitutionMetricsSerializer,
     ClassificationSerializer, AcademicReputationSerializer, EmployerReputationSerializer,
     FacultyStudentSerializer, CitationsPerFacultySerializer, InternationalFacultySerializer,
     InternationalStudentsSerializer, InternationalResearchNetworkSerializer,
-    EmploymentOutcomesSerializer, SustainabilitySerializer
+    EmploymentOutcomesSerializer, SustainabilitySerializer, CountryStatsSerializer
 )
 # Import the new Application serializers
 from .application_serializers import (
@@ -20,8 +21,15 @@ from .application_serializers import (
 from .document_serializers import (
     DocumentListSerializer,
     DocumentDetailSerializer,
-    DocumentUploadSerializer
+    DocumentUploadSerializer,
+    DocumentSummarySerializer
 )
 
 # Event serializers
 from .event_serializers import EventSerializer
+
+# Watchlist serializers
+from .watchlist_serializers import InstitutionWatchSerializer, InstitutionChangeSerializer
+
+# Program catalogue serializers
+from .program_serializers import ProgramSerializer
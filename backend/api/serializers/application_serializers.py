@@ -1,11 +1,38 @@
 from rest_framework import serializers
 from api.models.application_models import Application
-from api.serializers.institution_serializers import InstitutionListSerializer
+from api.serializers.document_serializers import DocumentSummarySerializer
+from api.serializers.event_serializers import EventSerializer
+from api.serializers.institution_serializers import InstitutionListSerializer, InstitutionMetricsSerializer
+from api.utils.link_checker import APPLICATION_LINK_FIELDS, dead_links
 
-class ApplicationListSerializer(serializers.ModelSerializer):
+# Relations clients can embed with ?expand=
+APPLICATION_EXPANSIONS = ('institution', 'institution.metrics', 'events', 'documents')
+
+class ExpandableApplicationMixin:
+    """
+    Embed the relations listed in the ``expand`` serializer context.
+    
+    ``institution`` replaces the institution id with the institution (with its
+    classification and metric scores for ``institution.metrics``); ``events`` and
+    ``documents`` add the application's events and documents. The view is
+    expected to have loaded them with select_related/prefetch_related.
+    """
+    
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        expand = self.context.get('expand', ())
+        if 'institution.metrics' in expand:
+            data['institution'] = InstitutionMetricsSerializer(instance.institution).data
+        elif 'institution' in expand:
+            data['institution'] = InstitutionListSerializer(instance.institution).data
+        if 'events' in expand:
+            data['events'] = EventSerializer(instance.events.all(), many=True).data
+        if 'documents' in expand:
+            data['documents'] = DocumentSummarySerializer(instance.documents.all(), many=True).data
+        return data
+
+class ApplicationListSerializer(ExpandableApplicationMixin, serializers.ModelSerializer):
     """Simplified serializer for listing applications"""
-    institution_name = serializers.CharField(source='institution.name', read_only=True)
-    institution_country = serializers.CharField(source='institution.country', read_only=True)
     
     class Meta:
         model = Application
@@ -13,18 +40,25 @@ class ApplicationListSerializer(serializers.ModelSerializer):
                   'degree_type', 'status', 'start_date', 'submitted_date', 'decision_date')
         read_only_fields = ('id', 'created_at', 'updated_at')
 
-class ApplicationDetailSerializer(serializers.ModelSerializer):
+class ApplicationDetailSerializer(ExpandableApplicationMixin, serializers.ModelSerializer):
     """Detailed serializer for application details"""
     institution_details = InstitutionListSerializer(source='institution', read_only=True)
+    dead_links = serializers.SerializerMethodField()
     
     class Meta:
         model = Application
         fields = ('id', 'user', 'institution', 'institution_details', 'program_name', 
                   'degree_type', 'department', 'duration_years', 'tuition_fee', 
-                  'application_link', 'scholarship_link', 'program_info_link',
+                  'application_link', 'scholarship_link', 'program_info_link', 'dead_links',
                   'status', 'start_date', 'submitted_date', 'decision_date',
                   'notes', 'created_at', 'updated_at')
         read_only_fields = ('id', 'user', 'created_at', 'updated_at')
+    
+    def get_dead_links(self, obj):
+        """Names of the link fields whose URL failed the latest link checks"""
+        links = {field: getattr(obj, field) for field in APPLICATION_LINK_FIELDS}
+        dead = dead_links(links.values())
+        return [field for field, url in links.items() if url and url.strip() in dead]
         
     def validate_institution(self, value):
         """Ensure the institution exists"""
@@ -45,3 +79,9 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         validated_data['user'] = user
         return super().create(validated_data)
+
+class ApplicationImportSerializer(ApplicationCreateSerializer):
+    """Validates one spreadsheet row; the institution is resolved separately in bulk"""
+    class Meta(ApplicationCreateSerializer.Meta):
+        fields = tuple(field for field in ApplicationCreateSerializer.Meta.fields if field not in ('id', 'institution'))
+        read_only_fields = ()
@@ -15,10 +15,18 @@ class DocumentListSerializer(serializers.ModelSerializer):
             return {
                 'id': obj.application.id,
                 'program_name': obj.application.program_name,
-                'institution_name': obj.application.institution.name if obj.application.institution else None
+                'institution_name': obj.application.institution_name
             }
         return None
 
+class DocumentSummarySerializer(serializers.ModelSerializer):
+    """Document fields embedded in an application response"""
+    
+    class Meta:
+        model = Document
+        fields = ['id', 'document_type', 'file_name', 'file_url', 'uploaded_at']
+        read_only_fields = fields
+
 class DocumentDetailSerializer(serializers.ModelSerializer):
     """Serializer for document details"""
     application_info = serializers.SerializerMethodField()
@@ -34,7 +42,7 @@ class DocumentDetailSerializer(serializers.ModelSerializer):
             return {
                 'id': obj.application.id,
                 'program_name': obj.application.program_name,
-                'institution_name': obj.application.institution.name if obj.application.institution else None,
+                'institution_name': obj.application.institution_name,
                 'degree_type': obj.application.degree_type,
                 'status': obj.application.status
             }
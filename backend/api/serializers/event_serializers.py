@@ -32,7 +32,7 @@ class EventSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Event
-        fields = '__all__'
+        exclude = ('search_vector', 'change_seq')
         read_only_fields = ('created_at', 'updated_at', 'user')
 
     def create(self, validated_data):
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+from api.utils.link_checker import dead_links
 from api.models.institution_models import (
     Institution, Classification, AcademicReputation, EmployerReputation,
     FacultyStudent, CitationsPerFaculty, InternationalFaculty, InternationalStudents,
-    InternationalResearchNetwork, EmploymentOutcomes, Sustainability
+    InternationalResearchNetwork, EmploymentOutcomes, Sustainability,
+    METRIC_MODELS, CountryStats
 )
 
 class ClassificationSerializer(serializers.ModelSerializer):
@@ -66,11 +68,16 @@ class InstitutionDetailSerializer(serializers.ModelSerializer):
     international_research_network = InternationalResearchNetworkSerializer(read_only=True)
     employment_outcomes = EmploymentOutcomesSerializer(read_only=True)
     sustainability = SustainabilitySerializer(read_only=True)
+    web_links_dead = serializers.SerializerMethodField()
 
     class Meta:
         model = Institution
         fields = '__all__'
 
+    def get_web_links_dead(self, obj):
+        """Whether the institution's website failed the latest link checks"""
+        return bool(obj.web_links) and bool(dead_links([obj.web_links]))
+
 class InstitutionListSerializer(serializers.ModelSerializer):
     """Serializer for listing institutions"""
     rank = serializers.CharField()  # Changed to CharField to preserve original format
@@ -78,3 +85,56 @@ class InstitutionListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Institution
         fields = ['id', 'rank', 'name', 'country', 'overall_score']
+
+class InstitutionMetricsSerializer(InstitutionListSerializer):
+    """Directory row with classification and metric scores, for embedding in other responses"""
+    classification = ClassificationSerializer(read_only=True)
+    academic_reputation = AcademicReputationSerializer(read_only=True)
+    employer_reputation = EmployerReputationSerializer(read_only=True)
+    faculty_student = FacultyStudentSerializer(read_only=True)
+    citations_per_faculty = CitationsPerFacultySerializer(read_only=True)
+    international_faculty = InternationalFacultySerializer(read_only=True)
+    international_students = InternationalStudentsSerializer(read_only=True)
+    international_research_network = InternationalResearchNetworkSerializer(read_only=True)
+    employment_outcomes = EmploymentOutcomesSerializer(read_only=True)
+    sustainability = SustainabilitySerializer(read_only=True)
+    
+    class Meta(InstitutionListSerializer.Meta):
+        fields = InstitutionListSerializer.Meta.fields + ['web_links', 'classification'] + [
+            model._meta.db_table for model in METRIC_MODELS
+        ]
+
+class InstitutionWithMyApplicationSerializer(InstitutionListSerializer):
+    """Directory row annotated with the requesting user's own applications"""
+    my_application_status = serializers.CharField(read_only=True, allow_null=True)
+    my_application_count = serializers.IntegerField(read_only=True)
+    
+    class Meta(InstitutionListSerializer.Meta):
+        fields = InstitutionListSerializer.Meta.fields + ['my_application_status', 'my_application_count']
+
+class CountryStatsSerializer(serializers.ModelSerializer):
+    """Serializer for per-country institution statistics"""
+    rank_distribution = serializers.SerializerMethodField()
+    average_scores = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = CountryStats
+        fields = ['country', 'institution_count', 'best_rank', 'rank_distribution',
+                  'average_scores', 'research', 'size', 'focus']
+    
+    def get_rank_distribution(self, obj):
+        return {
+            '1-100': obj.rank_top_100,
+            '101-200': obj.rank_101_200,
+            '201-500': obj.rank_201_500,
+            '501-1000': obj.rank_501_1000,
+            '1001+': obj.rank_1001_plus,
+            'unranked': obj.unranked,
+        }
+    
+    def get_average_scores(self, obj):
+        scores = {'overall_score': obj.avg_overall_score}
+        for model in METRIC_MODELS:
+            metric = model._meta.db_table
+            scores[metric] = getattr(obj, f'avg_{metric}')
+        return scores
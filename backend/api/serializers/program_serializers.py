@@ -0,0 +1,9 @@
+from rest_framework import serializers
+from api.models.program_models import Program
+
+class ProgramSerializer(serializers.ModelSerializer):
+    """Serializer for programme catalogue suggestions"""
+    class Meta:
+        model = Program
+        fields = ('id', 'name', 'department', 'usage_count')
+        read_only_fields = fields
@@ -0,0 +1,34 @@
+from rest_framework import serializers
+from api.models.watchlist_models import InstitutionWatch, InstitutionChange
+from api.serializers.institution_serializers import InstitutionListSerializer
+
+class InstitutionWatchSerializer(serializers.ModelSerializer):
+    """Serializer for watched institutions"""
+    institution_details = InstitutionListSerializer(source='institution', read_only=True)
+    
+    class Meta:
+        model = InstitutionWatch
+        fields = ('id', 'institution', 'institution_details', 'created_at')
+        read_only_fields = ('id', 'created_at')
+    
+    def validate_institution(self, value):
+        """Ensure the user isn't already watching the institution"""
+        user = self.context['request'].user
+        if InstitutionWatch.objects.filter(user=user, institution=value).exists():
+            raise serializers.ValidationError("You are already watching this institution.")
+        return value
+    
+    def create(self, validated_data):
+        validated_data['user'] = self.context['request'].user
+        return super().create(validated_data)
+
+class InstitutionChangeSerializer(serializers.ModelSerializer):
+    """Serializer for changes detected on watched institutions"""
+    institution_name = serializers.CharField(source='institution.name', read_only=True)
+    
+    class Meta:
+        model = InstitutionChange
+        fields = ('id', 'institution', 'institution_name', 'dataset_version',
+                  'previous_rank', 'current_rank', 'previous_score', 'current_score',
+                  'changed_fields', 'detected_at', 'seen')
+        read_only_fields = fields
@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent once new institution ranking data has been committed and the dataset
+# version has been bumped. Receivers get ``version`` (the new version number).
+dataset_imported = Signal()
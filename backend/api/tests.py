@@ -1,3 +1,439 @@
-from django.test import TestCase
+import asyncio
+import io
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-# Create your tests here.
+import numpy as np
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from api.models.application_models import Application
+from api.models.document_models import Document
+from api.models.event_models import Event
+from api.models.institution_models import Classification, CountryStats, Institution
+from api.models.link_models import LinkCheck
+from api.models.popularity_models import InstitutionPopularity
+from api.models.user_models import Userinfo
+from api.utils.application_import import import_applications
+from api.utils.dataset_swap import PREVIOUS, SHADOW, _drop_generation, prepare_shadow_tables, swap_in_shadow_tables
+from api.utils.dataset_version import get_dataset_version
+from api.utils.directory_cache import directory_cache
+from api.utils.integrity import check_institution_data
+from api.utils.link_checker import check_urls, dead_links, run_link_check
+from api.utils.metric_matrix import pareto_frontier, parse_score
+from api.utils.popularity import popularity_buffer
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Tiny local web server standing in for the sites we link to"""
+
+    requests = []
+
+    def do_HEAD(self):
+        self.requests.append(self.path)
+        if self.path == '/slow':
+            time.sleep(0.3)
+            self._reply(200)
+        elif self.path == '/ok':
+            if self.headers.get('If-None-Match') == '"v1"':
+                self._reply(304)
+            else:
+                self._reply(200, etag='"v1"')
+        elif self.path == '/no-head':
+            self._reply(405)
+        else:
+            self._reply(404)
+
+    def do_GET(self):
+        if self.path == '/no-head':
+            self._reply(200)
+        else:
+            self.do_HEAD()
+
+    def _reply(self, code, etag=None):
+        self.send_response(code)
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class LinkCheckerTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def check(self, urls, cached=None):
+        return asyncio.run(check_urls(urls, cached, min_interval=0))
+
+    def test_classifies_responses(self):
+        ok, gone, no_head, unreachable = self.check([
+            f"{self.base_url}/ok",
+            f"{self.base_url}/gone",
+            f"{self.base_url}/no-head",
+            "http://127.0.0.1:1/closed",
+        ])
+        self.assertTrue(ok.ok)
+        self.assertEqual(ok.etag, '"v1"')
+        self.assertFalse(gone.ok)
+        self.assertEqual(gone.status_code, 404)
+        self.assertTrue(no_head.ok)
+        self.assertFalse(unreachable.ok)
+        self.assertIsNotNone(unreachable.error)
+
+    def test_conditional_request(self):
+        url = f"{self.base_url}/ok"
+        (result,) = self.check([url], {url: {'etag': '"v1"'}})
+        self.assertTrue(result.not_modified)
+
+    def test_slow_host_does_not_block_other_hosts(self):
+        # Three URLs on a slow host queue for its single slot without taking
+        # the global ones, so the other host is checked straight away
+        port = self.server.server_address[1]
+        slow = [f"http://127.0.0.1:{port}/slow"] * 3
+        fast = f"http://localhost:{port}/ok"
+        StandInHandler.requests.clear()
+        results = asyncio.run(check_urls(slow + [fast], concurrency=2, per_host=1, min_interval=0))
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(StandInHandler.requests[:2], ['/slow', '/ok'])
+
+    def test_malformed_url_does_not_abort_run(self):
+        Institution.objects.create(id='inst-ok', name='Good University', country='Nigeria', web_links=f"{self.base_url}/ok")
+        Institution.objects.create(id='inst-bad', name='Bad University', country='Nigeria', web_links='http://exa\tmple.com/')
+
+        self.assertEqual(run_link_check(min_interval=0), (2, 1))
+        bad = LinkCheck.objects.get(url='http://exa\tmple.com/')
+        self.assertFalse(bad.ok)
+        self.assertTrue(bad.error.startswith('Invalid URL'))
+
+    def test_run_link_check_flags_dead_links(self):
+        user = Userinfo.objects.create_user('links@example.com', 'Link', 'Checker', 'Nigeria', 'password')
+        institution = Institution.objects.create(
+            id='inst-1', name='Test University', country='Nigeria', web_links=f"{self.base_url}/ok"
+        )
+        Application.objects.create(
+            user=user, institution=institution, program_name='Computer Science',
+            degree_type='Master', application_link=f"{self.base_url}/gone"
+        )
+
+        for _ in range(2):
+            LinkCheck.objects.update(checked_at='2000-01-01T00:00:00Z')
+            checked, dead = run_link_check(min_interval=0)
+            self.assertEqual((checked, dead), (2, 1))
+
+        self.assertEqual(
+            dead_links([f"{self.base_url}/ok", f"{self.base_url}/gone"]),
+            {f"{self.base_url}/gone"},
+        )
+        # Fresh results are served from the stored checks
+        self.assertEqual(run_link_check(min_interval=0), (0, 0))
+
+
+class ApplicationListQueryTests(TestCase):
+    def setUp(self):
+        self.user = Userinfo.objects.create_user('list@example.com', 'List', 'Queries', 'Nigeria', 'password')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def add_applications(self, count):
+        for i in range(count):
+            institution = Institution.objects.create(
+                id=f"list-{Institution.objects.count()}", name=f"University {i}", country='Nigeria'
+            )
+            Application.objects.create(
+                user=self.user, institution=institution, program_name='Computer Science', degree_type='Master'
+            )
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        # One ETag version query, one count query and one page query,
+        # whatever the page holds
+        self.add_applications(2)
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/applications/')
+        self.assertEqual(response.data['count'], 2)
+
+        self.add_applications(18)
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/applications/?ordering=-updated_at&status=Draft')
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertEqual(response.data['results'][0]['institution_name'], 'University 17')
+
+    def test_unchanged_list_is_not_modified(self):
+        # A matching ETag is answered from the version query alone
+        self.add_applications(2)
+        etag = self.client.get('/api/applications/')['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/applications/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertNotEqual(self.client.get('/api/applications/?status=Draft')['ETag'], etag)
+
+
+class DirectoryCacheTests(TestCase):
+    def test_equivalent_filters_share_results(self):
+        # Padded filter values are applied the same way they are keyed,
+        # so whichever query fills the cache, both get the same rows
+        for i, size in enumerate(['Large', 'Small']):
+            institution = Institution.objects.create(id=f"dir-{i}", name=f"University {i}", country='Nigeria')
+            Classification.objects.create(id=f"dir-{i}", institution=institution, size=size)
+        directory_cache.clear()
+
+        client = APIClient()
+        padded = client.get('/api/institutions/?size=%20Large&country=Nigeria%20')
+        plain = client.get('/api/institutions/?size=Large&country=Nigeria')
+        self.assertEqual([row['id'] for row in padded.data['results']], ['dir-0'])
+        self.assertEqual(padded.data['results'], plain.data['results'])
+
+    def test_results_of_replaced_dataset_are_not_cached(self):
+        directory_cache.clear()
+        version = get_dataset_version()
+        directory_cache.set('key', ['stale'], version - 1)
+        self.assertIsNone(directory_cache.get('key'))
+        directory_cache.set('key', ['fresh'], version)
+        self.assertEqual(directory_cache.get('key'), ('fresh',))
+
+    def test_rank_check_matches_directory_order(self):
+        # Ranks the directory can't place are exactly the ones reported
+        for pk, rank in [('rank-a', '=12'), ('rank-b', ' 12'), ('rank-c', '601+')]:
+            Institution.objects.create(id=pk, name=f"University {pk}", country='Nigeria', rank=rank)
+        directory_cache.clear()
+
+        ids = [row['id'] for row in APIClient().get('/api/institutions/').data['results']]
+        self.assertEqual(ids, ['rank-b', 'rank-c', 'rank-a'])
+        unparseable = check_institution_data()['issues']['unparseable_ranks']
+        self.assertEqual([issue['id'] for issue in unparseable], ['rank-a'])
+
+
+class PopularityTests(TestCase):
+    def test_unknown_institution_does_not_drop_batch(self):
+        Institution.objects.create(id='pop-1', name='Popular University', country='Nigeria')
+        popularity_buffer.add('pop-1', views=2)
+        popularity_buffer.add('removed-in-swap', views=1)
+
+        self.assertEqual(popularity_buffer.flush(), 1)
+        self.assertEqual(
+            list(InstitutionPopularity.objects.values_list('institution_id', 'views', 'shard')),
+            [('pop-1', 2, os.getpid() % popularity_buffer.shards)],
+        )
+
+
+class ApplicationBatchTests(TestCase):
+    def test_rows_are_locked_and_booleans_are_not_ids(self):
+        user = Userinfo.objects.create_user('batch@example.com', 'Batch', 'User', 'Nigeria', 'password')
+        institution = Institution.objects.create(id='batch-1', name='Batch University', country='Nigeria')
+        application = Application.objects.create(
+            id=1, user=user, institution=institution, program_name='Computer Science', degree_type='Master'
+        )
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.post('/api/applications/batch/', {'operations': [{'op': 'delete', 'id': True}]}, format='json')
+        self.assertEqual(response.data['results'][0]['errors'], {'id': ["Application not found."]})
+        self.assertTrue(Application.objects.filter(pk=application.pk).exists())
+
+        # Rows are read for validation with a lock, so nothing can change
+        # them before the batch is applied
+        with CaptureQueriesContext(connection) as queries:
+            client.post('/api/applications/batch/', {'operations': [{'op': 'delete', 'id': 1}]}, format='json')
+        self.assertTrue(any('FOR UPDATE' in query['sql'] for query in queries))
+        self.assertFalse(Application.objects.filter(pk=application.pk).exists())
+
+
+class SyncFeedTests(TransactionTestCase):
+    # Each write needs its own transaction to get its own change stamp
+
+    def test_document_follows_application_rename(self):
+        user = Userinfo.objects.create_user('sync@example.com', 'Sync', 'User', 'Nigeria', 'password')
+        institution = Institution.objects.create(id='sync-1', name='Sync University', country='Nigeria')
+        application = Application.objects.create(
+            user=user, institution=institution, program_name='Computer Science', degree_type='Master'
+        )
+        Document.objects.create(
+            user=user, application=application, document_type='CV', file_name='cv.pdf', file_url='cv.pdf'
+        )
+        Event.objects.create(
+            user=user, application=application, event_title='Interview', event_color='primary', event_date='2026-01-01'
+        )
+        client = APIClient()
+        client.force_authenticate(user)
+
+        first = client.get('/api/sync/').data
+        self.assertNotIn('change_seq', first['events'][0])
+
+        client.patch(f'/api/applications/{application.pk}/', {'program_name': 'Data Science'}, format='json')
+        changes = client.get(f"/api/sync/?since={first['token']}").data
+        self.assertEqual(
+            [document['application_info']['program_name'] for document in changes['documents']],
+            ['Data Science'],
+        )
+
+
+class DatasetSwapTests(TransactionTestCase):
+    # The swap commits its own transactions
+
+    def tearDown(self):
+        with connection.cursor() as cursor:
+            _drop_generation(cursor, SHADOW)
+            _drop_generation(cursor, PREVIOUS)
+
+    def test_swap_keeps_applications_and_country_stats(self):
+        user = Userinfo.objects.create_user('swap@example.com', 'Swap', 'User', 'Nigeria', 'password')
+        Institution.objects.create(id='swap-1', name='First University', country='Nigeria', rank='5')
+        Institution.objects.create(id='swap-2', name='Second University', country='Ghana', rank='150')
+        Application.objects.create(
+            user=user, institution_id='swap-1', program_name='Computer Science', degree_type='Master'
+        )
+
+        for count in (3, 4):
+            prepare_shadow_tables(copy_live=True)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "INSERT INTO institutions_next (id, name, country, rank) VALUES (%s, %s, 'Kenya', '700')",
+                    [f'swap-{count}', f'University {count}'],
+                )
+            swap_in_shadow_tables()
+
+            self.assertEqual(Institution.objects.count(), count)
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT count(*) FROM institutions_prev")
+                self.assertEqual(cursor.fetchone(), (count - 1,))
+                # The generation replaced by the second swap is gone
+                cursor.execute("SELECT count(*) FROM pg_class WHERE relname LIKE '%%\\_old'")
+                self.assertEqual(cursor.fetchone(), (0,))
+                cursor.execute(
+                    "SELECT confrelid::regclass::text, convalidated FROM pg_constraint "
+                    "WHERE conrelid = 'applications'::regclass AND contype = 'f' "
+                    "AND confrelid = 'institutions'::regclass"
+                )
+                self.assertEqual(cursor.fetchall(), [('institutions', True)])
+
+        self.assertEqual(Application.objects.get().institution.name, 'First University')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Application.objects.create(
+                user=user, institution_id='swap-1-gone', program_name='Computer Science', degree_type='Master'
+            )
+        self.assertEqual(
+            dict(CountryStats.objects.values_list('country', 'institution_count')),
+            {'Nigeria': 1, 'Ghana': 1, 'Kenya': 2},
+        )
+
+
+class ApplicationImportTests(TestCase):
+    def test_unreadable_csv_row_stops_with_report(self):
+        user = Userinfo.objects.create_user('import@example.com', 'Import', 'User', 'Nigeria', 'password')
+        Institution.objects.create(id='import-1', name='Import University', country='Nigeria')
+        csv_file = io.BytesIO(
+            b"institution,program_name,degree_type\n"
+            b"import-1,Computer Science,Master\n"
+            b"import-1,\"" + b"x" * 200000 + b"\",Master\n"
+        )
+
+        report = import_applications(csv_file, 'applications.csv', user, chunk_size=1)
+        self.assertEqual(report['created'], 1)
+        self.assertIn('could not be read past line', report['stopped'])
+        self.assertEqual(Application.objects.filter(user=user).count(), 1)
+
+
+class OutcomeStatsTests(TestCase):
+    def test_overall_does_not_reveal_hidden_groups(self):
+        # Ten applications to one programme (half accepted) plus a single
+        # applicant to another: the overall figures minus the listed
+        # programme would give that applicant's outcome
+        user = Userinfo.objects.create_user('outcomes@example.com', 'Outcome', 'User', 'Nigeria', 'password')
+        institution = Institution.objects.create(id='outcome-1', name='Outcome University', country='Nigeria')
+        for i in range(10):
+            Application.objects.create(
+                user=user, institution=institution, program_name='Computer Science', degree_type='Master',
+                status='Accepted' if i % 2 else 'Rejected'
+            )
+        client = APIClient()
+        client.force_authenticate(user)
+        outcomes = client.get('/api/institutions/outcome-1/outcomes/').data
+        self.assertEqual(outcomes['overall']['acceptance_rate'], 50)
+
+        Application.objects.create(
+            user=user, institution=institution, program_name='Physics', degree_type='PhD', status='Accepted'
+        )
+        outcomes = client.get('/api/institutions/outcome-1/outcomes/').data
+        self.assertIsNone(outcomes['overall'])
+        self.assertEqual([program['applications'] for program in outcomes['programs']], [10])
+
+
+class SearchTests(TestCase):
+    def test_highlights_escape_user_text(self):
+        user = Userinfo.objects.create_user('search@example.com', 'Search', 'User', 'Nigeria', 'password')
+        institution = Institution.objects.create(id='search-1', name='Search University', country='Nigeria')
+        Application.objects.create(
+            user=user, institution=institution, program_name='Computer Science', degree_type='Master',
+            notes='Ask about the <b>scholarship</b> & funding'
+        )
+        client = APIClient()
+        client.force_authenticate(user)
+
+        (result,) = client.get('/api/search/?q=scholarship').data['results']
+        self.assertIn('&lt;b&gt;<mark>scholarship</mark>&lt;/b&gt; &amp; funding', result['highlights']['notes'])
+
+
+class InstitutionSnapshotTests(TestCase):
+    def test_copied_institution_columns(self):
+        user = Userinfo.objects.create_user('snapshot@example.com', 'Snapshot', 'User', 'Nigeria', 'password')
+        first = Institution.objects.create(id='snap-1', name='First University', country='Nigeria', rank='621-630')
+        second = Institution.objects.create(id='snap-2', name='Second University', country='Ghana', rank='=12')
+        application = Application.objects.create(
+            user=user, institution=first, program_name='Computer Science', degree_type='Master'
+        )
+        # Filled on the instance that was saved, not only once reloaded
+        self.assertEqual((application.institution_name, application.institution_rank), ('First University', 621))
+        self.assertIn('First University', str(application))
+
+        application.institution = second
+        application.save()
+        self.assertEqual(
+            (application.institution_name, application.institution_country, application.institution_rank),
+            ('Second University', 'Ghana', None),
+        )
+
+        # Exports keep the published rank and add its number alongside
+        client = APIClient()
+        client.force_authenticate(user)
+        application.institution = first
+        application.save()
+        response = client.get('/api/applications/export/?format=ndjson')
+        (row,) = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual((row['institution_rank'], row['institution_rank_number']), ('621-630', 621))
+
+
+class ParetoFrontierTests(TestCase):
+    def test_ties_duplicates_and_dominated_rows(self):
+        values = np.array([
+            [0.5, 0.5],  # dominated by every frontier row
+            [1.0, 1.0],
+            [2.0, 0.0],  # same sum as [1, 1], neither dominates the other
+            [1.0, 1.0],  # duplicate: equal rows don't dominate each other
+            [0.0, 2.0],
+            [1.0, 0.0],  # dominated by [1, 1] with a tie on one column
+        ])
+        self.assertEqual(sorted(pareto_frontier(values).tolist()), [1, 2, 3, 4])
+        self.assertEqual(pareto_frontier(np.empty((0, 2))).tolist(), [])
+
+    def test_scores_are_trimmed_like_sql(self):
+        self.assertEqual(parse_score(' 12.5 '), 12.5)
+        self.assertTrue(np.isnan(parse_score('\t12.5')))
+        self.assertTrue(np.isnan(parse_score('12.5\n')))
@@ -6,10 +6,23 @@ from api.views.user_views import (
     UserSettingsRetrieveView, UserSettingsUpdateView,
     ProfilePictureUploadView, UserAccountDeleteView
 )
-from api.views.institution_views import InstitutionListView, InstitutionDetailView, InstitutionCountriesView
+from api.views.institution_views import (
+    InstitutionListView, InstitutionDetailView, InstitutionCountriesView, InstitutionTrendingView,
+    CountryStatsView, InstitutionParetoView, InstitutionLeadersView, InstitutionOutcomesView
+)
+from api.views.watchlist_views import (
+    WatchlistListView, WatchlistAddView, WatchlistRemoveView,
+    WatchlistChangesView, WatchlistChangesMarkSeenView
+)
+from api.views.program_views import ProgramAutocompleteView
+from api.views.sync_views import SyncView
+from api.views.agenda_views import AgendaView
+from api.views.search_views import SearchView
 from api.views.application_views import (
     ApplicationListView, ApplicationCreateView, ApplicationDetailView,
-    ApplicationFullUpdateView, ApplicationStatusUpdateView, ApplicationDeleteView
+    ApplicationFullUpdateView, ApplicationStatusUpdateView, ApplicationDeleteView,
+    ApplicationStatsView, ApplicationBatchView, ApplicationImportView, ApplicationTimelineView,
+    ApplicationStageDurationsView, ApplicationExportView
 )
 from api.views.document_views import (
     DocumentListView, DocumentUploadView, DocumentDetailView, DocumentDeleteView
@@ -51,7 +64,21 @@ user_urls = [
 institution_urls = [
     path('', InstitutionListView.as_view(), name='institution_list'),
     path('countries/', InstitutionCountriesView.as_view(), name='institution_countries'),
+    path('countries/<str:country>/stats/', CountryStatsView.as_view(), name='country_stats'),
+    path('trending/', InstitutionTrendingView.as_view(), name='institution_trending'),
+    path('pareto/', InstitutionParetoView.as_view(), name='institution_pareto'),
+    path('leaders/', InstitutionLeadersView.as_view(), name='institution_leaders'),
+    
+    # Watchlist endpoints
+    path('watchlist/', WatchlistListView.as_view(), name='watchlist_list'),
+    path('watchlist/add/', WatchlistAddView.as_view(), name='watchlist_add'),
+    path('watchlist/<int:pk>/delete/', WatchlistRemoveView.as_view(), name='watchlist_remove'),
+    path('watchlist/changes/', WatchlistChangesView.as_view(), name='watchlist_changes'),
+    path('watchlist/changes/mark-seen/', WatchlistChangesMarkSeenView.as_view(), name='watchlist_changes_mark_seen'),
+    
     path('<str:id>/', InstitutionDetailView.as_view(), name='institution_detail'),
+    path('<str:id>/programs/', ProgramAutocompleteView.as_view(), name='institution_programs'),
+    path('<str:id>/outcomes/', InstitutionOutcomesView.as_view(), name='institution_outcomes'),
 ]
 
 # Revised application URLs to avoid duplicate methods
@@ -59,6 +86,11 @@ application_urls = [
     # List and create endpoints
     path('', ApplicationListView.as_view(), name='application_list'),
     path('create/', ApplicationCreateView.as_view(), name='application_create'),
+    path('stats/', ApplicationStatsView.as_view(), name='application_stats'),
+    path('batch/', ApplicationBatchView.as_view(), name='application_batch'),
+    path('import/', ApplicationImportView.as_view(), name='application_import'),
+    path('export/', ApplicationExportView.as_view(), name='application_export'),
+    path('stage-durations/', ApplicationStageDurationsView.as_view(), name='application_stage_durations'),
     
     # Detail endpoint (GET and PATCH)
     path('<int:pk>/', ApplicationDetailView.as_view(), name='application_detail'),
@@ -69,6 +101,9 @@ application_urls = [
     # Status update endpoint (PATCH only) - This might be redundant with the detail view's PATCH support
     path('<int:pk>/status/', ApplicationStatusUpdateView.as_view({'patch': 'partial_update'}), name='application_status_update'),
     
+    # Status history
+    path('<int:pk>/timeline/', ApplicationTimelineView.as_view(), name='application_timeline'),
+    
     # Delete endpoint
     path('<int:pk>/delete/', ApplicationDeleteView.as_view(), name='application_delete'),
 ]
@@ -110,4 +145,13 @@ urlpatterns = [
 
     # Event management endpoints
     path('events/', include((event_urls, 'events'))),
+    
+    # Delta sync feed
+    path('sync/', SyncView.as_view(), name='sync'),
+    
+    # Combined agenda of application dates and events
+    path('agenda/', AgendaView.as_view(), name='agenda'),
+    
+    # Full-text search across applications and events
+    path('search/', SearchView.as_view(), name='search'),
 ]
@@ -0,0 +1,124 @@
+import base64
+import heapq
+from datetime import date
+from itertools import islice
+
+from django.db.models import Q
+
+from api.models.application_models import Application
+from api.models.event_models import Event
+
+# Agenda entry types, in the order entries sharing a date are listed
+AGENDA_TYPES = ['submitted', 'decision', 'start', 'event']
+
+APPLICATION_DATE_FIELDS = {
+    'submitted': 'submitted_date',
+    'decision': 'decision_date',
+    'start': 'start_date',
+}
+
+AGENDA_PAGE_SIZE = 50
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(key):
+    day, type_index, pk = key
+    raw = f"{day.isoformat()}|{type_index}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        day, type_index, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return date.fromisoformat(day), int(type_index), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursor(cursor)
+
+
+def _after(field, type_index, cursor):
+    """Keyset condition for rows of one stream that sort after the cursor."""
+    if cursor is None:
+        return Q()
+    day, cursor_type, pk = cursor
+    if type_index < cursor_type:
+        return Q(**{f'{field}__gt': day})
+    if type_index > cursor_type:
+        return Q(**{f'{field}__gte': day})
+    return Q(**{f'{field}__gt': day}) | Q(**{field: day, 'id__gt': pk})
+
+
+def _stream(queryset, field, type_index, cursor, chunk_size, to_entry):
+    """
+    Yield ``(key, entry)`` pairs of one date-ordered stream, fetched lazily in
+    keyset chunks from the (user, date, id) index.
+    """
+    position = cursor
+    while True:
+        rows = list(queryset.filter(_after(field, type_index, position)).order_by(field, 'id')[:chunk_size])
+        for row in rows:
+            position = (row[field], type_index, row['id'])
+            yield position, to_entry(row)
+        if len(rows) < chunk_size:
+            return
+
+
+def agenda(user, start=None, end=None, cursor=None, limit=AGENDA_PAGE_SIZE):
+    """
+    The user's application dates and events in one chronological list.
+
+    Four streams (submission, decision and start dates of applications, and
+    events) are merged with a k-way heap merge. Each stream reads at most
+    ``limit + 1`` rows per chunk through its index, so nothing is loaded
+    beyond the page. Returns ``(entries, next_cursor)``.
+    """
+    cursor = decode_cursor(cursor) if cursor else None
+    streams = []
+
+    for type_name, field in APPLICATION_DATE_FIELDS.items():
+        queryset = Application.objects.filter(user=user, **{f'{field}__isnull': False})
+        if start:
+            queryset = queryset.filter(**{f'{field}__gte': start})
+        if end:
+            queryset = queryset.filter(**{f'{field}__lte': end})
+        queryset = queryset.values('id', field, 'program_name', 'status', 'institution_name')
+
+        def to_entry(row, type_name=type_name, field=field):
+            return {
+                'date': row[field],
+                'type': type_name,
+                'application': {
+                    'id': row['id'],
+                    'program_name': row['program_name'],
+                    'institution_name': row['institution_name'],
+                    'status': row['status'],
+                },
+            }
+        streams.append(_stream(queryset, field, AGENDA_TYPES.index(type_name), cursor, limit + 1, to_entry))
+
+    events = Event.objects.filter(user=user)
+    if start:
+        events = events.filter(event_date__gte=start)
+    if end:
+        events = events.filter(event_date__lte=end)
+    events = events.values('id', 'event_date', 'event_title', 'event_color', 'application_id')
+
+    def event_entry(row):
+        return {
+            'date': row['event_date'],
+            'type': 'event',
+            'event': {
+                'id': row['id'],
+                'title': row['event_title'],
+                'color': row['event_color'],
+                'application': row['application_id'],
+            },
+        }
+    streams.append(_stream(events, 'event_date', AGENDA_TYPES.index('event'), cursor, limit + 1, event_entry))
+
+    merged = list(islice(heapq.merge(*streams, key=lambda item: item[0]), limit + 1))
+    page = merged[:limit]
+    next_cursor = encode_cursor(page[-1][0]) if len(merged) > limit else None
+    return [entry for _, entry in page], next_cursor
@@ -0,0 +1,160 @@
+from django.db import transaction
+from django.utils import timezone
+
+from api.models.application_models import Application
+from api.serializers.application_serializers import ApplicationCreateSerializer, ApplicationDetailSerializer
+from api.utils.outcome_stats import outcome_snapshot, update_outcome_stats
+from api.utils.popularity import record_application
+from api.utils.program_catalogue import update_program_usage
+from api.utils.status_history import record_status_changes
+
+BATCH_OPERATIONS = ('create', 'update', 'delete')
+
+MAX_BATCH_OPERATIONS = 200
+
+# Mirrors ApplicationDeleteView
+DELETABLE_STATUSES = ('Draft', 'In Progress')
+
+
+def _is_id(pk):
+    # bool is a subclass of int, but true/false are not application ids
+    return isinstance(pk, int) and not isinstance(pk, bool)
+
+
+def _validate(operations, request):
+    """
+    Validate every operation without touching the database beyond reads.
+
+    The applications being updated or deleted are locked, so must be called
+    in the transaction that applies the batch. Returns one result dict per
+    operation; valid ones carry the state needed to apply them under the
+    ``_apply`` key.
+    """
+    user = request.user
+    ids = [op.get('id') for op in operations if isinstance(op, dict) and op.get('op') in ('update', 'delete')]
+    # Locked in id order, so overlapping batches can't deadlock
+    existing = {
+        application.pk: application
+        for application in Application.objects.filter(user=user, pk__in=[pk for pk in ids if _is_id(pk)])
+        .order_by('pk').select_for_update()
+    }
+
+    results = []
+    seen = set()
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict) or operation.get('op') not in BATCH_OPERATIONS:
+            results.append({'index': index, 'status': 'error',
+                            'errors': {'op': [f"Must be one of: {', '.join(BATCH_OPERATIONS)}."]}})
+            continue
+
+        op = operation['op']
+        result = {'index': index, 'op': op}
+        results.append(result)
+
+        if op == 'create':
+            serializer = ApplicationCreateSerializer(data=operation.get('data') or {}, context={'request': request})
+            if serializer.is_valid():
+                result.update(status='valid', _apply=serializer.validated_data)
+            else:
+                result.update(status='error', errors=serializer.errors)
+            continue
+
+        pk = operation.get('id')
+        result['id'] = pk
+        instance = existing.get(pk) if _is_id(pk) else None
+        if instance is None:
+            result.update(status='error', errors={'id': ["Application not found."]})
+        elif pk in seen:
+            result.update(status='error', errors={'id': ["Application appears in more than one operation."]})
+        elif op == 'delete':
+            if instance.status in DELETABLE_STATUSES:
+                result.update(status='valid', _apply=instance)
+            else:
+                result.update(status='error', errors={'status': [
+                    f"Cannot delete applications with status '{instance.status}'. "
+                    "Only Draft or In Progress applications can be deleted."
+                ]})
+        else:
+            serializer = ApplicationDetailSerializer(
+                instance, data=operation.get('data') or {}, partial=True, context={'request': request}
+            )
+            if serializer.is_valid():
+                result.update(status='valid', _apply=serializer.validated_data)
+            else:
+                result.update(status='error', errors=serializer.errors)
+        if _is_id(pk):
+            seen.add(pk)
+    return results, existing
+
+
+def _apply(results, existing, user):
+    """Apply validated operations with one bulk statement per operation type."""
+    now = timezone.now()
+    created, updated, update_fields, deleted = [], [], {'updated_at'}, []
+    added_programs, removed_programs, status_changes = [], [], []
+    added_outcomes, removed_outcomes = [], []
+
+    for result in results:
+        payload = result.pop('_apply')
+        if result['op'] == 'create':
+            application = Application(user=user, **payload)
+            created.append((result, application))
+            added_programs.append((application.institution_id, application.program_name, application.department))
+        elif result['op'] == 'update':
+            application = existing[result['id']]
+            before = (application.institution_id, application.program_name)
+            status_changes.append((application, application.status))
+            removed_outcomes.append(outcome_snapshot(application))
+            for field, value in payload.items():
+                setattr(application, field, value)
+            added_outcomes.append(outcome_snapshot(application))
+            application.updated_at = now
+            update_fields.update(payload)
+            updated.append(application)
+            if (application.institution_id, application.program_name) != before:
+                added_programs.append((application.institution_id, application.program_name, application.department))
+                removed_programs.append((*before, None))
+        else:
+            deleted.append(result['id'])
+
+    if created:
+        Application.objects.bulk_create([application for _, application in created])
+    if updated:
+        Application.objects.bulk_update(updated, sorted(update_fields), batch_size=500)
+    if deleted:
+        # Cascades to events and documents; post_delete keeps the catalogue in step
+        Application.objects.filter(user=user, pk__in=deleted).delete()
+    # bulk_create/bulk_update skip post_save, so the catalogue, the
+    # status history and the outcome rollups are updated here
+    update_program_usage(added=added_programs, removed=removed_programs)
+    status_changes += [(application, None) for _, application in created]
+    record_status_changes(status_changes, changed_at=now)
+    added_outcomes += [outcome_snapshot(application) for _, application in created]
+    update_outcome_stats(added=added_outcomes, removed=removed_outcomes)
+
+    for result, application in created:
+        result['id'] = application.pk
+        record_application(application.institution_id)
+    for result in results:
+        result['status'] = {'create': 'created', 'update': 'updated', 'delete': 'deleted'}[result['op']]
+    return results
+
+
+def apply_application_batch(operations, request):
+    """
+    Validate and apply a list of create/update/delete operations for the
+    requesting user, all or nothing.
+
+    Returns ``(applied, results)`` with one result per operation, in order.
+    When any operation is invalid nothing is applied and the valid ones are
+    reported as ``valid``. Validation and the writes share one transaction,
+    with the affected applications locked, so a concurrent change can't be
+    overwritten by, or slip past the checks of, the batch.
+    """
+    with transaction.atomic():
+        results, existing = _validate(operations, request)
+        if any(result['status'] == 'error' for result in results):
+            for result in results:
+                result.pop('_apply', None)
+            return False, results
+        return True, _apply(results, existing, request.user)
@@ -0,0 +1,111 @@
+import csv
+import json
+import tempfile
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from openpyxl import Workbook
+
+from api.models.application_models import Application
+from api.models.document_models import Document
+from api.models.event_models import Event
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_COLUMNS = (
+    'id', 'institution_id', 'institution_name', 'institution_country', 'institution_rank',
+    'institution_rank_number', 'program_name', 'degree_type', 'department', 'duration_years', 'tuition_fee',
+    'status', 'start_date', 'submitted_date', 'decision_date',
+    'application_link', 'scholarship_link', 'program_info_link', 'notes',
+    'event_count', 'document_count', 'created_at', 'updated_at',
+)
+
+# Export columns read from differently named query columns: the rank is
+# exported as published, the number copied onto applications next to it
+_COLUMN_SOURCES = {
+    'institution_rank': 'institution_rank_label',
+    'institution_rank_number': 'institution_rank',
+}
+
+# format -> (content type, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+
+def _count(model, user):
+    related = model.objects.filter(user=user, application=OuterRef('pk')).order_by()
+    return Coalesce(Subquery(related.values('application').annotate(count=Count('pk')).values('count')), 0)
+
+
+def export_rows(user):
+    """
+    The user's applications as dicts of EXPORT_COLUMNS, oldest first.
+
+    One query reads the institution columns copied onto applications, joins
+    the institution for its published rank and counts events and documents
+    with correlated subqueries; rows are read through a server-side cursor
+    so only one chunk is held in memory at a time.
+    """
+    rows = (
+        Application.objects.filter(user=user)
+        .annotate(
+            institution_rank_label=F('institution__rank'),
+            event_count=_count(Event, user),
+            document_count=_count(Document, user),
+        )
+        .order_by('id')
+        .values(*(_COLUMN_SOURCES.get(column, column) for column in EXPORT_COLUMNS))
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    for row in rows:
+        yield {column: row[_COLUMN_SOURCES.get(column, column)] for column in EXPORT_COLUMNS}
+
+
+class _Echo:
+    """File-like object whose write() hands back what csv.writer wrote."""
+    def write(self, value):
+        return value
+
+
+def _csv_chunks(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow(['' if row[column] is None else row[column] for column in EXPORT_COLUMNS])
+
+
+def _ndjson_chunks(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def _xlsx_chunks(rows, chunk_size=64 * 1024):
+    # XLSX is a zip archive written on save; write-only mode keeps rows out of
+    # memory until then, and the finished file is streamed from disk
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Applications')
+    sheet.append(EXPORT_COLUMNS)
+    for row in rows:
+        values = [row[column] for column in EXPORT_COLUMNS]
+        sheet.append([value.replace(tzinfo=None) if hasattr(value, 'tzinfo') and value.tzinfo else value
+                      for value in values])
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def stream_export(user, export_format):
+    """Chunks of the user's applications rendered in ``export_format``."""
+    rows = export_rows(user)
+    if export_format == 'csv':
+        return _csv_chunks(rows)
+    if export_format == 'xlsx':
+        return _xlsx_chunks(rows)
+    return _ndjson_chunks(rows)
@@ -0,0 +1,265 @@
+import codecs
+import csv
+import os
+import re
+import zipfile
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+from rest_framework.exceptions import ValidationError
+
+from api.models.application_models import Application
+from api.serializers.application_serializers import ApplicationImportSerializer
+from api.utils.outcome_stats import outcome_snapshot, update_outcome_stats
+from api.utils.popularity import record_application
+from api.utils.program_catalogue import update_program_usage
+from api.utils.status_history import record_status_changes
+
+IMPORT_CHUNK_SIZE = 500
+
+# Errors kept in the report; later ones are only counted
+MAX_REPORTED_ERRORS = 1000
+
+# Alternative spellings of column headers, after normalisation
+COLUMN_ALIASES = {
+    'institution_id': 'institution',
+    'institution_name': 'institution',
+    'university': 'institution',
+    'school': 'institution',
+    'program': 'program_name',
+    'programme': 'program_name',
+    'degree': 'degree_type',
+}
+
+IMPORT_COLUMNS = ('institution', 'country') + ApplicationImportSerializer.Meta.fields
+
+# Best institution per distinct (value, country) pair, by id or by name
+# similarity through the trigram index
+_MATCH_INSTITUTIONS_SQL = """
+    SELECT q.value, q.country, m.id, m.name, m.score
+    FROM unnest(%s::text[], %s::text[]) AS q (value, country)
+    CROSS JOIN LATERAL (
+        SELECT i.id, i.name,
+               CASE WHEN i.id = q.value THEN 1 ELSE similarity(i.name, q.value) END AS score
+        FROM institutions i
+        WHERE (i.id = q.value OR i.name %% q.value)
+          AND (q.country = '' OR lower(i.country) = lower(q.country))
+        ORDER BY score DESC, institution_rank_number(i.rank) NULLS LAST, i.id
+        LIMIT 1
+    ) AS m
+"""
+
+
+class ApplicationImportError(Exception):
+    pass
+
+
+def _normalize_header(header):
+    name = re.sub(r'\W+', '_', str(header or '').strip().lower()).strip('_')
+    return COLUMN_ALIASES.get(name, name)
+
+
+def _cell(value):
+    """Spreadsheet cell as the string the serializers expect, None when empty."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    value = str(value).strip()
+    return value or None
+
+
+def _xlsx_rows(file):
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except (InvalidFileException, zipfile.BadZipFile, KeyError):
+        raise ApplicationImportError("The file is not a valid XLSX workbook.")
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _csv_rows(file):
+    reader = csv.reader(codecs.iterdecode(file, 'utf-8-sig'))
+    try:
+        yield from reader
+    except UnicodeDecodeError:
+        raise ApplicationImportError("CSV files must be UTF-8 encoded.")
+    except csv.Error as exc:
+        raise ApplicationImportError(f"The CSV file could not be read past line {reader.line_num}: {exc}.")
+
+
+def _data_rows(rows, columns):
+    for line_number, values in enumerate(rows, start=2):
+        row = {}
+        for column, value in zip(columns, values):
+            value = _cell(value)
+            if column in IMPORT_COLUMNS and value is not None:
+                row[column] = value
+        if row:
+            yield line_number, row
+
+
+def read_rows(file, filename):
+    """
+    Stream ``(line_number, row_dict)`` pairs from a CSV or XLSX file.
+
+    The first row holds the column headers and is checked before returning;
+    blank rows are skipped.
+    """
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension == '.xlsx':
+        rows = _xlsx_rows(file)
+    elif extension == '.csv':
+        rows = _csv_rows(file)
+    else:
+        raise ApplicationImportError("Only .csv and .xlsx files can be imported.")
+
+    header = next(rows, None)
+    columns = [_normalize_header(value) for value in header or ()]
+    if 'institution' not in columns or 'program_name' not in columns:
+        raise ApplicationImportError("The first row must name the columns, including institution and program_name.")
+    return _data_rows(rows, columns)
+
+
+def match_institutions(keys):
+    """
+    Resolve ``(value, country)`` pairs to institutions in one query.
+
+    ``value`` is an institution id or name; names may be misspelt, in which
+    case the most similar name above ``APPLICATION_IMPORT_MATCH_THRESHOLD``
+    wins. Returns ``{key: (id, name, score)}`` for the pairs that matched.
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+    with connection.cursor() as cursor:
+        cursor.execute(_MATCH_INSTITUTIONS_SQL, [[value for value, _ in keys], [country for _, country in keys]])
+        return {
+            (value, country): (pk, name, score)
+            for value, country, pk, name, score in cursor.fetchall()
+            if score >= settings.APPLICATION_IMPORT_MATCH_THRESHOLD
+        }
+
+
+class _ImportReport:
+    def __init__(self, dry_run):
+        self.dry_run = dry_run
+        self.rows = 0
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+        self.fuzzy_matches = {}
+        self.stopped = None
+
+    def add_error(self, line_number, errors):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': line_number, 'errors': errors})
+
+    def as_dict(self):
+        return {
+            'rows': self.rows,
+            'created': self.created,
+            'failed': self.failed,
+            'dry_run': self.dry_run,
+            'stopped': self.stopped,
+            'errors': self.errors,
+            'errors_truncated': self.failed > len(self.errors),
+            'fuzzy_matches': [
+                {'value': value, 'country': country or None, 'institution': {'id': pk, 'name': name},
+                 'similarity': round(score, 2)}
+                for (value, country), (pk, name, score) in self.fuzzy_matches.items()
+            ],
+        }
+
+
+def _import_chunk(chunk, user, institutions, report):
+    """Validate one chunk of rows and insert the valid ones with one bulk insert."""
+    keys = {(row['institution'], row.get('country', '')) for _, row in chunk if 'institution' in row}
+    institutions.update(match_institutions(keys - institutions.keys()))
+
+    # One serializer for the whole chunk, as ListSerializer does, so its
+    # fields are built once rather than per row
+    serializer = ApplicationImportSerializer()
+    applications = []
+    for line_number, row in chunk:
+        try:
+            data, errors = serializer.run_validation(row), {}
+        except ValidationError as exc:
+            data, errors = None, dict(exc.detail)
+        key = (row.get('institution'), row.get('country', ''))
+        if key[0] is None:
+            errors['institution'] = ["This field is required."]
+        elif key not in institutions:
+            errors['institution'] = [f"No institution matches '{key[0]}'."]
+        if errors:
+            report.add_error(line_number, errors)
+            continue
+
+        pk, name, score = institutions[key]
+        if pk != key[0] and name.lower() != key[0].lower():
+            report.fuzzy_matches[key] = (pk, name, score)
+        applications.append(Application(user=user, institution_id=pk, **data))
+
+    if report.dry_run or not applications:
+        report.created += len(applications)
+        return
+
+    now = timezone.now()
+    with transaction.atomic():
+        Application.objects.bulk_create(applications)
+        # bulk_create skips post_save, so the catalogue, the status history
+        # and the outcome rollups are updated here
+        update_program_usage(added=[
+            (application.institution_id, application.program_name, application.department)
+            for application in applications
+        ])
+        record_status_changes([(application, None) for application in applications], changed_at=now)
+        update_outcome_stats(added=[outcome_snapshot(application) for application in applications])
+    for application in applications:
+        record_application(application.institution_id)
+    report.created += len(applications)
+
+
+def import_applications(file, filename, user, dry_run=False, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Import applications for ``user`` from a CSV or XLSX file.
+
+    Rows are streamed from the file and handled ``chunk_size`` at a time:
+    the chunk's institutions are resolved in one query, every row is
+    validated, and the valid rows are inserted with one bulk insert, so
+    memory use doesn't grow with the file. Invalid rows are skipped and
+    reported by line number. With ``dry_run`` nothing is written.
+
+    Raises ApplicationImportError when the file can't be read at all. When
+    reading fails part way, or the file has more than
+    ``APPLICATION_IMPORT_MAX_ROWS`` rows, the rows read so far are kept and
+    ``stopped`` in the report says why the rest weren't.
+    """
+    rows = read_rows(file, filename)
+    report = _ImportReport(dry_run)
+    institutions = {}
+    chunk = []
+    try:
+        for line_number, row in rows:
+            if report.rows >= settings.APPLICATION_IMPORT_MAX_ROWS:
+                report.stopped = f"Only the first {settings.APPLICATION_IMPORT_MAX_ROWS} rows are imported."
+                break
+            report.rows += 1
+            chunk.append((line_number, row))
+            if len(chunk) >= chunk_size:
+                _import_chunk(chunk, user, institutions, report)
+                chunk = []
+    except ApplicationImportError as error:
+        report.stopped = str(error)
+    if chunk:
+        _import_chunk(chunk, user, institutions, report)
+    return report.as_dict()
@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+
+from django.db import connection
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from api.models.application_models import Application
+
+# Statuses still waiting on the applicant or the institution
+OPEN_STATUSES = ['Draft', 'In Progress', 'Pending', 'Deferred']
+
+# Start dates of these applications are the deadlines the dashboard counts down to
+DEADLINE_STATUSES = ['Draft', 'In Progress', 'Pending']
+
+DEADLINE_WINDOWS = [30, 60, 90]
+
+# One row per month and event; created/submitted/decided dates are folded
+# into a single scan of the user's applications
+_MONTHLY_SQL = """
+    SELECT date_trunc('month', event.day)::date AS month,
+           count(*) FILTER (WHERE event.kind = 'created') AS created,
+           count(*) FILTER (WHERE event.kind = 'submitted') AS submitted,
+           count(*) FILTER (WHERE event.kind = 'decided') AS decided
+    FROM applications a
+    CROSS JOIN LATERAL (VALUES
+        ('created', (a.created_at AT TIME ZONE 'UTC')::date),
+        ('submitted', a.submitted_date),
+        ('decided', a.decision_date)
+    ) AS event (kind, day)
+    WHERE a.user_id = %s AND event.day >= %s AND event.day < %s
+    GROUP BY 1
+    ORDER BY 1
+"""
+
+
+def _month_start(day, months_back=0):
+    month = day.year * 12 + day.month - 1 - months_back
+    return date(month // 12, month % 12 + 1, 1)
+
+
+def application_stats(user, months=12, today=None):
+    """
+    Dashboard statistics for one user's applications in two queries.
+
+    Counts by status and degree type, acceptance figures and upcoming
+    deadline windows come from one conditional aggregate. The monthly
+    created/submitted/decided histogram covering the last ``months``
+    months comes from one grouped query.
+    """
+    today = today or timezone.localdate()
+    applications = Application.objects.filter(user=user)
+
+    statuses = [value for value, _ in Application.STATUS_CHOICES]
+    degree_types = [value for value, _ in Application.DEGREE_TYPE_CHOICES]
+    aggregates = {'total': Count('pk')}
+    aggregates.update({
+        f'status_{i}': Count('pk', filter=Q(status=value)) for i, value in enumerate(statuses)
+    })
+    aggregates.update({
+        f'degree_{i}': Count('pk', filter=Q(degree_type=value)) for i, value in enumerate(degree_types)
+    })
+    aggregates.update({
+        f'deadline_{days}': Count('pk', filter=Q(
+            status__in=DEADLINE_STATUSES, start_date__gt=today, start_date__lte=today + timedelta(days=days)
+        ))
+        for days in DEADLINE_WINDOWS
+    })
+    counts = applications.aggregate(**aggregates)
+
+    by_status = {value: counts[f'status_{i}'] for i, value in enumerate(statuses)}
+    decided = by_status['Accepted'] + by_status['Rejected']
+
+    first_month = _month_start(today, months - 1)
+    with connection.cursor() as cursor:
+        cursor.execute(_MONTHLY_SQL, [user.pk, first_month, _month_start(today, -1)])
+        rows = {month: (created, submitted, decided_count) for month, created, submitted, decided_count in cursor.fetchall()}
+
+    monthly = []
+    for offset in range(months - 1, -1, -1):
+        month = _month_start(today, offset)
+        created, submitted, decided_count = rows.get(month, (0, 0, 0))
+        monthly.append({
+            'month': month.strftime('%Y-%m'),
+            'created': created,
+            'submitted': submitted,
+            'decided': decided_count,
+        })
+
+    return {
+        'total': counts['total'],
+        'by_status': by_status,
+        'by_degree_type': {value: counts[f'degree_{i}'] for i, value in enumerate(degree_types)},
+        'open': sum(by_status[value] for value in OPEN_STATUSES),
+        'acceptance_rate': round(by_status['Accepted'] / decided * 100) if decided else None,
+        'upcoming_deadlines': {f'next_{days}_days': counts[f'deadline_{days}'] for days in DEADLINE_WINDOWS},
+        'monthly': monthly,
+    }
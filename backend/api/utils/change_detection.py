@@ -0,0 +1,116 @@
+from django.db import connection, transaction
+
+from api.models.institution_models import METRIC_MODELS
+
+METRIC_TABLES = [model._meta.db_table for model in METRIC_MODELS]
+
+# One jsonb document per institution covering all 11 tables. jsonb stores keys
+# in a canonical order, so its text form hashes identically for equal content.
+_CONTENT_SQL = """
+    CREATE TEMPORARY TABLE institution_content ON COMMIT DROP AS
+    SELECT id AS institution_id, data, md5(data::text) AS content_hash
+    FROM (
+        SELECT
+            i.id,
+            jsonb_build_object(
+                'name', i.name,
+                'country', i.country,
+                'rank', i.rank,
+                'overall_score', i.overall_score,
+                'web_links', i.web_links,
+                'classification', jsonb_build_array(c.size, c.focus, c.research),
+                {metric_fields}
+            ) AS data
+        FROM institutions i
+        LEFT JOIN classification c ON c.institution_id = i.id
+        {metric_joins}
+    ) content
+""".format(
+    metric_fields=',\n                '.join(
+        f"'{table}', jsonb_build_array({table}.score, {table}.rank)" for table in METRIC_TABLES
+    ),
+    metric_joins='\n        '.join(
+        f"LEFT JOIN {table} ON {table}.institution_id = i.id" for table in METRIC_TABLES
+    ),
+)
+
+_RECORD_CHANGES_SQL = """
+    INSERT INTO institution_changes (
+        user_id, institution_id, dataset_version, previous_rank, current_rank,
+        previous_score, current_score, changed_fields, detected_at, seen
+    )
+    SELECT
+        w.user_id,
+        changed.institution_id,
+        %(version)s,
+        changed.old_data ->> 'rank',
+        changed.new_data ->> 'rank',
+        changed.old_data ->> 'overall_score',
+        changed.new_data ->> 'overall_score',
+        changed.changed_fields,
+        now(),
+        false
+    FROM (
+        SELECT
+            cur.institution_id,
+            snap.data AS old_data,
+            cur.data AS new_data,
+            (
+                SELECT COALESCE(jsonb_agg(field.key ORDER BY field.key), '[]'::jsonb)
+                FROM jsonb_each(cur.data) AS field
+                WHERE field.value IS DISTINCT FROM snap.data -> field.key
+            ) AS changed_fields
+        FROM institution_content cur
+        JOIN institution_snapshots snap ON snap.institution_id = cur.institution_id
+        WHERE snap.content_hash <> cur.content_hash
+          AND EXISTS (SELECT 1 FROM institution_watches w WHERE w.institution_id = cur.institution_id)
+    ) changed
+    JOIN institution_watches w ON w.institution_id = changed.institution_id
+"""
+
+_COUNT_CHANGED_SQL = """
+    SELECT count(*)
+    FROM institution_content cur
+    LEFT JOIN institution_snapshots snap ON snap.institution_id = cur.institution_id
+    WHERE snap.content_hash IS DISTINCT FROM cur.content_hash
+"""
+
+_UPDATE_SNAPSHOTS_SQL = """
+    INSERT INTO institution_snapshots (institution_id, content_hash, data, dataset_version)
+    SELECT institution_id, content_hash, data, %(version)s FROM institution_content
+    ON CONFLICT (institution_id) DO UPDATE SET
+        content_hash = EXCLUDED.content_hash,
+        data = EXCLUDED.data,
+        dataset_version = EXCLUDED.dataset_version
+    WHERE institution_snapshots.content_hash <> EXCLUDED.content_hash
+"""
+
+_PRUNE_SNAPSHOTS_SQL = """
+    DELETE FROM institution_snapshots snap
+    WHERE NOT EXISTS (
+        SELECT 1 FROM institution_content cur WHERE cur.institution_id = snap.institution_id
+    )
+"""
+
+
+def detect_institution_changes(version):
+    """
+    Compare the imported institution dataset with the last snapshot and
+    record one change per watcher of every institution whose content changed.
+
+    Everything runs as a handful of set-based statements, so the cost does not
+    grow with the number of watchers beyond the size of the insert. The first
+    run only records the baseline snapshot.
+
+    Returns a (changed_institutions, change_records) tuple.
+    """
+    params = {'version': version}
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(_CONTENT_SQL)
+        cursor.execute(_COUNT_CHANGED_SQL)
+        changed_institutions = cursor.fetchone()[0]
+        cursor.execute(_RECORD_CHANGES_SQL, params)
+        change_records = cursor.rowcount
+        cursor.execute(_UPDATE_SNAPSHOTS_SQL, params)
+        cursor.execute(_PRUNE_SNAPSHOTS_SQL)
+    return changed_institutions, change_records
@@ -0,0 +1,12 @@
+from django.db import connection
+
+
+def refresh_country_stats():
+    """
+    Rebuild the ``country_stats`` materialized view.
+
+    The refresh runs concurrently, so country pages keep reading the previous
+    rollup until the new one is ready.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY country_stats")
@@ -0,0 +1,366 @@
+import csv
+import hashlib
+import logging
+import os
+import re
+import time
+
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+
+from api.models.institution_models import METRIC_MODELS
+from api.utils.dataset_version import bump_dataset_version
+
+logger = logging.getLogger(__name__)
+
+# The tables one dataset import replaces, referenced tables first
+DATASET_TABLES = ['institutions', 'classification'] + [model._meta.db_table for model in METRIC_MODELS]
+
+# Materialized views built from the dataset tables; rebuilt after every swap
+DEPENDENT_VIEWS = ['country_stats']
+
+SHADOW = 'next'
+PREVIOUS = 'prev'
+# Suffix the generation being replaced is renamed to inside the swap, so it
+# is only dropped once the swap has committed
+RETIRED = 'old'
+
+LOCK_NOT_AVAILABLE = '55P03'
+
+_INDEX_DEF = re.compile(r'^(CREATE (?:UNIQUE )?INDEX )(\S+)( ON (?:ONLY )?)(\S+)')
+_REFERENCES = re.compile(r'REFERENCES (\S+?)\(')
+
+
+class DatasetSwapError(Exception):
+    pass
+
+
+def generation_name(name, suffix):
+    """Name of ``name``'s counterpart in another generation, kept within Postgres' 63 characters."""
+    candidate = f"{name}_{suffix}"
+    if len(candidate) <= 63:
+        return candidate
+    digest = hashlib.md5(name.encode()).hexdigest()[:7]
+    return f"{name[:62 - len(suffix) - 8]}_{digest}_{suffix}"
+
+
+def _fetch(cursor, sql, params=None):
+    cursor.execute(sql, params)
+    return cursor.fetchall()
+
+
+def _table_exists(cursor, table):
+    return _fetch(cursor, "SELECT to_regclass(%s) IS NOT NULL", [table])[0][0]
+
+
+def _constraints(cursor, table):
+    """Primary key, unique and foreign key constraints as (name, type, definition)."""
+    return _fetch(cursor, """
+        SELECT conname, contype, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = %s::regclass AND contype IN ('p', 'u', 'f')
+        ORDER BY contype DESC, conname
+    """, [table])
+
+
+def _indexes(cursor, table):
+    """Indexes that don't back a constraint, as (name, definition)."""
+    return _fetch(cursor, """
+        SELECT i.relname, pg_get_indexdef(x.indexrelid)
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        WHERE x.indrelid = %s::regclass
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint c
+              WHERE c.conindid = x.indexrelid AND c.conrelid = x.indrelid
+          )
+        ORDER BY i.relname
+    """, [table])
+
+
+def _external_foreign_keys(cursor):
+    """
+    Foreign keys from outside the dataset (applications, watchlists, ...)
+    into it, as (table, name, definition, column, referenced table, referenced column).
+    """
+    return _fetch(cursor, """
+        SELECT c.conrelid::regclass::text, c.conname, pg_get_constraintdef(c.oid),
+               a.attname, c.confrelid::regclass::text, fa.attname
+        FROM pg_constraint c
+        JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = c.conkey[1]
+        JOIN pg_attribute fa ON fa.attrelid = c.confrelid AND fa.attnum = c.confkey[1]
+        WHERE c.contype = 'f'
+          AND c.confrelid = ANY(%s::regclass[])
+          AND NOT c.conrelid = ANY(%s::regclass[])
+        ORDER BY 1, 2
+    """, [DATASET_TABLES, DATASET_TABLES])
+
+
+def _drop_generation(cursor, suffix):
+    tables = [generation_name(table, suffix) for table in DATASET_TABLES]
+    cursor.execute(f"DROP TABLE IF EXISTS {', '.join(tables)}")
+
+
+def _retired_tables(suffix):
+    return [generation_name(generation_name(table, suffix), RETIRED) for table in DATASET_TABLES]
+
+
+def _retire_generation(cursor, suffix):
+    """
+    Rename the ``_<suffix>`` generation, with its keys and indexes, out of
+    the way under ``_old`` names, freeing its names for the swap. Renames
+    are transactional, so a failed swap leaves the generation in place.
+    """
+    for table in DATASET_TABLES:
+        source = generation_name(table, suffix)
+        if not _table_exists(cursor, source):
+            continue
+        for name, *_ in _constraints(cursor, source):
+            cursor.execute(f"ALTER TABLE {source} RENAME CONSTRAINT {name} TO {generation_name(name, RETIRED)}")
+        for name, _ in _indexes(cursor, source):
+            cursor.execute(f"ALTER INDEX {name} RENAME TO {generation_name(name, RETIRED)}")
+        cursor.execute(f"ALTER TABLE {source} RENAME TO {generation_name(source, RETIRED)}")
+
+
+def prepare_shadow_tables(csv_dir=None, copy_live=False):
+    """
+    Create empty ``<table>_next`` shadow tables shaped like the live ones.
+
+    Shadows start without indexes or keys so they load quickly. They are
+    filled from ``<table>.csv`` files in ``csv_dir`` (header row required),
+    from the live tables with ``copy_live``, or left for an external loader.
+    Returns the number of rows loaded per table.
+    """
+    loaded = {}
+    with transaction.atomic(), connection.cursor() as cursor:
+        _drop_generation(cursor, SHADOW)
+        for table in DATASET_TABLES:
+            shadow = generation_name(table, SHADOW)
+            cursor.execute(f"CREATE TABLE {shadow} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+            if copy_live:
+                cursor.execute(f"INSERT INTO {shadow} SELECT * FROM {table}")
+                loaded[table] = cursor.rowcount
+            elif csv_dir:
+                path = os.path.join(csv_dir, f"{table}.csv")
+                if not os.path.exists(path):
+                    raise DatasetSwapError(f"Missing {path}")
+                with open(path, newline='', encoding='utf-8') as f:
+                    columns = ', '.join(connection.ops.quote_name(c) for c in next(csv.reader(f)))
+                    f.seek(0)
+                    cursor.copy_expert(
+                        f"COPY {shadow} ({columns}) FROM STDIN WITH (FORMAT csv, HEADER true)", f
+                    )
+                cursor.execute(f"SELECT count(*) FROM {shadow}")
+                loaded[table] = cursor.fetchone()[0]
+    return loaded
+
+
+def _build_shadow_indexes(cursor):
+    """
+    Give every shadow table the live table's keys and indexes under
+    ``_next`` names, then ANALYZE it. Objects that already exist are kept,
+    so an interrupted swap can simply be run again.
+    """
+    shadows = {table: generation_name(table, SHADOW) for table in DATASET_TABLES}
+    for table in DATASET_TABLES:
+        shadow = shadows[table]
+        existing = {row[0] for row in _constraints(cursor, shadow)}
+        existing |= {row[0] for row in _indexes(cursor, shadow)}
+        # Referenced tables come first and keys before foreign keys, so every
+        # foreign key finds its referenced unique index
+        for name, _, definition in _constraints(cursor, table):
+            shadow_name = generation_name(name, SHADOW)
+            if shadow_name in existing:
+                continue
+            definition = _REFERENCES.sub(
+                lambda m: f"REFERENCES {shadows.get(m.group(1).split('.')[-1], m.group(1))}(", definition
+            )
+            cursor.execute(f"ALTER TABLE {shadow} ADD CONSTRAINT {shadow_name} {definition}")
+        for name, definition in _indexes(cursor, table):
+            shadow_name = generation_name(name, SHADOW)
+            if shadow_name not in existing:
+                cursor.execute(_INDEX_DEF.sub(rf'\g<1>{shadow_name}\g<3>{shadow}', definition))
+        cursor.execute(f"ANALYZE {shadow}")
+
+
+def _with_lock_retries(operation):
+    """
+    Run ``operation(cursor)`` in a transaction that gives up on locks after
+    DATASET_SWAP_LOCK_TIMEOUT and retries.
+
+    A waiting ACCESS EXCLUSIVE request queues every later reader behind it,
+    so the swap backs off instead of holding up the directory behind a long
+    running query.
+    """
+    lock_timeout = getattr(settings, 'DATASET_SWAP_LOCK_TIMEOUT', '2s')
+    retries = getattr(settings, 'DATASET_SWAP_LOCK_RETRIES', 10)
+    for attempt in range(1, retries + 1):
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("SET LOCAL lock_timeout = %s", [lock_timeout])
+                return operation(cursor)
+        except OperationalError as exc:
+            if getattr(exc.__cause__, 'pgcode', None) != LOCK_NOT_AVAILABLE or attempt == retries:
+                raise
+            logger.info("Dataset swap waiting for locks (attempt %s of %s)", attempt, retries)
+            time.sleep(min(attempt, 5))
+
+
+def _missing_references(cursor, foreign_keys, incoming):
+    """Rows outside the dataset that would point at nothing after the swap, per foreign key."""
+    missing = {}
+    for table, name, _, column, referenced, referenced_column in foreign_keys:
+        target = generation_name(referenced.split('.')[-1], incoming)
+        cursor.execute(f"""
+            SELECT count(*) FROM {table} t
+            WHERE t.{column} IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM {target} n WHERE n.{referenced_column} = t.{column})
+        """)
+        count = cursor.fetchone()[0]
+        if count:
+            missing[f"{table}.{column}"] = count
+    return missing
+
+
+def _check_references(cursor, foreign_keys, incoming):
+    missing = _missing_references(cursor, foreign_keys, incoming)
+    if missing:
+        details = ', '.join(f"{count} in {column}" for column, count in missing.items())
+        raise DatasetSwapError(f"The incoming dataset is missing institutions still referenced: {details}")
+
+
+def _swap_generations(incoming, outgoing):
+    """
+    Swap the ``<table>_<incoming>`` generation in for the live tables, which
+    become ``<table>_<outgoing>``.
+
+    Any existing ``_<outgoing>`` generation is renamed aside inside the
+    swap and only dropped once the swap has committed, so a swap that fails
+    leaves it available for rollback. Only renames run while the locks are
+    held, so the swap takes milliseconds regardless of dataset size. Foreign
+    keys into the dataset are re-pointed at the new tables as NOT VALID
+    inside the swap and validated afterwards without blocking writers.
+    """
+    with connection.cursor() as cursor:
+        foreign_keys = _external_foreign_keys(cursor)
+        _check_references(cursor, foreign_keys, incoming)
+        # Left over from a swap that stopped before cleaning up
+        cursor.execute(f"DROP TABLE IF EXISTS {', '.join(_retired_tables(outgoing))}")
+        views = {
+            view: (
+                _fetch(cursor, "SELECT definition FROM pg_matviews WHERE matviewname = %s", [view])[0][0],
+                _indexes(cursor, view),
+            )
+            for view in DEPENDENT_VIEWS
+        }
+
+    def swap(cursor):
+        live = DATASET_TABLES
+        incoming_tables = [generation_name(table, incoming) for table in live]
+        referencing = sorted({row[0] for row in foreign_keys})
+        cursor.execute(
+            f"LOCK TABLE {', '.join(live + incoming_tables + referencing)} IN ACCESS EXCLUSIVE MODE"
+        )
+        # Checked again under the locks: nothing can add a reference now
+        _check_references(cursor, foreign_keys, incoming)
+
+        for table, name, *_ in foreign_keys:
+            cursor.execute(f"ALTER TABLE {table} DROP CONSTRAINT {name}")
+
+        _retire_generation(cursor, outgoing)
+        objects = {
+            table: (
+                [row[0] for row in _constraints(cursor, table)],
+                [row[0] for row in _indexes(cursor, table)],
+            )
+            for table in live
+        }
+        for from_suffix, to_suffix in ((None, outgoing), (incoming, None)):
+            for table, (constraint_names, index_names) in objects.items():
+                source = generation_name(table, from_suffix) if from_suffix else table
+                target = generation_name(table, to_suffix) if to_suffix else table
+                for name in constraint_names:
+                    cursor.execute(
+                        f"ALTER TABLE {source} RENAME CONSTRAINT "
+                        f"{generation_name(name, from_suffix) if from_suffix else name} "
+                        f"TO {generation_name(name, to_suffix) if to_suffix else name}"
+                    )
+                for name in index_names:
+                    cursor.execute(
+                        f"ALTER INDEX {generation_name(name, from_suffix) if from_suffix else name} "
+                        f"RENAME TO {generation_name(name, to_suffix) if to_suffix else name}"
+                    )
+                cursor.execute(f"ALTER TABLE {source} RENAME TO {target}")
+
+        for table, name, definition, *_ in foreign_keys:
+            cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition} NOT VALID")
+
+    _with_lock_retries(swap)
+
+    with connection.cursor() as cursor:
+        for table, name, *_ in foreign_keys:
+            cursor.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+    _rebuild_views(views)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {', '.join(_retired_tables(outgoing))}")
+
+
+def _rebuild_views(views):
+    """
+    Recreate dependent materialized views on the new live tables.
+
+    Views bind to tables, not names, so after a swap they still read the old
+    generation. Each is rebuilt next to the live one and swapped in by name.
+    Definitions are captured before the swap, while they still name the live tables.
+    """
+    for view, (definition, indexes) in views.items():
+        shadow = generation_name(view, SHADOW)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP MATERIALIZED VIEW IF EXISTS {shadow}")
+            cursor.execute(f"CREATE MATERIALIZED VIEW {shadow} AS {definition.rstrip().rstrip(';')}")
+            for name, index_definition in indexes:
+                cursor.execute(
+                    _INDEX_DEF.sub(rf'\g<1>{generation_name(name, SHADOW)}\g<3>{shadow}', index_definition)
+                )
+
+        def swap(cursor, view=view, shadow=shadow, indexes=indexes):
+            cursor.execute(f"DROP MATERIALIZED VIEW {view}")
+            cursor.execute(f"ALTER MATERIALIZED VIEW {shadow} RENAME TO {view}")
+            for name, _ in indexes:
+                cursor.execute(f"ALTER INDEX {generation_name(name, SHADOW)} RENAME TO {name}")
+
+        _with_lock_retries(swap)
+
+
+def swap_in_shadow_tables():
+    """
+    Index and analyze the ``_next`` shadow tables and swap them in.
+
+    The replaced tables are kept as ``<table>_prev`` for rollback_dataset(),
+    and the dataset version is bumped so caches and post-import work pick
+    up the new data.
+    """
+    with connection.cursor() as cursor:
+        if not _table_exists(cursor, generation_name('institutions', SHADOW)):
+            raise DatasetSwapError("No shadow tables to swap in; prepare them first")
+        cursor.execute(f"SELECT count(*) FROM {generation_name('institutions', SHADOW)}")
+        if not cursor.fetchone()[0]:
+            raise DatasetSwapError("The shadow institutions table is empty")
+        _build_shadow_indexes(cursor)
+
+    _swap_generations(incoming=SHADOW, outgoing=PREVIOUS)
+    return bump_dataset_version()
+
+
+def rollback_dataset():
+    """
+    Swap the previous generation back in. The rolled back tables become
+    ``<table>_next``, replacing any prepared shadow tables.
+    """
+    with connection.cursor() as cursor:
+        if not _table_exists(cursor, generation_name('institutions', PREVIOUS)):
+            raise DatasetSwapError("There is no previous dataset to roll back to")
+
+    _swap_generations(incoming=PREVIOUS, outgoing=SHADOW)
+    return bump_dataset_version()
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from api.models.dataset_models import DatasetVersion
+from api.signals import dataset_imported
+
+_lock = threading.Lock()
+_cached_version = None
+_checked_at = 0.0
+
+
+def get_dataset_version():
+    """
+    Return the current institution dataset version.
+
+    The value is read from the database at most once every
+    DATASET_VERSION_CHECK_INTERVAL seconds per process, so hot paths can call
+    this on every request without adding a query.
+    """
+    global _cached_version, _checked_at
+
+    interval = getattr(settings, 'DATASET_VERSION_CHECK_INTERVAL', 5)
+    now = time.monotonic()
+    if _cached_version is not None and now - _checked_at < interval:
+        return _cached_version
+
+    version = DatasetVersion.objects.filter(pk=1).values_list('version', flat=True).first()
+    with _lock:
+        _cached_version = version or 0
+        _checked_at = now
+    return _cached_version
+
+
+def bump_dataset_version():
+    """
+    Mark the institution dataset as changed.
+
+    Increments the shared version row and sends ``dataset_imported`` once the
+    surrounding transaction commits, so post-import work only ever sees the
+    new data.
+    """
+    global _cached_version
+
+    with transaction.atomic():
+        updated = DatasetVersion.objects.filter(pk=1).update(
+            version=F('version') + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            DatasetVersion.objects.create(pk=1, version=2)
+        version = DatasetVersion.objects.values_list('version', flat=True).get(pk=1)
+
+    # Don't wait for the check interval to notice our own bump
+    with _lock:
+        _cached_version = None
+
+    transaction.on_commit(
+        lambda: dataset_imported.send(sender=DatasetVersion, version=version)
+    )
+    return version
@@ -0,0 +1,125 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+from api.utils.dataset_version import get_dataset_version
+
+# Query parameters that change which institutions are returned, or their order.
+# Pagination parameters only slice the cached id list and are left out of the key.
+FILTER_PARAMS = ('country', 'rank', 'rank_gte', 'rank_lte', 'research', 'size', 'focus')
+INTEGER_PARAMS = ('rank', 'rank_gte', 'rank_lte')
+
+
+def normalize_params(query_params):
+    """
+    Directory filter values exactly as the view applies them.
+
+    Values are trimmed, empty ones dropped and rank bounds parsed as integers
+    (invalid ones dropped), so the cache key and the queryset are always
+    built from the same values.
+    """
+    params = {}
+    for name in FILTER_PARAMS:
+        value = (query_params.get(name) or '').strip()
+        if not value:
+            continue
+        if name in INTEGER_PARAMS:
+            try:
+                value = int(value)
+            except ValueError:
+                continue
+        params[name] = value
+    return params
+
+
+def make_cache_key(query_params):
+    """
+    Build a canonical cache key from directory query parameters.
+
+    Filters are sorted and normalised by ``normalize_params``, and the search
+    term is lower-cased with whitespace collapsed, since SearchFilter matches
+    case-insensitively on whitespace-separated terms.
+    """
+    filters = [(name, str(value)) for name, value in normalize_params(query_params).items()]
+    search = ' '.join((query_params.get('search') or '').lower().replace(',', ' ').split())
+    ordering = (query_params.get('ordering') or '').strip()
+    return (tuple(sorted(filters)), search, ordering)
+
+
+def cache_key_params(key):
+    """Turn a cache key back into query parameters that reproduce it."""
+    filters, search, ordering = key
+    params = dict(filters)
+    if search:
+        params['search'] = search
+    if ordering:
+        params['ordering'] = ordering
+    return params
+
+
+class DirectoryResultCache:
+    """
+    Bounded LRU cache of ordered institution id lists for directory queries.
+
+    Each process keeps its own copy. The whole cache is dropped as soon as the
+    institution dataset version changes, and the process then refills its own
+    copy with the most popular queries in the background.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def _check_version(self):
+        """Drop every entry if the dataset changed; returns whether it did."""
+        version = get_dataset_version()
+        if version == self._version:
+            return False
+        self._entries.clear()
+        self._version = version
+        return True
+
+    def _prewarm(self):
+        if getattr(settings, 'DIRECTORY_PREWARM_QUERIES', 25):
+            # Refill with the most popular queries for the new dataset
+            from api.utils.search_analytics import prewarm_in_background
+            prewarm_in_background()
+
+    def get(self, key):
+        with self._lock:
+            changed = self._check_version()
+            ids = self._entries.get(key)
+            if ids is not None:
+                self._entries.move_to_end(key)
+        if changed:
+            self._prewarm()
+        return ids
+
+    def set(self, key, ids, version):
+        """
+        Store the ids of a query run against dataset ``version``, read before
+        the query started. Results of a dataset that has since been replaced
+        are not stored.
+        """
+        with self._lock:
+            changed = self._check_version()
+            if version == self._version:
+                self._entries[key] = tuple(ids)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        if changed:
+            self._prewarm()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+directory_cache = DirectoryResultCache(getattr(settings, 'DIRECTORY_CACHE_SIZE', 256))
@@ -0,0 +1,111 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F, Value
+from django.db.models.functions import Replace
+
+from api.models.application_models import Application
+from api.models.event_models import Event
+
+# Text search configuration the search_vector triggers use
+SEARCH_CONFIG = 'english'
+
+SEARCH_PAGE_SIZE = 20
+
+_MARKS = {'start_sel': '<mark>', 'stop_sel': '</mark>'}
+
+# Same replacements as html.escape, ampersand first
+_HTML_ESCAPES = [('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '&quot;'), ("'", '&#x27;')]
+
+
+def _escaped(field):
+    """
+    The field's text, HTML-escaped before it is highlighted, so the only
+    markup in a highlight is the ``<mark>`` tags. The text search parser reads
+    the entities as single tokens, so matching is unaffected.
+    """
+    expression = F(field)
+    for char, entity in _HTML_ESCAPES:
+        expression = Replace(expression, Value(char), Value(entity))
+    return expression
+
+
+def _title_highlight(field, query):
+    return SearchHeadline(_escaped(field), query, config=SEARCH_CONFIG, highlight_all=True, **_MARKS)
+
+
+def _notes_highlight(field, query):
+    return SearchHeadline(_escaped(field), query, config=SEARCH_CONFIG, max_fragments=2, min_words=5, max_words=20,
+                          fragment_delimiter=' … ', **_MARKS)
+
+
+def search_user_records(user, text, limit=SEARCH_PAGE_SIZE):
+    """
+    Full-text search over the user's applications and events, best matches first.
+
+    Matching uses the trigger-maintained ``search_vector`` columns through the
+    (user, search_vector) GIN indexes, so notes are never scanned. ``text``
+    accepts web search syntax ("quoted phrases", -excluded, or). Highlights
+    (HTML-escaped text with matches wrapped in ``<mark>``) are computed for
+    the returned rows only.
+    """
+    query = SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG)
+
+    applications = (
+        Application.objects.filter(user=user, search_vector=query)
+        .annotate(rank=SearchRank(F('search_vector'), query))
+        .order_by('-rank', '-id')
+        .values('id', 'program_name', 'degree_type', 'status', 'institution_id', 'institution_name',
+                'rank')[:limit]
+    )
+    events = (
+        Event.objects.filter(user=user, search_vector=query)
+        .annotate(rank=SearchRank(F('search_vector'), query))
+        .order_by('-rank', '-id')
+        .values('id', 'event_title', 'event_date', 'application_id', 'rank')[:limit]
+    )
+    applications, events = list(applications), list(events)
+
+    # Second pass for the highlights, so ts_headline only re-parses what is returned
+    application_highlights = {
+        pk: {'program_name': program_name, 'institution_name': institution_name, 'notes': notes}
+        for pk, program_name, institution_name, notes in
+        Application.objects.filter(pk__in=[row['id'] for row in applications]).values_list(
+            'id',
+            _title_highlight('program_name', query),
+            _title_highlight('institution_name', query),
+            _notes_highlight('notes', query),
+        )
+    } if applications else {}
+    event_highlights = {
+        pk: {'title': title, 'notes': notes}
+        for pk, title, notes in Event.objects.filter(pk__in=[row['id'] for row in events]).values_list(
+            'id',
+            _title_highlight('event_title', query),
+            _notes_highlight('notes', query),
+        )
+    } if events else {}
+
+    results = [
+        {
+            'type': 'application',
+            'rank': round(row.pop('rank'), 4),
+            'application': row,
+            'highlights': application_highlights[row['id']],
+        }
+        for row in applications
+    ] + [
+        {
+            'type': 'event',
+            'rank': round(row.pop('rank'), 4),
+            'event': {
+                'id': row['id'],
+                'title': row['event_title'],
+                'event_date': row['event_date'],
+                'application': row['application_id'],
+            },
+            'highlights': event_highlights[row['id']],
+        }
+        for row in events
+    ]
+    results.sort(key=lambda result: -result['rank'])
+    return results[:limit]
+
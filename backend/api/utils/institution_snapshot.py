@@ -0,0 +1,31 @@
+from django.db import connection
+
+# Rewrites only the applications whose copy is out of date; the triggers on
+# applications then refresh their search vectors and sync stamps
+_REFRESH_SQL = """
+    UPDATE applications a
+    SET institution_name = i.name,
+        institution_country = i.country,
+        institution_rank = institution_rank_number(i.rank)
+    FROM institutions i
+    WHERE i.id = a.institution_id
+      AND (a.institution_name, a.institution_country, a.institution_rank)
+          IS DISTINCT FROM (i.name, i.country, institution_rank_number(i.rank))
+      {filter}
+"""
+
+
+def refresh_application_institutions(institution_ids=None):
+    """
+    Bring the institution name, country and rank copied onto applications
+    up to date in one set-based update, for all institutions or only
+    ``institution_ids``. Returns the number of applications changed.
+    """
+    params = []
+    condition = ''
+    if institution_ids is not None:
+        condition = 'AND a.institution_id = ANY(%s)'
+        params.append(list(institution_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(_REFRESH_SQL.format(filter=condition), params)
+        return cursor.rowcount
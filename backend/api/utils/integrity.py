@@ -0,0 +1,90 @@
+from django.db import connection
+from django.utils import timezone
+
+from api.models.institution_models import METRIC_MODELS
+from api.utils.dataset_version import get_dataset_version
+
+METRIC_TABLES = [model._meta.db_table for model in METRIC_MODELS]
+RELATED_TABLES = ['classification'] + METRIC_TABLES
+
+# Institutions lacking a row in any of the related tables, one anti-join each
+_MISSING_SQL = """
+    SELECT i.id, array_remove(ARRAY[{missing_checks}], NULL) AS missing
+    FROM institutions i
+    {joins}
+    WHERE {any_missing}
+    ORDER BY i.id
+""".format(
+    missing_checks=', '.join(
+        f"CASE WHEN {table}.id IS NULL THEN '{table}' END" for table in RELATED_TABLES
+    ),
+    joins='\n    '.join(
+        f"LEFT JOIN {table} ON {table}.institution_id = i.id" for table in RELATED_TABLES
+    ),
+    any_missing=' OR '.join(f"{table}.id IS NULL" for table in RELATED_TABLES),
+)
+
+# Related rows pointing at an institution that doesn't exist
+_ORPHANS_SQL = '\nUNION ALL\n'.join(
+    f"""SELECT '{table}', t.id, t.institution_id FROM {table} t
+    WHERE NOT EXISTS (SELECT 1 FROM institutions i WHERE i.id = t.institution_id)"""
+    for table in RELATED_TABLES
+) + "\nORDER BY 1, 2"
+
+# Non-empty values the rank/score parsers can't read; the directory sorts such
+# ranks to the end as 999999 and the rollups treat them as missing
+_UNPARSEABLE_SQL = '\nUNION ALL\n'.join(
+    [f"""SELECT 'institutions', i.id, i.id, i.{{column}} FROM institutions i
+    WHERE COALESCE(trim(i.{{column}}), '') <> '' AND {{parser}}(i.{{column}}) IS NULL"""]
+    + [
+        f"""SELECT '{table}', t.id, t.institution_id, t.{{metric_column}} FROM {table} t
+    WHERE COALESCE(trim(t.{{metric_column}}), '') <> '' AND {{parser}}(t.{{metric_column}}) IS NULL"""
+        for table in METRIC_TABLES
+    ]
+) + "\nORDER BY 1, 2"
+
+_UNPARSEABLE_RANKS_SQL = _UNPARSEABLE_SQL.format(
+    column='rank', metric_column='rank', parser='institution_rank_number'
+)
+_UNPARSEABLE_SCORES_SQL = _UNPARSEABLE_SQL.format(
+    column='overall_score', metric_column='score', parser='institution_score_number'
+)
+
+
+def _fetch(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        return cursor.fetchall()
+
+
+def check_institution_data():
+    """
+    Find integrity problems in the institution dataset.
+
+    Runs four set-based queries (missing related rows, orphans, unparseable
+    ranks, unparseable scores) and returns a JSON-serialisable report.
+    """
+    issues = {
+        'missing_related_rows': [
+            {'institution_id': institution_id, 'missing': missing}
+            for institution_id, missing in _fetch(_MISSING_SQL)
+        ],
+        'orphaned_rows': [
+            {'table': table, 'id': row_id, 'institution_id': institution_id}
+            for table, row_id, institution_id in _fetch(_ORPHANS_SQL)
+        ],
+        'unparseable_ranks': [
+            {'table': table, 'id': row_id, 'institution_id': institution_id, 'value': value}
+            for table, row_id, institution_id, value in _fetch(_UNPARSEABLE_RANKS_SQL)
+        ],
+        'unparseable_scores': [
+            {'table': table, 'id': row_id, 'institution_id': institution_id, 'value': value}
+            for table, row_id, institution_id, value in _fetch(_UNPARSEABLE_SCORES_SQL)
+        ],
+    }
+    return {
+        'dataset_version': get_dataset_version(),
+        'checked_at': timezone.now().isoformat(),
+        'summary': {check: len(rows) for check, rows in issues.items()},
+        'issues': issues,
+    }
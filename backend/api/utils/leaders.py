@@ -0,0 +1,76 @@
+import threading
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from api.models.institution_models import Institution, RankNumber, ScoreNumber
+from api.utils.dataset_version import get_dataset_version
+from api.utils.metric_matrix import METRIC_NAMES
+
+# Orderings a leaderboard can be built on
+LEADER_METRICS = ['rank'] + METRIC_NAMES
+
+MAX_PER_COUNTRY = 50
+
+
+def _metric_expression(metric):
+    if metric == 'rank':
+        return RankNumber('rank')
+    if metric == 'overall_score':
+        return ScoreNumber('overall_score')
+    return ScoreNumber(f'{metric}__score')
+
+
+def compute_leaders(metric='rank', per_country=MAX_PER_COUNTRY):
+    """
+    Return the top ``per_country`` institutions of every country as
+    ``{country: [(institution_id, value), ...]}``, best first.
+
+    One ROW_NUMBER() OVER (PARTITION BY country ...) query. Ranks sort
+    ascending on the institution_country_rank_idx expression; scores sort
+    descending. Institutions without a parseable value are left out.
+    """
+    value = _metric_expression(metric)
+    order = value.asc() if metric == 'rank' else value.desc()
+    rows = (
+        Institution.objects
+        .exclude(country__isnull=True).exclude(country='')
+        .annotate(value=value)
+        .filter(value__isnull=False)
+        .annotate(position=Window(RowNumber(), partition_by=F('country'), order_by=[order, F('id').asc()]))
+        .filter(position__lte=per_country)
+        .order_by('country', 'position')
+        .values_list('country', 'id', 'value')
+    )
+    leaders = {}
+    for country, institution_id, metric_value in rows:
+        leaders.setdefault(country, []).append((institution_id, metric_value))
+    return leaders
+
+
+_lock = threading.Lock()
+_leaders = {}
+_leaders_version = None
+
+
+def get_leaders(metric='rank', per_country=10):
+    """
+    Per-country leaders for a metric, cached for the current dataset version.
+
+    Each metric is computed once at MAX_PER_COUNTRY and sliced, so every
+    ``per_country`` value shares one cache entry.
+    """
+    global _leaders_version
+
+    version = get_dataset_version()
+    with _lock:
+        if _leaders_version != version:
+            _leaders.clear()
+            _leaders_version = version
+        leaders = _leaders.get(metric)
+    if leaders is None:
+        leaders = compute_leaders(metric)
+        with _lock:
+            if _leaders_version == version:
+                _leaders[metric] = leaders
+    return {country: rows[:per_country] for country, rows in leaders.items()}
@@ -0,0 +1,192 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+
+import httpx
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from api.models.application_models import Application
+from api.models.institution_models import Institution
+from api.models.link_models import LinkCheck
+
+APPLICATION_LINK_FIELDS = ('application_link', 'scholarship_link', 'program_info_link')
+
+# Responses that prove the page exists even though we may not read it
+ALIVE_STATUS_CODES = {401, 403, 429}
+
+
+@dataclass
+class LinkResult:
+    url: str
+    status_code: int = None
+    ok: bool = False
+    error: str = None
+    etag: str = None
+    last_modified: str = None
+    not_modified: bool = False
+
+
+class HostRateLimiter:
+    """Limit concurrent requests per host and space out their start times."""
+
+    def __init__(self, per_host, min_interval):
+        self.min_interval = min_interval
+        self._semaphores = defaultdict(lambda: asyncio.Semaphore(per_host))
+        self._next_start = defaultdict(float)
+
+    @asynccontextmanager
+    async def slot(self, host):
+        async with self._semaphores[host]:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next_start[host])
+            self._next_start[host] = start + self.min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+async def _check_url(client, url, cached, limiter, semaphore):
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        # Parsed the way the client will, so a malformed stored URL fails
+        # here as this URL's result instead of aborting the whole batch
+        host = httpx.URL(url).host
+    except httpx.InvalidURL as exc:
+        return LinkResult(url, error=f"Invalid URL: {exc}"[:255])
+    # Wait for the host first, so URLs queued behind a slow host don't hold
+    # global slots that requests to other hosts could be using
+    async with limiter.slot(host), semaphore:
+        try:
+            response = await client.head(url, headers=headers)
+            if response.status_code in (405, 501):
+                # Some servers refuse HEAD; fetch headers only and drop the body
+                async with client.stream('GET', url, headers=headers) as response:
+                    pass
+        except (httpx.HTTPError, httpx.InvalidURL) as exc:
+            return LinkResult(url, error=(str(exc) or type(exc).__name__)[:255])
+
+    status_code = response.status_code
+    return LinkResult(
+        url,
+        status_code=status_code,
+        ok=status_code < 400 or status_code in ALIVE_STATUS_CODES,
+        etag=response.headers.get('etag'),
+        last_modified=response.headers.get('last-modified'),
+        not_modified=status_code == 304,
+    )
+
+
+async def check_urls(urls, cached=None, concurrency=50, per_host=2, min_interval=0.5, timeout=10):
+    """
+    Check a batch of URLs concurrently.
+
+    ``cached`` maps URLs to their previous result (``etag``/``last_modified``)
+    so unchanged pages can answer 304 Not Modified. Returns one LinkResult
+    per URL, in order.
+    """
+    cached = cached or {}
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = HostRateLimiter(per_host, min_interval)
+    async with httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=concurrency),
+        headers={'User-Agent': 'SchoolTracker link checker'},
+    ) as client:
+        return await asyncio.gather(*(
+            _check_url(client, url, cached.get(url), limiter, semaphore) for url in urls
+        ))
+
+
+def collect_urls():
+    """Every distinct http(s) URL stored on institutions and applications."""
+    urls = set(
+        Institution.objects.exclude(web_links__isnull=True).exclude(web_links='')
+        .values_list('web_links', flat=True)
+    )
+    for field in APPLICATION_LINK_FIELDS:
+        urls.update(
+            Application.objects.exclude(Q(**{f'{field}__isnull': True}) | Q(**{field: ''}))
+            .values_list(field, flat=True).distinct()
+        )
+    return sorted(url.strip() for url in urls if url.strip().lower().startswith(('http://', 'https://')))
+
+
+def run_link_check(max_age_hours=24, limit=None, **check_options):
+    """
+    Check every stored URL whose last result is older than ``max_age_hours``
+    and save the results. Returns a (checked, dead) tuple.
+    """
+    now = timezone.now()
+    previous = {
+        row['url']: row
+        for row in LinkCheck.objects.values(
+            'url', 'ok', 'status_code', 'etag', 'last_modified',
+            'consecutive_failures', 'checked_at', 'last_ok_at'
+        )
+    }
+    fresh_after = now - timedelta(hours=max_age_hours)
+    due = [
+        url for url in collect_urls()
+        if url not in previous or previous[url]['checked_at'] < fresh_after
+    ]
+    if limit:
+        due = due[:limit]
+    if not due:
+        return 0, 0
+
+    results = asyncio.run(check_urls(due, previous, **check_options))
+
+    checks = []
+    for result in results:
+        before = previous.get(result.url, {})
+        if result.not_modified:
+            ok, status_code = before.get('ok', True), before.get('status_code') or 304
+        else:
+            ok, status_code = result.ok, result.status_code
+        checks.append(LinkCheck(
+            url=result.url,
+            status_code=status_code,
+            ok=ok,
+            error=result.error,
+            etag=result.etag or before.get('etag'),
+            last_modified=result.last_modified or before.get('last_modified'),
+            consecutive_failures=0 if ok else before.get('consecutive_failures', 0) + 1,
+            checked_at=now,
+            last_ok_at=now if ok else before.get('last_ok_at'),
+        ))
+
+    LinkCheck.objects.bulk_create(
+        checks,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=['url'],
+        update_fields=['status_code', 'ok', 'error', 'etag', 'last_modified',
+                       'consecutive_failures', 'checked_at', 'last_ok_at'],
+    )
+    return len(checks), sum(1 for check in checks if not check.ok)
+
+
+def dead_links(urls):
+    """
+    Return the subset of ``urls`` that failed enough consecutive checks to be
+    reported as dead.
+    """
+    urls = [url.strip() for url in urls if url]
+    if not urls:
+        return set()
+    threshold = getattr(settings, 'LINK_DEAD_AFTER_FAILURES', 2)
+    return set(
+        LinkCheck.objects.filter(url__in=urls, consecutive_failures__gte=threshold)
+        .values_list('url', flat=True)
+    )
@@ -0,0 +1,95 @@
+import re
+import threading
+
+import numpy as np
+
+from api.models.institution_models import METRIC_MODELS, Institution
+from api.utils.dataset_version import get_dataset_version
+
+# Scores that can be compared across institutions, in matrix column order
+METRIC_NAMES = ['overall_score'] + [model._meta.db_table for model in METRIC_MODELS]
+
+# fullmatch: unlike SQL's $, Python's also matches before a trailing newline
+_SCORE_PATTERN = re.compile(r'[0-9]+(\.[0-9]+)?')
+
+
+def parse_score(value):
+    """Python twin of the institution_score_number() SQL function."""
+    # SQL trim() removes spaces only, not tabs or newlines
+    value = (value or '').strip(' ')
+    return float(value) if _SCORE_PATTERN.fullmatch(value) else np.nan
+
+
+class MetricMatrix:
+    """
+    All institutions' parsed scores as one float matrix.
+
+    Rows follow ``ids``; columns follow METRIC_NAMES. Missing or unparseable
+    scores are NaN.
+    """
+
+    def __init__(self, ids, values):
+        self.ids = ids
+        self.values = values
+        self.row_of = {institution_id: row for row, institution_id in enumerate(ids)}
+
+    @classmethod
+    def load(cls):
+        fields = ['id', 'overall_score'] + [f'{name}__score' for name in METRIC_NAMES[1:]]
+        rows = list(Institution.objects.order_by('id').values_list(*fields))
+        values = np.array(
+            [[parse_score(score) for score in row[1:]] for row in rows], dtype=float
+        ).reshape(len(rows), len(METRIC_NAMES))
+        return cls([row[0] for row in rows], values)
+
+    def select(self, ids, metrics):
+        """
+        Return ``(ids, values)`` for the given institutions and metric columns,
+        dropping institutions that lack any of the selected scores.
+        """
+        rows = np.array([self.row_of[i] for i in ids if i in self.row_of], dtype=int)
+        columns = [METRIC_NAMES.index(metric) for metric in metrics]
+        values = self.values[np.ix_(rows, columns)] if rows.size else np.empty((0, len(columns)))
+        complete = ~np.isnan(values).any(axis=1)
+        return [self.ids[row] for row in rows[complete]], values[complete]
+
+
+_lock = threading.Lock()
+_matrix = None
+_matrix_version = None
+
+
+def get_metric_matrix():
+    """Return this process's metric matrix, reloading it when the dataset changes."""
+    global _matrix, _matrix_version
+
+    version = get_dataset_version()
+    with _lock:
+        if _matrix is None or _matrix_version != version:
+            _matrix = MetricMatrix.load()
+            _matrix_version = version
+        return _matrix
+
+
+def pareto_frontier(values):
+    """
+    Indices of the rows no other row dominates (higher is better on every column).
+
+    Rows are visited in descending order of their column sum. The best
+    remaining row can't be dominated by anything left, so it joins the
+    frontier, and every row it dominates is discarded in one vectorised
+    comparison. Cost is O(n * frontier size) instead of O(n^2) pairwise checks.
+    Frontier indices are returned best sum first.
+    """
+    order = np.argsort(-values.sum(axis=1), kind='stable')
+    ordered = values[order]
+    remaining = np.arange(len(ordered))
+    frontier = []
+    while remaining.size:
+        best, rest = remaining[0], remaining[1:]
+        frontier.append(best)
+        point = ordered[best]
+        others = ordered[rest]
+        dominated = (others <= point).all(axis=1) & (others < point).any(axis=1)
+        remaining = rest[~dominated]
+    return order[frontier]
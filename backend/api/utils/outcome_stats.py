@@ -0,0 +1,216 @@
+from collections import Counter, defaultdict
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import connection
+
+from api.models.application_models import Application
+from api.models.outcome_models import ApplicationOutcomeStats, ApplicationOutcomeValue
+from api.models.program_models import Program
+from api.utils.program_catalogue import normalize_program_name
+
+DECIDED_STATUSES = ('Accepted', 'Rejected')
+
+# Upper bounds (in days) of the decision time distribution buckets
+DECISION_TIME_BUCKETS = [
+    (14, '0-2 weeks'),
+    (30, '2-4 weeks'),
+    (60, '1-2 months'),
+    (90, '2-3 months'),
+    (180, '3-6 months'),
+    (None, '6+ months'),
+]
+
+_STATS_SQL = """
+    INSERT INTO application_outcome_stats (institution_id, normalized_program, degree_type, applications, accepted, rejected)
+    VALUES {values}
+    ON CONFLICT (institution_id, normalized_program, degree_type) DO UPDATE SET
+        applications = application_outcome_stats.applications + EXCLUDED.applications,
+        accepted = application_outcome_stats.accepted + EXCLUDED.accepted,
+        rejected = application_outcome_stats.rejected + EXCLUDED.rejected
+"""
+
+_VALUES_SQL = """
+    INSERT INTO application_outcome_values (institution_id, normalized_program, degree_type, kind, value, count)
+    VALUES {values}
+    ON CONFLICT (institution_id, normalized_program, degree_type, kind, value) DO UPDATE SET
+        count = application_outcome_values.count + EXCLUDED.count
+"""
+
+
+def outcome_snapshot(application):
+    """The application's OUTCOME_FIELDS, comparable with ``_loaded_outcome``."""
+    return tuple(getattr(application, field) for field in Application.OUTCOME_FIELDS)
+
+
+def _contribution(snapshot):
+    """Group key, counter increments and value increments of one application."""
+    institution_id, program_name, degree_type, status, tuition_fee, submitted_date, decision_date = snapshot
+    group = (institution_id, normalize_program_name(program_name)[:150], degree_type)
+    counters = (1, int(status == 'Accepted'), int(status == 'Rejected'))
+    values = []
+    if tuition_fee is not None:
+        values.append(('tuition', Decimal(tuition_fee)))
+    if status in DECIDED_STATUSES and submitted_date and decision_date and decision_date >= submitted_date:
+        values.append(('decision_days', Decimal((decision_date - submitted_date).days)))
+    return group, counters, values
+
+
+def update_outcome_stats(added=(), removed=()):
+    """
+    Apply application changes to the outcome rollups in at most two statements.
+
+    ``added`` and ``removed`` are iterables of ``outcome_snapshot`` tuples; an
+    edit is the old snapshot removed and the new one added. Changes that
+    cancel out aren't written.
+    """
+    counters = defaultdict(lambda: [0, 0, 0])
+    values = Counter()
+    for snapshots, sign in ((added, 1), (removed, -1)):
+        for snapshot in snapshots:
+            group, increments, group_values = _contribution(snapshot)
+            totals = counters[group]
+            for i, increment in enumerate(increments):
+                totals[i] += sign * increment
+            for kind, value in group_values:
+                values[(*group, kind, value)] += sign
+
+    counters = sorted((group, totals) for group, totals in counters.items() if any(totals))
+    values = sorted((key, count) for key, count in values.items() if count)
+    with connection.cursor() as cursor:
+        if counters:
+            params = []
+            for group, totals in counters:
+                params += [*group, *totals]
+            cursor.execute(_STATS_SQL.format(values=', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(counters))), params)
+        if values:
+            params = []
+            for key, count in values:
+                params += [*key, count]
+            cursor.execute(_VALUES_SQL.format(values=', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(values))), params)
+
+
+def _median(value_counts):
+    """Median of ``{value: count}``; the mean of the middle two for even totals."""
+    total = sum(value_counts.values())
+    middle = [(total - 1) // 2, total // 2]
+    found, seen = [], 0
+    for value in sorted(value_counts):
+        seen += value_counts[value]
+        while middle and middle[0] < seen:
+            found.append(value)
+            middle.pop(0)
+    return (found[0] + found[1]) / 2
+
+
+def _summary(counters, value_counts, min_group_size):
+    """Statistics of one group, withholding figures backed by fewer than ``min_group_size`` applications."""
+    applications, accepted, rejected = counters
+    decided = accepted + rejected
+    tuition = value_counts.get('tuition', {})
+    decision_days = value_counts.get('decision_days', {})
+
+    decision_time = None
+    if sum(decision_days.values()) >= min_group_size:
+        total = sum(decision_days.values())
+        buckets = Counter()
+        for days, count in decision_days.items():
+            label = next(label for bound, label in DECISION_TIME_BUCKETS if bound is None or days <= bound)
+            buckets[label] += count
+        decision_time = {
+            'decisions': total,
+            'median_days': round(float(_median(decision_days)), 1),
+            'distribution': [
+                {'label': label, 'share': round(buckets[label] / total, 2)} for _, label in DECISION_TIME_BUCKETS
+            ],
+        }
+
+    return {
+        'applications': applications,
+        'decided': decided,
+        'acceptance_rate': round(accepted / decided * 100) if decided >= min_group_size else None,
+        'median_tuition': _median(tuition) if sum(tuition.values()) >= min_group_size else None,
+        'decision_time': decision_time,
+    }
+
+
+def institution_outcomes(institution_id, min_group_size=None):
+    """
+    Anonymised application outcomes for an institution, overall and per
+    programme and degree type, read from the rollups in three indexed queries.
+
+    Groups with fewer than ``min_group_size`` applications (the k-anonymity
+    threshold, ``OUTCOME_MIN_GROUP_SIZE`` by default) are left out, as is any
+    figure within a group that rests on fewer applications than that, and any
+    overall figure that would reveal what was left out by subtraction.
+    """
+    k = min_group_size or settings.OUTCOME_MIN_GROUP_SIZE
+    groups = {
+        (row.normalized_program, row.degree_type): (row.applications, row.accepted, row.rejected)
+        for row in ApplicationOutcomeStats.objects.filter(institution_id=institution_id, applications__gt=0)
+    }
+    values = defaultdict(lambda: defaultdict(Counter))
+    overall_values = defaultdict(Counter)
+    for row in ApplicationOutcomeValue.objects.filter(institution_id=institution_id, count__gt=0):
+        values[(row.normalized_program, row.degree_type)][row.kind][row.value] += row.count
+        overall_values[row.kind][row.value] += row.count
+
+    overall = [sum(column) for column in zip(*groups.values())] or [0, 0, 0]
+    shown = sorted(
+        (group for group, counters in groups.items() if group[0] and counters[0] >= k),
+        key=lambda group: (-groups[group][0], group)
+    )
+    names = dict(
+        Program.objects.filter(institution_id=institution_id, normalized_name__in={program for program, _ in shown})
+        .values_list('normalized_name', 'name')
+    ) if shown else {}
+
+    summaries = {group: _summary(groups[group], values[group], k) for group in shown}
+    return {
+        'institution_id': institution_id,
+        'min_group_size': k,
+        'overall': _overall_summary(overall, overall_values, summaries, groups, values, k),
+        'programs': [
+            {
+                'program': names.get(program, program),
+                'degree_type': degree_type,
+                **summaries[(program, degree_type)],
+            }
+            for program, degree_type in shown
+        ],
+    }
+
+
+def _overall_summary(overall, overall_values, summaries, groups, values, k):
+    """
+    Statistics of the whole institution.
+
+    Subtracting the published programme figures from an overall figure gives
+    the figure for everything that was withheld, so each overall figure is
+    itself withheld when that remainder rests on between 1 and k - 1
+    applications.
+    """
+    def remainder_too_small(total, published):
+        return 0 < total - sum(published) < k
+
+    def value_count(value_counts, kind):
+        return sum(value_counts.get(kind, {}).values())
+
+    if overall[0] < k or remainder_too_small(overall[0], (groups[group][0] for group in summaries)):
+        return None
+
+    summary = _summary(overall, overall_values, k)
+    if remainder_too_small(summary['decided'], (
+        program['decided'] for program in summaries.values() if program['acceptance_rate'] is not None
+    )):
+        summary['acceptance_rate'] = None
+    if remainder_too_small(value_count(overall_values, 'tuition'), (
+        value_count(values[group], 'tuition') for group, program in summaries.items()
+        if program['median_tuition'] is not None
+    )):
+        summary['median_tuition'] = None
+    if remainder_too_small(value_count(overall_values, 'decision_days'), (
+        program['decision_time']['decisions'] for program in summaries.values() if program['decision_time']
+    )):
+        summary['decision_time'] = None
+    return summary
@@ -0,0 +1,186 @@
+import atexit
+import logging
+import os
+import threading
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from api.models.popularity_models import InstitutionPopularity
+
+logger = logging.getLogger(__name__)
+
+# Sliding windows exposed by the trending endpoint, in days
+TRENDING_WINDOWS = {
+    'day': 1,
+    'week': 7,
+    'month': 30,
+}
+
+# An application says more about interest in a school than a page view
+APPLICATION_WEIGHT = 5
+
+# Ids that no longer exist (say, after a dataset swap) are dropped by the
+# join instead of failing the whole batch on the foreign key
+_UPSERT_SQL = """
+    INSERT INTO institution_popularity (institution_id, bucket, shard, views, applications)
+    SELECT i.id, v.bucket, v.shard, v.views, v.applications
+    FROM (VALUES {values}) AS v (institution_id, bucket, shard, views, applications)
+    JOIN institutions i ON i.id = v.institution_id
+    FOR KEY SHARE OF i
+    ON CONFLICT (institution_id, bucket, shard) DO UPDATE SET
+        views = institution_popularity.views + EXCLUDED.views,
+        applications = institution_popularity.applications + EXCLUDED.applications
+"""
+
+_ROLLUP_SQL = """
+    WITH moved AS (
+        DELETE FROM institution_popularity
+        WHERE bucket < %s AND (shard <> 0 OR bucket <> date_trunc('day', bucket))
+        RETURNING institution_id, bucket, views, applications
+    )
+    INSERT INTO institution_popularity (institution_id, bucket, shard, views, applications)
+    SELECT institution_id, date_trunc('day', bucket), 0, SUM(views), SUM(applications)
+    FROM moved
+    GROUP BY institution_id, date_trunc('day', bucket)
+    ON CONFLICT (institution_id, bucket, shard) DO UPDATE SET
+        views = institution_popularity.views + EXCLUDED.views,
+        applications = institution_popularity.applications + EXCLUDED.applications
+"""
+
+
+class PopularityBuffer:
+    """
+    In-process buffer of popularity increments.
+
+    Increments are summed in memory per (institution, hour). A daemon thread
+    writes them in one upsert per flush, to the shard owned by this process,
+    so requests never wait on a counter write. The shard and the thread both
+    belong to the process that flushes, so workers forked from a preloaded
+    parent each get their own.
+    """
+
+    def __init__(self, flush_interval, max_pending, shards):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.shards = shards
+        self._pending = defaultdict(lambda: [0, 0])
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._thread_pid = None
+
+    def add(self, institution_id, views=0, applications=0):
+        bucket = timezone.now().replace(minute=0, second=0, microsecond=0)
+        with self._lock:
+            counts = self._pending[(institution_id, bucket)]
+            counts[0] += views
+            counts[1] += applications
+            full = len(self._pending) >= self.max_pending
+        if self._thread_pid != os.getpid():
+            self._start()
+        if full:
+            self._wake.set()
+
+    def _start(self):
+        with self._lock:
+            # A thread inherited across fork isn't running in this process
+            if self._thread_pid != os.getpid():
+                self._thread = threading.Thread(
+                    target=self._run, name='popularity-flusher', daemon=True
+                )
+                self._thread.start()
+                self._thread_pid = os.getpid()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+            close_old_connections()
+
+    def flush(self):
+        """Write all pending increments; returns the number of rows upserted."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(lambda: [0, 0])
+        if not pending:
+            return 0
+
+        # Worked out here rather than at import, which a preloading server
+        # does once in the parent before forking the workers
+        shard = os.getpid() % self.shards
+        rows = [
+            (institution_id, bucket, shard, views, applications)
+            for (institution_id, bucket), (views, applications) in pending.items()
+        ]
+        written = 0
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                for start in range(0, len(rows), 1000):
+                    chunk = rows[start:start + 1000]
+                    values = ', '.join(['(%s, %s::timestamptz, %s::smallint, %s::integer, %s::integer)'] * len(chunk))
+                    params = [value for row in chunk for value in row]
+                    cursor.execute(_UPSERT_SQL.format(values=values), params)
+                    written += cursor.rowcount
+        except DatabaseError:
+            # Counters are best effort
+            logger.exception("Failed to flush %d institution popularity rows", len(rows))
+            return 0
+        return written
+
+
+popularity_buffer = PopularityBuffer(
+    flush_interval=getattr(settings, 'POPULARITY_FLUSH_INTERVAL', 30),
+    max_pending=getattr(settings, 'POPULARITY_MAX_PENDING', 500),
+    shards=getattr(settings, 'POPULARITY_SHARDS', 8),
+)
+atexit.register(popularity_buffer.flush)
+
+
+def record_view(institution_id):
+    popularity_buffer.add(institution_id, views=1)
+
+
+def record_application(institution_id):
+    popularity_buffer.add(institution_id, applications=1)
+
+
+def rollup_popularity(hourly_retention_hours=48, retention_days=90):
+    """
+    Fold old hourly shard rows into one daily row per institution and drop
+    buckets that have fallen out of every trending window.
+
+    Returns a (rolled_up, pruned) tuple of row counts.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(_ROLLUP_SQL, [now - timedelta(hours=hourly_retention_hours)])
+            rolled_up = cursor.rowcount
+        pruned, _ = InstitutionPopularity.objects.filter(
+            bucket__lt=now - timedelta(days=retention_days)
+        ).delete()
+    return rolled_up, pruned
+
+
+def trending_institutions(window='week', limit=20):
+    """
+    Return ``(institution_id, views, applications, score)`` tuples for the
+    most popular institutions over the given sliding window.
+    """
+    since = timezone.now() - timedelta(days=TRENDING_WINDOWS[window])
+    rows = (
+        InstitutionPopularity.objects.filter(bucket__gte=since)
+        .values('institution_id')
+        .annotate(total_views=Sum('views'), total_applications=Sum('applications'))
+        .annotate(score=F('total_views') + F('total_applications') * APPLICATION_WEIGHT)
+        .order_by('-score', 'institution_id')[:limit]
+    )
+    return [
+        (row['institution_id'], row['total_views'], row['total_applications'], row['score'])
+        for row in rows
+    ]
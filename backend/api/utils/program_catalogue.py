@@ -0,0 +1,98 @@
+import re
+from collections import Counter
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import Q
+
+from api.models.program_models import Program
+
+_INCREMENT_SQL = """
+    INSERT INTO programs (institution_id, name, normalized_name, department, usage_count, updated_at)
+    VALUES {values}
+    ON CONFLICT (institution_id, normalized_name) DO UPDATE SET
+        usage_count = programs.usage_count + EXCLUDED.usage_count,
+        department = COALESCE(EXCLUDED.department, programs.department),
+        updated_at = EXCLUDED.updated_at
+"""
+
+_DECREMENT_SQL = """
+    UPDATE programs SET
+        usage_count = GREATEST(programs.usage_count - delta.amount, 0),
+        updated_at = now()
+    FROM (VALUES {values}) AS delta (institution_id, normalized_name, amount)
+    WHERE programs.institution_id = delta.institution_id
+      AND programs.normalized_name = delta.normalized_name
+"""
+
+
+def normalize_program_name(name):
+    """Canonical form used to group free-text programme names."""
+    return ' '.join(re.findall(r'\w+', (name or '').lower()))
+
+
+def update_program_usage(added=(), removed=()):
+    """
+    Apply programme usage changes to the catalogue in at most two statements.
+
+    ``added`` and ``removed`` are iterables of
+    ``(institution_id, program_name, department)`` tuples, one per application.
+    """
+    increments = Counter()
+    names = {}
+    departments = {}
+    for institution_id, program_name, department in added:
+        key = (institution_id, normalize_program_name(program_name))
+        if not key[1]:
+            continue
+        increments[key] += 1
+        names.setdefault(key, program_name.strip()[:150])
+        if department:
+            departments[key] = department
+
+    decrements = Counter()
+    for institution_id, program_name, department in removed:
+        key = (institution_id, normalize_program_name(program_name))
+        if key[1]:
+            decrements[key] += 1
+
+    # An edit that keeps the same programme is a no-op
+    for key in set(increments) & set(decrements):
+        common = min(increments[key], decrements[key])
+        increments[key] -= common
+        decrements[key] -= common
+    increments += Counter()
+    decrements += Counter()
+
+    with connection.cursor() as cursor:
+        if increments:
+            values = ', '.join(['(%s, %s, %s, %s, %s, now())'] * len(increments))
+            params = []
+            for key in sorted(increments):
+                institution_id, normalized_name = key
+                params += [institution_id, names[key], normalized_name[:150],
+                           departments.get(key), increments[key]]
+            cursor.execute(_INCREMENT_SQL.format(values=values), params)
+        if decrements:
+            values = ', '.join(['(%s, %s, %s)'] * len(decrements))
+            params = []
+            for (institution_id, normalized_name), amount in sorted(decrements.items()):
+                params += [institution_id, normalized_name[:150], amount]
+            cursor.execute(_DECREMENT_SQL.format(values=values), params)
+
+
+def suggest_programs(institution_id, query, limit=10):
+    """
+    Return catalogue entries for an institution that match a partial name,
+    best matches and most used programmes first.
+    """
+    queryset = Program.objects.filter(institution_id=institution_id, usage_count__gt=0)
+    term = normalize_program_name(query)
+    if not term:
+        return queryset.order_by('-usage_count', 'name')[:limit]
+
+    return (
+        queryset.filter(Q(normalized_name__contains=term) | Q(normalized_name__trigram_similar=term))
+        .annotate(similarity=TrigramSimilarity('normalized_name', term))
+        .order_by('-similarity', '-usage_count', 'name')[:limit]
+    )
@@ -0,0 +1,175 @@
+import atexit
+import hashlib
+import json
+import logging
+import threading
+from collections import deque
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone
+from rest_framework.request import Request
+
+from api.models.analytics_models import DirectorySearch, PopularDirectoryQuery
+from api.utils.dataset_version import get_dataset_version
+from api.utils.directory_cache import cache_key_params, directory_cache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+_ROLLUP_SQL = """
+    WITH moved AS (
+        DELETE FROM directory_searches
+        WHERE searched_at <= %s
+        RETURNING query_key, params, searched_at
+    )
+    INSERT INTO popular_directory_queries (query_key, params, hits, last_searched_at)
+    SELECT query_key, (array_agg(params))[1], count(*), max(searched_at)
+    FROM moved
+    GROUP BY query_key
+    ON CONFLICT (query_key) DO UPDATE SET
+        hits = popular_directory_queries.hits + EXCLUDED.hits,
+        last_searched_at = GREATEST(popular_directory_queries.last_searched_at, EXCLUDED.last_searched_at)
+"""
+
+
+def query_key_hash(params):
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+class SearchCaptureBuffer:
+    """
+    Per-worker ring buffer of directory searches.
+
+    ``capture`` only appends to a bounded deque; a daemon thread drains it
+    with one batched insert per interval, so requests never wait on an
+    analytics write. If the database falls behind, the oldest searches are
+    dropped rather than growing memory.
+    """
+
+    def __init__(self, capacity, flush_interval):
+        self.flush_interval = flush_interval
+        self._buffer = deque(maxlen=capacity)
+        self._wake = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def capture(self, params):
+        self._buffer.append((query_key_hash(params), params, timezone.now()))
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='directory-search-flusher', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+            close_old_connections()
+
+    def flush(self):
+        """Insert every buffered search; returns the number of rows written."""
+        rows = []
+        while True:
+            try:
+                query_key, params, searched_at = self._buffer.popleft()
+            except IndexError:
+                break
+            rows.append(DirectorySearch(query_key=query_key, params=params, searched_at=searched_at))
+        if not rows:
+            return 0
+
+        try:
+            DirectorySearch.objects.bulk_create(rows, batch_size=1000)
+        except DatabaseError:
+            logger.exception("Failed to flush %d directory searches", len(rows))
+            return 0
+        return len(rows)
+
+
+search_buffer = SearchCaptureBuffer(
+    capacity=getattr(settings, 'SEARCH_ANALYTICS_BUFFER_SIZE', 10000),
+    flush_interval=getattr(settings, 'SEARCH_ANALYTICS_FLUSH_INTERVAL', 10),
+)
+atexit.register(search_buffer.flush)
+
+
+def capture_search(cache_key):
+    """Record a directory query, identified by its canonical cache key."""
+    search_buffer.capture(cache_key_params(cache_key))
+
+
+def rollup_searches():
+    """
+    Fold captured searches into per-query hit counts and delete them.
+
+    Returns the number of distinct queries updated.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(_ROLLUP_SQL, [timezone.now()])
+        return cursor.rowcount
+
+
+def top_queries(limit, days=30):
+    """Return the parameters of the most popular recent directory queries."""
+    since = timezone.now() - timedelta(days=days)
+    return list(
+        PopularDirectoryQuery.objects.filter(last_searched_at__gte=since)
+        .order_by('-hits')
+        .values_list('params', flat=True)[:limit]
+    )
+
+
+def prewarm_directory_cache(limit=None):
+    """
+    Execute the most popular directory queries and store their results in
+    this process's directory cache.
+
+    The cache is per process, so this only helps the worker that runs it.
+    Returns the number of queries run.
+    """
+    from api.views.institution_views import InstitutionListView
+
+    if limit is None:
+        limit = getattr(settings, 'DIRECTORY_PREWARM_QUERIES', 25)
+
+    warmed = 0
+    for params in top_queries(limit):
+        http_request = HttpRequest()
+        http_request.method = 'GET'
+        http_request.GET = QueryDict(mutable=True)
+        http_request.GET.update(params)
+
+        view = InstitutionListView()
+        view.setup(http_request)
+        view.request = Request(http_request)
+        view.format_kwarg = None
+
+        key = make_cache_key(view.request.query_params)
+        version = get_dataset_version()
+        ids = view.filter_queryset(view.get_queryset()).values_list('id', flat=True)
+        directory_cache.set(key, list(ids), version)
+        warmed += 1
+    return warmed
+
+
+def prewarm_in_background():
+    """Prewarm this process's directory cache without holding up the caller."""
+
+    def run():
+        try:
+            prewarm_directory_cache()
+        except DatabaseError:
+            logger.exception("Directory cache prewarm failed")
+        finally:
+            connection.close()
+
+    threading.Thread(target=run, name='directory-prewarm', daemon=True).start()
@@ -0,0 +1,103 @@
+from collections import defaultdict
+
+from django.db import connection
+from django.utils import timezone
+
+from api.models.application_models import Application
+from api.models.status_history_models import ApplicationStageStats, ApplicationStatusChange
+
+_STAGE_STATS_SQL = """
+    INSERT INTO application_stage_stats (user_id, status, total_seconds, stays)
+    VALUES {values}
+    ON CONFLICT (user_id, status) DO UPDATE SET
+        total_seconds = application_stage_stats.total_seconds + EXCLUDED.total_seconds,
+        stays = application_stage_stats.stays + EXCLUDED.stays
+"""
+
+
+def record_status_changes(changes, changed_at=None):
+    """
+    Append status transitions and fold the finished stays into the stage totals.
+
+    ``changes`` is an iterable of ``(application, from_status)`` pairs, where
+    ``from_status`` is None for new applications and the application holds
+    its new status. Pairs whose status didn't change are ignored. Costs one
+    lookup of the previous transitions, one bulk insert and one upsert,
+    whatever the number of changes.
+    """
+    changes = [(application, from_status) for application, from_status in changes
+               if from_status != application.status]
+    if not changes:
+        return []
+    changed_at = changed_at or timezone.now()
+
+    # When each application entered the status it is leaving
+    entered_at = dict(
+        ApplicationStatusChange.objects
+        .filter(application_id__in=[application.pk for application, from_status in changes if from_status])
+        .order_by('application_id', '-changed_at', '-id')
+        .distinct('application_id')
+        .values_list('application_id', 'changed_at')
+    )
+
+    entries = ApplicationStatusChange.objects.bulk_create([
+        ApplicationStatusChange(
+            user_id=application.user_id,
+            application_id=application.pk,
+            from_status=from_status,
+            to_status=application.status,
+            changed_at=changed_at,
+        )
+        for application, from_status in changes
+    ])
+
+    totals = defaultdict(lambda: [0.0, 0])
+    for application, from_status in changes:
+        if from_status and application.pk in entered_at:
+            stay = totals[(application.user_id, from_status)]
+            stay[0] += max((changed_at - entered_at[application.pk]).total_seconds(), 0)
+            stay[1] += 1
+    if totals:
+        values = ', '.join(['(%s, %s, %s, %s)'] * len(totals))
+        params = []
+        for (user_id, status), (seconds, stays) in sorted(totals.items()):
+            params += [user_id, status, seconds, stays]
+        with connection.cursor() as cursor:
+            cursor.execute(_STAGE_STATS_SQL.format(values=values), params)
+    return entries
+
+
+def application_timeline(application, now=None):
+    """
+    The application's transitions in order, each with the time spent in the
+    status it entered (up to ``now`` for the current one).
+    """
+    now = now or timezone.now()
+    entries = list(ApplicationStatusChange.objects.filter(
+        user_id=application.user_id, application_id=application.pk
+    ).order_by('changed_at', 'id'))
+    timeline = []
+    for entry, following in zip(entries, entries[1:] + [None]):
+        until = following.changed_at if following else now
+        timeline.append({
+            'from_status': entry.from_status,
+            'to_status': entry.to_status,
+            'changed_at': entry.changed_at,
+            'seconds_in_status': round((until - entry.changed_at).total_seconds()),
+            'current': following is None,
+        })
+    return timeline
+
+
+def stage_durations(user):
+    """Average completed time per status for a user, from the running totals."""
+    order = [value for value, _ in Application.STATUS_CHOICES]
+    stats = sorted(ApplicationStageStats.objects.filter(user=user), key=lambda row: order.index(row.status))
+    return [
+        {
+            'status': row.status,
+            'stays': row.stays,
+            'average_days': round(row.total_seconds / row.stays / 86400, 2) if row.stays else None,
+        }
+        for row in stats
+    ]
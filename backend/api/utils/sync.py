@@ -0,0 +1,86 @@
+import heapq
+
+from django.db import connection
+
+from api.models.application_models import Application
+from api.models.document_models import Document
+from api.models.event_models import Event
+from api.models.sync_models import SyncTombstone
+from api.serializers.application_serializers import ApplicationListSerializer
+from api.serializers.document_serializers import DocumentListSerializer
+from api.serializers.event_serializers import EventSerializer
+
+SYNC_PAGE_SIZE = 500
+
+# kind -> (queryset of the user's rows, serializer)
+SYNC_SOURCES = {
+    'applications': (lambda user: Application.objects.filter(user=user).defer('notes', 'search_vector'),
+                     ApplicationListSerializer),
+    'events': (lambda user: Event.objects.filter(user=user), EventSerializer),
+    'documents': (lambda user: Document.objects.filter(user=user).select_related('application'),
+                  DocumentListSerializer),
+}
+
+
+def _horizon():
+    """
+    First transaction id that may still be in flight.
+
+    Every write below it has committed or rolled back, so a client that has
+    seen all changes below it can never miss one that commits late.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+        return cursor.fetchone()[0]
+
+
+def changes_since(user, since=0, limit=SYNC_PAGE_SIZE):
+    """
+    The user's applications, events and documents written since ``since``,
+    plus tombstones for the ones deleted since then.
+
+    Rows are read through the (user, change_seq) indexes. A response holds
+    about ``limit`` rows, cut between transactions so none is split across
+    responses; ``has_more`` says whether to call again with the new token.
+    """
+    horizon = _horizon()
+    window = {'user': user, 'change_seq__gte': since, 'change_seq__lt': horizon}
+
+    # The first limit + 1 change stamps of every source, to find the cut
+    stamps = [
+        list(queryset(user).filter(change_seq__gte=since, change_seq__lt=horizon)
+             .order_by('change_seq').values_list('change_seq', flat=True)[:limit + 1])
+        for queryset, _ in SYNC_SOURCES.values()
+    ]
+    stamps.append(list(
+        SyncTombstone.objects.filter(**window).order_by('change_seq')
+        .values_list('change_seq', flat=True)[:limit + 1]
+    ))
+    merged = list(heapq.merge(*stamps))
+
+    if len(merged) <= limit:
+        token, has_more = horizon, False
+    else:
+        token, has_more = merged[limit], True
+        if token == merged[0]:
+            # One transaction wrote more than a page; send all of it
+            token += 1
+    window['change_seq__lt'] = token
+
+    changes = {
+        kind: serializer(
+            queryset(user).filter(change_seq__gte=since, change_seq__lt=token).order_by('change_seq', 'pk'),
+            many=True
+        ).data
+        for kind, (queryset, serializer) in SYNC_SOURCES.items()
+    }
+    deleted = {kind: [] for kind in SYNC_SOURCES}
+    for kind, object_id in SyncTombstone.objects.filter(**window).order_by('change_seq').values_list('kind', 'object_id'):
+        deleted[kind].append(object_id)
+
+    return {
+        'token': str(token),
+        'has_more': has_more,
+        **changes,
+        'deleted': deleted,
+    }
@@ -12,12 +12,14 @@ from .user_views import (
 )
 
 # Institution views
-from .institution_views import InstitutionListView, InstitutionDetailView
+from .institution_views import InstitutionListView, InstitutionDetailView, InstitutionTrendingView
 
 # Application views
 from .application_views import (
     ApplicationListView, ApplicationCreateView, ApplicationDetailView,
-    ApplicationFullUpdateView, ApplicationStatusUpdateView, ApplicationDeleteView
+    ApplicationFullUpdateView, ApplicationStatusUpdateView, ApplicationDeleteView,
+    ApplicationStatsView, ApplicationBatchView, ApplicationImportView, ApplicationTimelineView,
+    ApplicationStageDurationsView, ApplicationExportView
 )
 
 # Document views
@@ -27,3 +29,24 @@ from .document_views import (
     DocumentDetailView,
     DocumentDeleteView
 )
+
+# Watchlist views
+from .watchlist_views import (
+    WatchlistListView,
+    WatchlistAddView,
+    WatchlistRemoveView,
+    WatchlistChangesView,
+    WatchlistChangesMarkSeenView
+)
+
+# Program catalogue views
+from .program_views import ProgramAutocompleteView
+
+# Delta sync views
+from .sync_views import SyncView
+
+# Agenda views
+from .agenda_views import AgendaView
+
+# Search views
+from .search_views import SearchView
@@ -0,0 +1,83 @@
+from datetime import date
+
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.utils.agenda import AGENDA_PAGE_SIZE, InvalidCursor, agenda
+
+class AgendaView(APIView):
+    """
+    Upcoming Agenda
+    
+    **GET /api/agenda/?from=2025-01-01&to=2025-06-30**
+    
+    One chronological list of your application submission, decision and start dates
+    together with your calendar events. Entries on the same date are listed
+    submissions first, then decisions, start dates and events.
+    
+    ## Query Parameters
+    
+    | Parameter | Type | Description |
+    | --------- | ---- | ----------- |
+    | from | date | First date to include, `YYYY-MM-DD` (default: today) |
+    | to | date | Last date to include, `YYYY-MM-DD` (default: no limit) |
+    | cursor | string | `next_cursor` from the previous page |
+    | limit | number | Entries per page (default: 50, max: 200) |
+    
+    ## Response Format
+    ```json
+    {
+        "results": [
+            {
+                "date": "2025-01-15",
+                "type": "submitted",
+                "application": {
+                    "id": 1,
+                    "program_name": "Computer Science",
+                    "institution_name": "Harvard University",
+                    "status": "Pending"
+                }
+            },
+            {
+                "date": "2025-01-20",
+                "type": "event",
+                "event": {"id": 7, "title": "Interview", "color": "primary", "application": 1}
+            },
+            ...
+        ],
+        "next_cursor": "MjAyNS0wMS0yMHwzfDc="
+    }
+    ```
+    
+    `next_cursor` is `null` on the last page. Pass the same `from` and `to` with it.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        try:
+            start = date.fromisoformat(request.query_params['from']) if 'from' in request.query_params \
+                else timezone.localdate()
+            end = date.fromisoformat(request.query_params['to']) if 'to' in request.query_params else None
+        except ValueError:
+            return Response(
+                {"error": "Dates must use the YYYY-MM-DD format."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            limit = min(max(int(request.query_params.get('limit', AGENDA_PAGE_SIZE)), 1), 200)
+        except (ValueError, TypeError):
+            limit = AGENDA_PAGE_SIZE
+        
+        try:
+            entries, next_cursor = agenda(request.user, start, end, request.query_params.get('cursor'), limit)
+        except InvalidCursor:
+            return Response(
+                {"error": "Invalid cursor."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response({"results": entries, "next_cursor": next_cursor})
@@ -1,16 +1,67 @@
 from rest_framework import status, filters, generics, viewsets
+from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 
 from api.models.application_models import Application
+from api.models.event_models import Event
+from api.models.institution_models import METRIC_MODELS
 from api.serializers.application_serializers import (
+    APPLICATION_EXPANSIONS,
     ApplicationListSerializer,
     ApplicationDetailSerializer,
     ApplicationCreateSerializer
 )
+from api.utils.application_export import EXPORT_FORMATS, stream_export
+from api.utils.application_batch import MAX_BATCH_OPERATIONS, apply_application_batch
+from api.utils.application_import import ApplicationImportError, import_applications
+from api.utils.application_stats import application_stats
+from api.utils.collection_version import CollectionETagMixin
+from api.utils.dataset_version import get_dataset_version
+from api.utils.popularity import record_application
+from api.utils.status_history import application_timeline, stage_durations
 
-class ApplicationListView(generics.ListAPIView):
+class ApplicationExpandMixin:
+    """
+    Support ``?expand=institution,institution.metrics,events,documents``.
+    
+    The institution and its metrics are joined into the main query; events and
+    documents take one prefetch query each, however many applications are loaded.
+    Unknown values are ignored.
+    """
+    
+    def get_expand(self):
+        requested = self.request.query_params.get('expand', '')
+        return {value.strip() for value in requested.split(',')} & set(APPLICATION_EXPANSIONS)
+    
+    def expand_queryset(self, queryset):
+        expand = self.get_expand()
+        if 'institution.metrics' in expand:
+            queryset = queryset.select_related(
+                'institution__classification',
+                *(f'institution__{model._meta.db_table}' for model in METRIC_MODELS)
+            )
+        elif 'institution' in expand:
+            queryset = queryset.select_related('institution')
+        if 'events' in expand:
+            queryset = queryset.prefetch_related(
+                Prefetch('events', queryset=Event.objects.order_by('event_date', 'id'))
+            )
+        if 'documents' in expand:
+            queryset = queryset.prefetch_related('documents')
+        return queryset
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['expand'] = self.get_expand()
+        return context
+
+class ApplicationListView(ApplicationExpandMixin, CollectionETagMixin, generics.ListAPIView):
     """
     List All Applications
     
@@ -61,6 +112,21 @@ class ApplicationListView(generics.ListAPIView):
     - `decision_date` - When you received a decision
     
     Prefix with `-` for descending order. Example: `?ordering=-submitted_date`
+    
+    ## Embedding Related Data
+    
+    Use `expand` to embed related records, comma-separated:
+    - `institution` - Replace the institution id with the institution's summary
+    - `institution.metrics` - Same, including its classification and metric scores
+    - `events` - The application's calendar events
+    - `documents` - The application's documents
+    
+    Example: `?expand=events,documents,institution.metrics`
+    
+    ## Caching
+    
+    Responses carry an `ETag`. Send it back in `If-None-Match` to get an empty
+    `304 Not Modified` response while nothing in the list has changed.
     """
     permission_classes = [IsAuthenticated]
     serializer_class = ApplicationListSerializer
@@ -69,11 +135,24 @@ class ApplicationListView(generics.ListAPIView):
     search_fields = ['program_name', 'department']
     ordering_fields = ['created_at', 'updated_at', 'start_date', 'submitted_date', 'decision_date']
     ordering = ['-updated_at']
+    # Expansions embed events and documents
+    etag_kinds = ('applications', 'events', 'documents')
     
     def get_queryset(self):
         if getattr(self, 'swagger_fake_view', False):
             return Application.objects.none()
-        return Application.objects.filter(user=self.request.user)
+        # Institution name and country are copied onto each row; notes are never read
+        return self.expand_queryset(
+            Application.objects.filter(user=self.request.user)
+            .defer('notes', 'search_vector')
+        )
+    
+    def get_etag_parts(self, request):
+        parts = super().get_etag_parts(request)
+        if self.get_expand() & {'institution', 'institution.metrics'}:
+            # Embedded institutions change with the dataset
+            parts.append(str(get_dataset_version()))
+        return parts
 
 class ApplicationCreateView(generics.CreateAPIView):
     """
@@ -110,9 +189,10 @@ class ApplicationCreateView(generics.CreateAPIView):
     serializer_class = ApplicationCreateSerializer
     
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        application = serializer.save(user=self.request.user)
+        record_application(application.institution_id)
 
-class ApplicationDetailView(generics.RetrieveUpdateAPIView):
+class ApplicationDetailView(ApplicationExpandMixin, generics.RetrieveUpdateAPIView):
     """
     View and Update Application Details
     
@@ -153,6 +233,10 @@ class ApplicationDetailView(generics.RetrieveUpdateAPIView):
         "updated_at": "2024-04-01T15:45:00Z"
     }
     ```
+    
+    Add `?expand=events,documents,institution.metrics` to embed the application's
+    events, documents and institution (see the application list for the options),
+    so the detail page needs a single request.
     """
     permission_classes = [IsAuthenticated]
     serializer_class = ApplicationDetailSerializer
@@ -161,7 +245,9 @@ class ApplicationDetailView(generics.RetrieveUpdateAPIView):
     def get_queryset(self):
         if getattr(self, 'swagger_fake_view', False):
             return Application.objects.none()
-        return Application.objects.filter(user=self.request.user)
+        return self.expand_queryset(
+            Application.objects.filter(user=self.request.user).select_related('institution')
+        )
     
     def partial_update(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -327,3 +413,306 @@ class ApplicationDeleteView(generics.DestroyAPIView):
             
         self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+class ApplicationStatsView(APIView):
+    """
+    Application Dashboard Statistics
+    
+    **GET /api/applications/stats/**
+    
+    Summary statistics over all of your applications, computed on the server so the
+    dashboard doesn't need to download the full application list.
+    
+    ## Query Parameters
+    
+    | Parameter | Type | Description |
+    | --------- | ---- | ----------- |
+    | months | number | Months covered by the monthly histogram, ending with the current month (default: 12, max: 60) |
+    
+    ## Response Format
+    ```json
+    {
+        "total": 15,
+        "by_status": {"Draft": 3, "In Progress": 2, "Pending": 6, "Accepted": 2, "Rejected": 1, "Deferred": 0, "Withdrawn": 1},
+        "by_degree_type": {"Associate": 0, "Bachelor": 0, "Master": 12, "PhD": 3, "Certificate": 0, "Diploma": 0, "Other": 0},
+        "open": 11,
+        "acceptance_rate": 67,
+        "upcoming_deadlines": {"next_30_days": 1, "next_60_days": 2, "next_90_days": 4},
+        "monthly": [
+            {"month": "2024-03", "created": 4, "submitted": 1, "decided": 0},
+            ...
+        ]
+    }
+    ```
+    
+    `acceptance_rate` is the percentage of decided (accepted or rejected) applications
+    that were accepted, or `null` before any decision. Upcoming deadlines count Draft,
+    In Progress and Pending applications whose start date falls within the window.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        try:
+            months = min(max(int(request.query_params.get('months', 12)), 1), 60)
+        except (ValueError, TypeError):
+            months = 12
+        
+        return Response(application_stats(request.user, months))
+
+class ApplicationBatchView(APIView):
+    """
+    Batch Create, Update and Delete Applications
+    
+    **POST /api/applications/batch/**
+    
+    Apply up to 200 operations in one request and one transaction. Every operation is
+    validated first; if any is invalid, nothing is applied.
+    
+    ## Request Format
+    ```json
+    {
+        "operations": [
+            {"op": "create", "data": {"institution": "123", "program_name": "Computer Science", "degree_type": "Master"}},
+            {"op": "update", "id": 5, "data": {"status": "Pending", "submitted_date": "2024-04-15"}},
+            {"op": "delete", "id": 7}
+        ]
+    }
+    ```
+    
+    `create` takes the same fields as **POST /api/applications/create/**, `update` the same
+    fields as **PATCH /api/applications/{id}/**. Only Draft or In Progress applications can
+    be deleted.
+    
+    ## Response
+    
+    One result per operation, in order. Returns 200 when everything was applied:
+    ```json
+    {
+        "applied": true,
+        "results": [
+            {"index": 0, "op": "create", "status": "created", "id": 42},
+            {"index": 1, "op": "update", "id": 5, "status": "updated"},
+            {"index": 2, "op": "delete", "id": 7, "status": "deleted"}
+        ]
+    }
+    ```
+    
+    Returns 400 with `"applied": false` when any operation is invalid. Invalid operations
+    have `"status": "error"` and their `errors`; the others are reported as `"valid"`.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        operations = request.data.get('operations') if isinstance(request.data, dict) else None
+        if not isinstance(operations, list) or not operations:
+            return Response(
+                {"error": "Provide a non-empty 'operations' list."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(operations) > MAX_BATCH_OPERATIONS:
+            return Response(
+                {"error": f"A batch can contain at most {MAX_BATCH_OPERATIONS} operations."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        applied, results = apply_application_batch(operations, request)
+        return Response(
+            {"applied": applied, "results": results},
+            status=status.HTTP_200_OK if applied else status.HTTP_400_BAD_REQUEST
+        )
+
+class ApplicationImportView(APIView):
+    """
+    Import Applications from a Spreadsheet
+    
+    **POST /api/applications/import/**
+    
+    Create applications from a CSV or XLSX file. The file is read row by row and
+    imported in chunks, so large spreadsheets (up to 20,000 rows) import in one request.
+    
+    ## Request Format
+    
+    `multipart/form-data` with:
+    
+    | Field | Type | Required | Description |
+    | ----- | ---- | -------- | ----------- |
+    | file | file | Yes | `.csv` (UTF-8) or `.xlsx` file |
+    | dry_run | boolean | No | Validate only, without creating anything |
+    
+    ## File Format
+    
+    The first row names the columns. `institution` and `program_name` are required;
+    the other columns are the fields of **POST /api/applications/create/** (`degree_type`,
+    `status`, `start_date`, `notes`, ...). Unknown columns are ignored.
+    
+    `institution` is an institution ID or name. Names don't have to be exact: misspelt
+    names are matched to the most similar institution, and an optional `country`
+    column narrows the match down.
+    
+    ## Response Format
+    ```json
+    {
+        "rows": 120,
+        "created": 118,
+        "failed": 2,
+        "dry_run": false,
+        "stopped": null,
+        "errors": [
+            {"row": 14, "errors": {"degree_type": ["\"Masters\" is not a valid choice."]}},
+            {"row": 57, "errors": {"institution": ["No institution matches 'Unknown College'."]}}
+        ],
+        "errors_truncated": false,
+        "fuzzy_matches": [
+            {"value": "Harvard Univ", "country": null,
+             "institution": {"id": "123", "name": "Harvard University"}, "similarity": 0.71}
+        ]
+    }
+    ```
+    
+    `row` is the line number in the file, counting the header as line 1. Rows with
+    errors are skipped; the others are created. `stopped` explains why reading ended
+    early, if it did.
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+    
+    def post(self, request):
+        if 'file' not in request.FILES:
+            return Response(
+                {"error": "No file provided."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        file = request.FILES['file']
+        dry_run = request.data.get('dry_run', '').lower() in ('true', '1')
+        try:
+            report = import_applications(file, file.name, request.user, dry_run=dry_run)
+        except ApplicationImportError as error:
+            return Response(
+                {"error": str(error)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(report)
+
+class ApplicationExportView(APIView):
+    """
+    Export Applications
+    
+    **GET /api/applications/export/?format=csv**
+    
+    Download all of your applications in one file, with their institution and the
+    number of events and documents attached to each. The file is streamed as it is
+    read from the database, so large exports start immediately.
+    
+    ## Query Parameters
+    
+    | Parameter | Type | Description |
+    | --------- | ---- | ----------- |
+    | format | string | `csv` (default), `xlsx` or `ndjson` (one JSON object per line) |
+    
+    ## Columns
+    
+    `id`, `institution_id`, `institution_name`, `institution_country`, `institution_rank`,
+    `institution_rank_number`, `program_name`, `degree_type`, `department`, `duration_years`,
+    `tuition_fee`, `status`, `start_date`, `submitted_date`, `decision_date`, `application_link`,
+    `scholarship_link`, `program_info_link`, `notes`, `event_count`, `document_count`,
+    `created_at`, `updated_at`
+    
+    `institution_rank` is the institution's rank as published (`=12`, `621-630`), and
+    `institution_rank_number` its leading number (`621` for `621-630`).
+    
+    The response is sent as an attachment named `applications-YYYY-MM-DD.<format>`.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def perform_content_negotiation(self, request, force=False):
+        # ?format= selects the export format here, not a DRF renderer
+        return super().perform_content_negotiation(request, force=True)
+    
+    def get(self, request):
+        export_format = request.query_params.get('format', 'csv').lower()
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"error": f"format must be one of: {', '.join(EXPORT_FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        content_type, extension = EXPORT_FORMATS[export_format]
+        response = StreamingHttpResponse(stream_export(request.user, export_format), content_type=content_type)
+        response['Content-Disposition'] = (
+            f'attachment; filename="applications-{timezone.localdate().isoformat()}.{extension}"'
+        )
+        return response
+
+class ApplicationTimelineView(generics.GenericAPIView):
+    """
+    Application Status Timeline
+    
+    **GET /api/applications/{id}/timeline/**
+    
+    Every status the application has been through, oldest first, with the time spent
+    in each. The last entry is the current status and counts up to now.
+    
+    ## Response Format
+    ```json
+    {
+        "application": 1,
+        "status": "Pending",
+        "timeline": [
+            {
+                "from_status": null,
+                "to_status": "Draft",
+                "changed_at": "2024-03-15T10:30:00Z",
+                "seconds_in_status": 1468800,
+                "current": false
+            },
+            {
+                "from_status": "Draft",
+                "to_status": "Pending",
+                "changed_at": "2024-04-01T10:30:00Z",
+                "seconds_in_status": 604800,
+                "current": true
+            }
+        ]
+    }
+    ```
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return Application.objects.none()
+        return Application.objects.filter(user=self.request.user)
+    
+    def get(self, request, *args, **kwargs):
+        application = self.get_object()
+        return Response({
+            "application": application.pk,
+            "status": application.status,
+            "timeline": application_timeline(application),
+        })
+
+class ApplicationStageDurationsView(APIView):
+    """
+    Average Time in Each Stage
+    
+    **GET /api/applications/stage-durations/**
+    
+    How long your applications stay in each status on average, from running totals
+    updated whenever a status changes. Only finished stays count; time in an
+    application's current status is not included until it moves on.
+    
+    ## Response Format
+    ```json
+    {
+        "results": [
+            {"status": "Draft", "stays": 12, "average_days": 9.5},
+            {"status": "Pending", "stays": 4, "average_days": 41.25}
+        ]
+    }
+    ```
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        return Response({"results": stage_durations(request.user)})
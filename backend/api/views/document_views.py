@@ -10,13 +10,14 @@ import os
 import mimetypes
 
 from api.models.document_models import Document
+from api.utils.collection_version import CollectionETagMixin
 from api.serializers.document_serializers import (
     DocumentListSerializer,
     DocumentDetailSerializer,
     DocumentUploadSerializer
 )
 
-class DocumentListView(generics.ListAPIView):
+class DocumentListView(CollectionETagMixin, generics.ListAPIView):
     """
     List User Documents
     
@@ -50,6 +51,11 @@ class DocumentListView(generics.ListAPIView):
         ...
     ]
     ```
+    
+    ## Caching
+    
+    Responses carry an `ETag`. Send it back in `If-None-Match` to get an empty
+    `304 Not Modified` response while nothing in the list has changed.
     """
     permission_classes = [IsAuthenticated]
     serializer_class = DocumentListSerializer
@@ -58,6 +64,8 @@ class DocumentListView(generics.ListAPIView):
     search_fields = ['file_name']
     ordering_fields = ['uploaded_at', 'document_type', 'file_name']
     ordering = ['-uploaded_at']
+    # application_info shows the application's programme and institution
+    etag_kinds = ('documents', 'applications')
     
     def get_queryset(self):
         # Check if this is a schema generation request
@@ -65,7 +73,7 @@ class DocumentListView(generics.ListAPIView):
             return Document.objects.none()
         
         user = self.request.user
-        queryset = Document.objects.filter(user=user)
+        queryset = Document.objects.filter(user=user).select_related('application')
         
         # Optional filter by application_id
         application_id = self.request.query_params.get('application')
@@ -269,7 +277,7 @@ class DocumentDetailView(generics.RetrieveAPIView):
     def get_queryset(self):
         if getattr(self, 'swagger_fake_view', False):
             return Document.objects.none()
-        return Document.objects.filter(user=self.request.user)
+        return Document.objects.filter(user=self.request.user).select_related('application')
 
 class DocumentDeleteView(generics.DestroyAPIView):
     """
@@ -4,10 +4,11 @@ from rest_framework.response import Response
 from rest_framework import status, permissions
 from api.models.event_models import Event
 from api.serializers.event_serializers import EventSerializer
+from api.utils.collection_version import CollectionETagMixin
 from django.shortcuts import get_object_or_404
 
 
-class EventListAPIView(ListAPIView):
+class EventListAPIView(CollectionETagMixin, ListAPIView):
     """
     List All Events
 
@@ -46,9 +47,14 @@ class EventListAPIView(ListAPIView):
         ]
     }
     ```
+
+    ### Caching:
+    Responses carry an `ETag`. Send it back in `If-None-Match` to get an empty
+    `304 Not Modified` response while nothing in the list has changed.
     """
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = EventSerializer
+    etag_kinds = ('events',)
 
     def get_queryset(self):
         return Event.objects.filter(user=self.request.user)
@@ -1,14 +1,23 @@
 from rest_framework import status, filters, generics
-from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.pagination import PageNumberPagination
-from django.db.models import IntegerField, Value, F, Func, Expression
-from django.db.models.functions import Cast, Substr, StrIndex, Replace, Length
+from django.db.models import Value, OuterRef, Subquery, Count
+from django.db.models.functions import Coalesce
 from rest_framework.response import Response
 from rest_framework.views import APIView
-import re
 
-from api.models.institution_models import Institution
-from api.serializers.institution_serializers import InstitutionListSerializer, InstitutionDetailSerializer
+from api.models.application_models import Application
+from api.models.institution_models import Institution, CountryStats, RankNumber
+from api.serializers.institution_serializers import (
+    InstitutionListSerializer, InstitutionDetailSerializer, CountryStatsSerializer,
+    InstitutionWithMyApplicationSerializer
+)
+from api.utils.dataset_version import get_dataset_version
+from api.utils.directory_cache import directory_cache, make_cache_key, normalize_params
+from api.utils.leaders import LEADER_METRICS, MAX_PER_COUNTRY, get_leaders
+from api.utils.metric_matrix import METRIC_NAMES, get_metric_matrix, pareto_frontier
+from api.utils.outcome_stats import institution_outcomes
+from api.utils.popularity import TRENDING_WINDOWS, record_view, trending_institutions
+from api.utils.search_analytics import capture_search
 
 class CustomPageNumberPagination(PageNumberPagination):
     """Custom pagination class that allows client to specify page size"""
@@ -42,6 +51,7 @@ class InstitutionListView(generics.ListAPIView):
     | research | string | Filter by research level (from classification) |
     | size | string | Filter by institution size (from classification) |
     | focus | string | Filter by institution focus (from classification) |
+    | my_applications | boolean | When `true` and signed in, add `my_application_status` (status of your most recently updated application there, or `null`) and `my_application_count` to each result |
     | page | number | Page number for pagination (default: 1) |
     | page_size | number | Number of results per page (default: 20, max: 1000) |
     
@@ -69,15 +79,78 @@ class InstitutionListView(generics.ListAPIView):
     ```
     """
     serializer_class = InstitutionListSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = {
-        'country': ['exact'],
-    }
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'country']
     ordering_fields = ['numeric_rank', 'name', 'country', 'overall_score']
     ordering = ['numeric_rank']
     pagination_class = CustomPageNumberPagination
     
+    def list(self, request, *args, **kwargs):
+        """
+        Serve the directory from the per-process result cache.
+        
+        The ordered list of matching institution ids is cached per canonical
+        query, so repeated popular queries skip filtering and sorting entirely
+        and only load the rows of the requested page.
+        """
+        if request.query_params.get('page', '1') == '1':
+            capture_search(make_cache_key(request.query_params))
+        
+        page_ids = self.paginate_queryset(self.get_result_ids())
+        institutions = self.get_page_institutions(page_ids)
+        page = [institutions[pk] for pk in page_ids if pk in institutions]
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+    
+    def get_page_institutions(self, page_ids):
+        """Load one page of institutions by id, with the caller's applications if requested"""
+        queryset = Institution.objects.all()
+        if self.include_my_applications():
+            queryset = self.annotate_my_applications(queryset)
+        return queryset.in_bulk(page_ids)
+    
+    def include_my_applications(self):
+        """Whether the signed-in caller asked for their own application status per row"""
+        return (
+            self.request.query_params.get('my_applications', '').lower() in ('1', 'true')
+            and self.request.user.is_authenticated
+        )
+    
+    def annotate_my_applications(self, queryset):
+        """
+        Add the caller's application status and count per institution.
+        
+        Both are correlated subqueries answered from the
+        applications (user_id, institution_id) index, evaluated only for the
+        rows of the requested page.
+        """
+        mine = Application.objects.filter(user=self.request.user, institution=OuterRef('pk')).order_by()
+        return queryset.annotate(
+            my_application_status=Subquery(mine.order_by('-updated_at').values('status')[:1]),
+            my_application_count=Coalesce(
+                Subquery(mine.values('institution').annotate(count=Count('pk')).values('count')),
+                0
+            ),
+        )
+    
+    def get_serializer_class(self):
+        if self.include_my_applications():
+            return InstitutionWithMyApplicationSerializer
+        return super().get_serializer_class()
+    
+    def get_result_ids(self):
+        """Ordered ids of every institution matching the request's filters"""
+        key = make_cache_key(self.request.query_params)
+        ids = directory_cache.get(key)
+        if ids is None:
+            # Read before querying, so a result that straddles a dataset swap
+            # isn't cached as the new dataset's
+            version = get_dataset_version()
+            queryset = self.filter_queryset(self.get_queryset())
+            ids = list(queryset.values_list('id', flat=True))
+            directory_cache.set(key, ids, version)
+        return ids
+    
     def get_queryset(self):
         """
         Get the queryset with proper filtering and numeric rank processing.
@@ -91,98 +164,55 @@ class InstitutionListView(generics.ListAPIView):
             numeric_rank=self.extract_numeric_rank_annotation()
         )
         
-        # Handle rank filtering numerically
-        rank_gte = self.request.query_params.get('rank_gte')
-        rank_lte = self.request.query_params.get('rank_lte')
-        rank = self.request.query_params.get('rank')
+        # Filter values are normalised exactly as they are for the cache key,
+        # so equivalent queries always share a cached result
+        params = normalize_params(self.request.query_params)
+        
+        if 'country' in params:
+            queryset = queryset.filter(country=params['country'])
         
-        if rank_gte:
-            try:
-                rank_gte_int = int(rank_gte)
-                queryset = queryset.filter(numeric_rank__gte=rank_gte_int)
-            except (ValueError, TypeError):
-                pass
+        # Handle rank filtering numerically
+        if 'rank_gte' in params:
+            queryset = queryset.filter(numeric_rank__gte=params['rank_gte'])
                 
-        if rank_lte:
-            try:
-                rank_lte_int = int(rank_lte)
-                queryset = queryset.filter(numeric_rank__lte=rank_lte_int)
-            except (ValueError, TypeError):
-                pass
+        if 'rank_lte' in params:
+            queryset = queryset.filter(numeric_rank__lte=params['rank_lte'])
                 
-        if rank:
-            try:
-                rank_int = int(rank)
-                queryset = queryset.filter(numeric_rank=rank_int)
-            except (ValueError, TypeError):
-                pass
+        if 'rank' in params:
+            queryset = queryset.filter(numeric_rank=params['rank'])
         
         # Advanced filtering for related models
-        research = self.request.query_params.get('research')
-        size = self.request.query_params.get('size')
-        focus = self.request.query_params.get('focus')
-        
-        if research:
-            queryset = queryset.filter(classification__research=research)
+        if 'research' in params:
+            queryset = queryset.filter(classification__research=params['research'])
         
-        if size:
-            queryset = queryset.filter(classification__size=size)
+        if 'size' in params:
+            queryset = queryset.filter(classification__size=params['size'])
         
-        if focus:
-            queryset = queryset.filter(classification__focus=focus)
+        if 'focus' in params:
+            queryset = queryset.filter(classification__focus=params['focus'])
             
         return queryset
     
     def extract_numeric_rank_annotation(self):
         """
-        Creates a database annotation that safely extracts a numeric rank from various formats.
+        Numeric rank for filtering and sorting, parsed by the same database
+        function as the country rollups and the dataset integrity check.
         Handles:
         - Pure integers: "1", "2", "3"
         - Ranges: "621-630", "801-1000"
         - Plus formats: "601+"
-        - Other special cases
         
-        We use a simpler approach by handling each case separately and then try to cast safely.
+        Anything else sorts at the end as 999999, and is what
+        check_institution_data reports as an unparseable rank.
         """
-        from django.db.models import Case, When, Value
-        
-        # We need a more robust implementation that can handle various rank formats
-        return Case(
-            # Regular integer ranks ("1", "2", "3")
-            When(
-                rank__regex=r'^[0-9]+$',
-                then=Cast('rank', output_field=IntegerField())
-            ),
-            
-            # For ranks with a dash ("621-630") - extract initial number
-            When(
-                rank__contains='-',
-                then=Cast(
-                    Func(F('rank'), Value('-'), Value(1), function='split_part'),
-                    output_field=IntegerField()
-                )
-            ),
-            
-            # For ranks ending with + ("601+")
-            When(
-                rank__endswith='+',
-                then=Cast(
-                    Replace('rank', Value('+'), Value('')),
-                    output_field=IntegerField()
-                )
-            ),
-            
-            # Default case - if all else fails, return a very high number to sort at the end
-            default=Value(999999),
-            output_field=IntegerField()
-        )
+        return Coalesce(RankNumber('rank'), Value(999999))
     
     def filter_queryset(self, queryset):
         """Override to ensure proper handling of numeric rank ordering"""
         queryset = super().filter_queryset(queryset)
         
-        # Get the ordering parameter
-        ordering = self.request.query_params.get('ordering')
+        # Get the ordering parameter, trimmed as it is for the cache key
+        ordering = (self.request.query_params.get('ordering') or '').strip()
         
         # Map rank to numeric_rank for proper sorting
         if ordering == 'rank':
@@ -192,6 +222,72 @@ class InstitutionListView(generics.ListAPIView):
         
         return queryset
 
+class InstitutionParetoView(InstitutionListView):
+    """
+    Pareto Frontier of Institutions
+    
+    **GET /api/institutions/pareto/?metrics=academic_reputation,employment_outcomes,sustainability**
+    
+    Return the institutions that no other institution beats on every selected metric.
+    Accepts the same filters as the institution list (`search`, `country`, `rank_lte`,
+    `rank_gte`, `research`, `size`, `focus`), so the frontier can be computed within
+    a country or rank band. Institutions missing a score for any selected metric are
+    left out.
+    
+    ## Query Parameters
+    
+    | Parameter | Type | Description |
+    | --------- | ---- | ----------- |
+    | metrics | string | Comma-separated metrics (at least two) from: `overall_score`, `academic_reputation`, `employer_reputation`, `faculty_student`, `citations_per_faculty`, `international_faculty`, `international_students`, `international_research_network`, `employment_outcomes`, `sustainability` |
+    | page | number | Page number for pagination (default: 1) |
+    | page_size | number | Number of results per page (default: 20, max: 1000) |
+    
+    ## Response
+    
+    Paginated like the institution list, best combined score first. Each result also
+    includes the selected metric scores:
+    
+    ```json
+    {
+        "id": "123",
+        "rank": "1",
+        "name": "Harvard University",
+        "country": "United States",
+        "overall_score": "95.8",
+        "metrics": {
+            "academic_reputation": 100.0,
+            "employment_outcomes": 100.0,
+            "sustainability": 84.4
+        }
+    }
+    ```
+    """
+    
+    def list(self, request, *args, **kwargs):
+        metrics = [m.strip() for m in request.query_params.get('metrics', '').split(',') if m.strip()]
+        metrics = list(dict.fromkeys(metrics))
+        invalid = [metric for metric in metrics if metric not in METRIC_NAMES]
+        if invalid or len(metrics) < 2:
+            return Response(
+                {"error": f"Provide at least two metrics from: {', '.join(METRIC_NAMES)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        ids, values = get_metric_matrix().select(self.get_result_ids(), metrics)
+        frontier = pareto_frontier(values) if ids else []
+        scores = {ids[row]: dict(zip(metrics, values[row].tolist())) for row in frontier}
+        
+        page_ids = self.paginate_queryset(list(scores))
+        institutions = self.get_page_institutions(page_ids)
+        results = []
+        for pk in page_ids:
+            if pk not in institutions:
+                continue
+            data = self.get_serializer(institutions[pk]).data
+            data['metrics'] = scores[pk]
+            results.append(data)
+        return self.get_paginated_response(results)
+
 class InstitutionDetailView(generics.RetrieveAPIView):
     """
     Retrieve a specific institution by ID
@@ -233,6 +329,11 @@ class InstitutionDetailView(generics.RetrieveAPIView):
     queryset = Institution.objects.all()
     serializer_class = InstitutionDetailSerializer
     lookup_field = 'id'
+    
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        record_view(kwargs[self.lookup_field])
+        return response
 
 class InstitutionCountriesView(APIView):
     """
@@ -268,3 +369,249 @@ class InstitutionCountriesView(APIView):
         countries = [country for country in countries if country]
         
         return Response({"countries": countries})
+
+class CountryStatsView(generics.RetrieveAPIView):
+    """
+    Country Statistics
+    
+    **GET /api/institutions/countries/{country}/stats/**
+    
+    Retrieve summary statistics for the institutions of one country: how many there are,
+    how their ranks are distributed, average overall and metric scores, and research,
+    size and focus breakdowns. Statistics are precomputed after every dataset import.
+    
+    ## Response Format
+    ```json
+    {
+        "country": "United Kingdom",
+        "institution_count": 90,
+        "best_rank": 2,
+        "rank_distribution": {
+            "1-100": 17,
+            "101-200": 11,
+            "201-500": 24,
+            "501-1000": 21,
+            "1001+": 10,
+            "unranked": 7
+        },
+        "average_scores": {
+            "overall_score": 48.31,
+            "academic_reputation": 39.5,
+            ...
+        },
+        "research": {"Very High": 62, "High": 20, "Unknown": 8},
+        "size": {"Large": 40, "Medium": 30, "Small": 20},
+        "focus": {"Full comprehensive": 45, "Comprehensive": 25, "Focused": 20}
+    }
+    ```
+    
+    Returns 404 if no institutions are listed for the country.
+    """
+    queryset = CountryStats.objects.all()
+    serializer_class = CountryStatsSerializer
+    lookup_field = 'country'
+
+class InstitutionTrendingView(APIView):
+    """
+    List Trending Institutions
+    
+    **GET /api/institutions/trending/**
+    
+    Retrieve the institutions that were viewed and added to applications most often
+    over a sliding time window.
+    
+    ## Query Parameters
+    
+    | Parameter | Type | Description |
+    | --------- | ---- | ----------- |
+    | window | string | One of `day`, `week` or `month` (default: `week`) |
+    | limit | number | Number of institutions to return (default: 20, max: 100) |
+    
+    ## Response Format
+    ```json
+    {
+        "window": "week",
+        "results": [
+            {
+                "id": "123",
+                "rank": "1",
+                "name": "Harvard University",
+                "country": "United States",
+                "overall_score": "95.8",
+                "views": 1520,
+                "applications": 48,
+                "score": 1760
+            },
+            ...
+        ]
+    }
+    ```
+    """
+    
+    def get(self, request):
+        window = request.query_params.get('window', 'week')
+        if window not in TRENDING_WINDOWS:
+            return Response(
+                {"error": f"Invalid window '{window}'. Choose one of: {', '.join(TRENDING_WINDOWS)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        except (ValueError, TypeError):
+            limit = 20
+        
+        trending = trending_institutions(window, limit)
+        institutions = Institution.objects.in_bulk([row[0] for row in trending])
+        
+        results = []
+        for institution_id, views, applications, score in trending:
+            institution = institutions.get(institution_id)
+            if institution is None:
+                continue
+            data = InstitutionListSerializer(institution).data
+            data.update(views=views, applications=applications, score=score)
+            results.append(data)
+        
+        return Response({"window": window, "results": results})
+
+class InstitutionLeadersView(APIView):
+    """
+    List Leading Institutions per Country
+    
+    **GET /api/institutions/leaders/?per_country=3&metric=rank**
+    
+    Retrieve the top institutions of every country, ordered by parsed rank or by
+    any metric score. Results are cached until the next dataset import.
+    
+    ## Query Parameters
+    
+    | Parameter | Type | Description |
+    | --------- | ---- | ----------- |
+    | per_country | number | Institutions to return per country (default: 3, max: 50) |
+    | metric | string | `rank` (default, lowest first) or one of `overall_score`, `academic_reputation`, `employer_reputation`, `faculty_student`, `citations_per_faculty`, `international_faculty`, `international_students`, `international_research_network`, `employment_outcomes`, `sustainability` (highest first) |
+    
+    ## Response Format
+    ```json
+    {
+        "metric": "rank",
+        "per_country": 3,
+        "results": [
+            {
+                "country": "Argentina",
+                "institutions": [
+                    {
+                        "id": "456",
+                        "rank": "84",
+                        "name": "Universidad de Buenos Aires",
+                        "country": "Argentina",
+                        "overall_score": "51.2",
+                        "position": 1,
+                        "value": 84
+                    },
+                    ...
+                ]
+            },
+            ...
+        ]
+    }
+    ```
+    """
+    
+    def get(self, request):
+        metric = request.query_params.get('metric', 'rank')
+        if metric not in LEADER_METRICS:
+            return Response(
+                {"error": f"Invalid metric '{metric}'. Choose one of: {', '.join(LEADER_METRICS)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            per_country = min(max(int(request.query_params.get('per_country', 3)), 1), MAX_PER_COUNTRY)
+        except (ValueError, TypeError):
+            per_country = 3
+        
+        leaders = get_leaders(metric, per_country)
+        institutions = Institution.objects.in_bulk(
+            [institution_id for rows in leaders.values() for institution_id, _ in rows]
+        )
+        
+        results = []
+        for country, rows in leaders.items():
+            entries = []
+            for position, (institution_id, value) in enumerate(rows, start=1):
+                institution = institutions.get(institution_id)
+                if institution is None:
+                    continue
+                data = InstitutionListSerializer(institution).data
+                data.update(position=position, value=value)
+                entries.append(data)
+            results.append({"country": country, "institutions": entries})
+        
+        return Response({"metric": metric, "per_country": per_country, "results": results})
+
+class InstitutionOutcomesView(APIView):
+    """
+    Application Outcomes for an Institution
+    
+    **GET /api/institutions/{id}/outcomes/**
+    
+    Anonymised statistics from every user's applications to the institution: volume,
+    acceptance rate, median tuition fee and time to decision, overall and per programme
+    and degree type. Figures come from running totals updated as applications change.
+    
+    Groups with fewer than 5 applications are not listed, and a figure based on fewer
+    than 5 applications (e.g. an acceptance rate with 3 decisions) is `null`. An overall
+    figure is also `null` when subtracting the listed figures from it would reveal one
+    based on 1 to 4 applications; `overall` itself is `null` when the unlisted groups
+    hold 1 to 4 applications.
+    
+    ## Response Format
+    ```json
+    {
+        "institution_id": "123",
+        "min_group_size": 5,
+        "overall": {
+            "applications": 148,
+            "decided": 61,
+            "acceptance_rate": 34,
+            "median_tuition": 52000.0,
+            "decision_time": {
+                "decisions": 58,
+                "median_days": 71.5,
+                "distribution": [
+                    {"label": "0-2 weeks", "share": 0.05},
+                    {"label": "2-4 weeks", "share": 0.1},
+                    {"label": "1-2 months", "share": 0.26},
+                    {"label": "2-3 months", "share": 0.34},
+                    {"label": "3-6 months", "share": 0.21},
+                    {"label": "6+ months", "share": 0.03}
+                ]
+            }
+        },
+        "programs": [
+            {
+                "program": "Computer Science",
+                "degree_type": "Master",
+                "applications": 40,
+                "decided": 4,
+                "acceptance_rate": null,
+                "median_tuition": 55000.0,
+                "decision_time": null
+            },
+            ...
+        ]
+    }
+    ```
+    
+    `overall` is `null` when the institution has fewer than 5 applications. Returns 404
+    for unknown institutions.
+    """
+    
+    def get(self, request, id):
+        if not Institution.objects.filter(pk=id).exists():
+            return Response(
+                {"error": "Institution not found."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(institution_outcomes(id))
@@ -0,0 +1,52 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.serializers.program_serializers import ProgramSerializer
+from api.utils.program_catalogue import suggest_programs
+
+class ProgramAutocompleteView(APIView):
+    """
+    Programme Suggestions
+    
+    **GET /api/institutions/{id}/programs/**
+    
+    Suggest programme names for an institution as the user types, based on the programmes
+    other applicants have tracked. Matching is case-insensitive and tolerates typos.
+    Without `q`, the most common programmes are returned.
+    
+    ## Query Parameters
+    
+    | Parameter | Type | Description |
+    | --------- | ---- | ----------- |
+    | q | string | Partial programme name |
+    | limit | number | Maximum number of suggestions (default: 10, max: 50) |
+    
+    ## Response Format
+    ```json
+    [
+        {
+            "id": 12,
+            "name": "Computer Science",
+            "department": "School of Engineering",
+            "usage_count": 48
+        },
+        {
+            "id": 40,
+            "name": "Computational Biology",
+            "department": null,
+            "usage_count": 6
+        }
+    ]
+    ```
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, id):
+        try:
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+        except (ValueError, TypeError):
+            limit = 10
+        
+        programs = suggest_programs(id, request.query_params.get('q', ''), limit)
+        return Response(ProgramSerializer(programs, many=True).data)
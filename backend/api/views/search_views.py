@@ -0,0 +1,75 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.utils.full_text_search import SEARCH_PAGE_SIZE, search_user_records
+
+class SearchView(APIView):
+    """
+    Search Applications and Events
+    
+    **GET /api/search/?q=scholarship interview**
+    
+    Full-text search across your applications (programme, department, notes and
+    institution name) and events (title and notes), best matches first. Words are
+    matched by their stem, so `interviews` also finds `interview`.
+    
+    ## Query Parameters
+    
+    | Parameter | Type | Description |
+    | --------- | ---- | ----------- |
+    | q | string | Search terms. Supports `"exact phrases"`, `-excluded` words and `or` |
+    | limit | number | Maximum number of results (default: 20, max: 100) |
+    
+    ## Response Format
+    ```json
+    {
+        "query": "scholarship interview",
+        "results": [
+            {
+                "type": "application",
+                "rank": 0.6079,
+                "application": {
+                    "id": 5,
+                    "program_name": "Computer Science",
+                    "degree_type": "Master",
+                    "status": "Pending",
+                    "institution_id": "123",
+                    "institution_name": "Harvard University"
+                },
+                "highlights": {
+                    "program_name": "Computer Science",
+                    "institution_name": "Harvard University",
+                    "notes": "… ask about the <mark>scholarship</mark> at the <mark>interview</mark> …"
+                }
+            },
+            {
+                "type": "event",
+                "rank": 0.0991,
+                "event": {"id": 7, "title": "Scholarship interview", "event_date": "2025-03-02", "application": 5},
+                "highlights": {"title": "<mark>Scholarship</mark> <mark>interview</mark>", "notes": null}
+            }
+        ]
+    }
+    ```
+    
+    Highlights are HTML: your own text, escaped, with matches wrapped in `<mark>` tags,
+    so they can be rendered as HTML as they are.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            return Response(
+                {"error": "Provide search terms with the q parameter."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            limit = min(max(int(request.query_params.get('limit', SEARCH_PAGE_SIZE)), 1), 100)
+        except (ValueError, TypeError):
+            limit = SEARCH_PAGE_SIZE
+        
+        return Response({"query": text, "results": search_user_records(request.user, text, limit)})
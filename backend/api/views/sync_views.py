@@ -0,0 +1,58 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.utils.sync import changes_since
+
+class SyncView(APIView):
+    """
+    Delta Sync Feed
+    
+    **GET /api/sync/?since=<token>**
+    
+    Return your applications, events and documents created or changed since the
+    token from your previous sync, and the ids of the ones deleted since then. Omit
+    `since` (or pass `0`) for a full initial sync, then keep the returned `token`
+    for the next call.
+    
+    ## Query Parameters
+    
+    | Parameter | Type | Description |
+    | --------- | ---- | ----------- |
+    | since | string | Token returned by the previous sync (default: `0`) |
+    
+    ## Response Format
+    ```json
+    {
+        "token": "88231",
+        "has_more": false,
+        "applications": [ ... same fields as the application list ... ],
+        "events": [ ... same fields as the event list ... ],
+        "documents": [ ... same fields as the document list ... ],
+        "deleted": {
+            "applications": [12],
+            "events": [],
+            "documents": [40, 41]
+        }
+    }
+    ```
+    
+    A response carries about 500 changes at most; when `has_more` is `true`, call
+    again straight away with the new token. Rows are always sent in their latest
+    state, so applying responses in order keeps a client copy up to date.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        try:
+            since = int(request.query_params.get('since', 0))
+        except (ValueError, TypeError):
+            since = -1
+        if since < 0:
+            return Response(
+                {"error": "Invalid sync token."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(changes_since(request.user, since))
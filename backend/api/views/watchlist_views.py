@@ -0,0 +1,146 @@
+from rest_framework import status, generics
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.models.watchlist_models import InstitutionWatch, InstitutionChange
+from api.serializers.watchlist_serializers import InstitutionWatchSerializer, InstitutionChangeSerializer
+
+class WatchlistListView(generics.ListAPIView):
+    """
+    List Watched Institutions
+    
+    **GET /api/institutions/watchlist/**
+    
+    Retrieve the institutions you follow for rank and metric changes.
+    
+    ## Response Format
+    ```json
+    {
+        "count": 2,
+        "next": null,
+        "previous": null,
+        "results": [
+            {
+                "id": 4,
+                "institution": "123",
+                "institution_details": {
+                    "id": "123",
+                    "rank": "5",
+                    "name": "Harvard University",
+                    "country": "United States",
+                    "overall_score": "95.2"
+                },
+                "created_at": "2025-04-20T09:00:00Z"
+            },
+            ...
+        ]
+    }
+    ```
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = InstitutionWatchSerializer
+    
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return InstitutionWatch.objects.none()
+        return InstitutionWatch.objects.filter(user=self.request.user).select_related('institution')
+
+class WatchlistAddView(generics.CreateAPIView):
+    """
+    Watch an Institution
+    
+    **POST /api/institutions/watchlist/add/**
+    
+    Start following an institution. After each ranking import you will get a change
+    record whenever its rank, score or any metric changes.
+    
+    ## Request Format
+    ```json
+    {
+        "institution": "123"
+    }
+    ```
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = InstitutionWatchSerializer
+
+class WatchlistRemoveView(generics.DestroyAPIView):
+    """
+    Stop Watching an Institution
+    
+    **DELETE /api/institutions/watchlist/{id}/delete/**
+    
+    Remove an institution from your watchlist. Returns 204 No Content on success.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return InstitutionWatch.objects.none()
+        return InstitutionWatch.objects.filter(user=self.request.user)
+
+class WatchlistChangesView(generics.ListAPIView):
+    """
+    List Changes to Watched Institutions
+    
+    **GET /api/institutions/watchlist/changes/**
+    
+    Retrieve the changes detected on your watched institutions, newest first.
+    Use `?unseen=true` to only return changes you haven't marked as seen.
+    
+    ## Response Format
+    ```json
+    {
+        "count": 1,
+        "next": null,
+        "previous": null,
+        "results": [
+            {
+                "id": 10,
+                "institution": "123",
+                "institution_name": "Harvard University",
+                "dataset_version": 7,
+                "previous_rank": "5",
+                "current_rank": "4",
+                "previous_score": "95.2",
+                "current_score": "96.0",
+                "changed_fields": ["academic_reputation", "overall_score", "rank"],
+                "detected_at": "2025-06-01T02:00:00Z",
+                "seen": false
+            }
+        ]
+    }
+    ```
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = InstitutionChangeSerializer
+    
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return InstitutionChange.objects.none()
+        queryset = InstitutionChange.objects.filter(user=self.request.user).select_related('institution')
+        if self.request.query_params.get('unseen') == 'true':
+            queryset = queryset.filter(seen=False)
+        return queryset
+
+class WatchlistChangesMarkSeenView(APIView):
+    """
+    Mark Watchlist Changes as Seen
+    
+    **POST /api/institutions/watchlist/changes/mark-seen/**
+    
+    Mark all of your unseen watchlist changes as seen.
+    
+    ## Response Format
+    ```json
+    {
+        "updated": 3
+    }
+    ```
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        updated = InstitutionChange.objects.filter(user=request.user, seen=False).update(seen=True)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
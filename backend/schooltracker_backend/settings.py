@@ -36,6 +36,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'drf_yasg',
@@ -257,4 +258,31 @@ SIMPLE_JWT = {
     'TOKEN_TYPE_CLAIM': 'token_type',
 
     'JTI_CLAIM': 'jti',
-}
\ No newline at end of file
+}
+# Institution directory caching
+DIRECTORY_CACHE_SIZE = 256  # Distinct directory queries kept per worker
+DATASET_VERSION_CHECK_INTERVAL = 5  # Seconds between dataset version checks
+
+# Institution popularity counters
+POPULARITY_FLUSH_INTERVAL = 30  # Seconds between counter flushes per worker
+POPULARITY_MAX_PENDING = 500  # Flush early once this many counters are buffered
+POPULARITY_SHARDS = 8  # Counter rows per institution and hour
+
+# Directory search analytics
+SEARCH_ANALYTICS_BUFFER_SIZE = 10000  # Searches buffered per worker before the oldest are dropped
+SEARCH_ANALYTICS_FLUSH_INTERVAL = 10  # Seconds between batched analytics inserts
+DIRECTORY_PREWARM_QUERIES = 25  # Popular queries each worker replays when it sees a new dataset version (0 disables)
+
+# Link health checks
+LINK_DEAD_AFTER_FAILURES = 2  # Consecutive failed checks before a link is reported as dead
+
+# Blue/green institution dataset swaps
+DATASET_SWAP_LOCK_TIMEOUT = '2s'  # Longest the swap queues readers behind its lock request
+DATASET_SWAP_LOCK_RETRIES = 10  # Attempts before the swap gives up
+
+# Spreadsheet imports of applications
+APPLICATION_IMPORT_MAX_ROWS = 20000  # Rows read from one file
+APPLICATION_IMPORT_MATCH_THRESHOLD = 0.5  # Lowest name similarity accepted for a misspelt institution
+
+# Cross-user application outcome statistics
+OUTCOME_MIN_GROUP_SIZE = 5  # Fewest applications behind any published figure (k-anonymity)